@@ -0,0 +1,104 @@
+"""Benchmark of the HDF5 compression options of `DataFrameFileCache`.
+
+Writes a typical data frame of (smooth) sensor data with different compression
+settings and reports the file size and read throughput of each setting.
+
+Usage:
+    python benchmarks/cache_compression.py [--rows 1000000] [--columns 16]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pint_pandas
+
+from rdmlibpy.dataframes import DataFrameFileCache
+
+SETTINGS = {
+    'uncompressed': dict(),
+    'zlib:1': dict(complib='zlib', complevel=1),
+    'zlib:5': dict(complib='zlib', complevel=5),
+    'blosc:lz4:5': dict(complib='blosc:lz4', complevel=5),
+    'blosc:zstd:5': dict(complib='blosc:zstd', complevel=5),
+    'blosc:zstd:9': dict(complib='blosc:zstd', complevel=9),
+}
+
+
+def sensor_data(rows: int, columns: int, seed: int = 0) -> pd.DataFrame:
+    # slowly varying signals (random walks) with measurement noise, sampled at
+    # 1 Hz, and a few columns with units
+    rng = np.random.default_rng(seed)
+    data = {
+        f'sensor-{i}': np.round(
+            20.0 + np.cumsum(rng.normal(0, 0.01, rows)) + rng.normal(0, 0.001, rows),
+            4,
+        )
+        for i in range(columns)
+    }
+    df = pd.DataFrame(
+        data, index=pd.date_range('2024-01-16', periods=rows, freq='s', name='time')
+    )
+    for col in list(df.columns)[:4]:
+        df[col] = pint_pandas.PintArray(df[col].to_numpy(), dtype='pint[degC]')
+    return df
+
+
+def measure(cache: DataFrameFileCache, df: pd.DataFrame, path: Path, repeat: int):
+    start = time.perf_counter()
+    cache.write(df, path)
+    write_time = time.perf_counter() - start
+
+    read_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        cache.read(path)
+        read_times.append(time.perf_counter() - start)
+    return path.stat().st_size, write_time, min(read_times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--columns', type=int, default=16)
+    parser.add_argument('--layout', choices=['fixed', 'table'], default='fixed')
+    parser.add_argument('--expectedrows', type=int, default=None)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    df = sensor_data(args.rows, args.columns)
+    nbytes = df.memory_usage(deep=True).sum()
+    print(
+        f'{args.rows} rows x {args.columns} columns '
+        + f'({nbytes / 2**20:.1f} MiB in memory), layout: {args.layout}\n'
+    )
+    print(
+        f'{"setting":<28}{"size [MiB]":>12}{"ratio":>8}'
+        + f'{"write [s]":>12}{"read [s]":>11}{"read [MiB/s]":>14}'
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, settings in SETTINGS.items():
+            cache = DataFrameFileCache(
+                layout=args.layout, expectedrows=args.expectedrows, **settings
+            )
+            try:
+                size, write_time, read_time = measure(
+                    cache, df, Path(tmp) / 'cache.h5', args.repeat
+                )
+            except ValueError as e:
+                # compression library not available
+                print(f'{label:<28}{str(e)}')
+                continue
+            print(
+                f'{label:<28}{size / 2**20:>12.1f}{nbytes / size:>8.2f}'
+                + f'{write_time:>12.2f}{read_time:>11.2f}'
+                + f'{nbytes / 2**20 / read_time:>14.0f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,9 @@ __version__ = '0.1.12'
 import pint_pandas
 
 from . import dataframes, loaders, metadata, serializers
+from .cache_directory import configure_cache_directory
+from .cache_stats import get_cache_stats
+from .memory_cache import configure_memory_cache
 from .process import DelegatedSource
 from .registry import register
 from .workflow import Workflow, run
@@ -16,6 +19,9 @@ __all__ = [
     loaders,
     metadata,
     serializers,
+    configure_cache_directory,
+    configure_memory_cache,
+    get_cache_stats,
     DelegatedSource,
     register,
     Workflow,
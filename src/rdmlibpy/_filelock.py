@@ -0,0 +1,105 @@
+import logging
+import os
+import time
+from pathlib import Path
+from typing import IO, Optional
+
+from ._typing import FilePath
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+
+    def _try_lock(file: IO) -> bool:
+        try:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
+    def _unlock(file: IO):
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+except ImportError:  # pragma: no cover (windows)
+    import msvcrt
+
+    def _try_lock(file: IO) -> bool:
+        try:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def _unlock(file: IO):
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def lock_path(filename: FilePath) -> Path:
+    """Returns the (hidden) lock file next to the given file."""
+    path = Path(filename)
+    return path.with_name(f'.{path.name}.lock')
+
+
+class FileLock:
+    """An exclusive, inter-process lock using a lock file (`flock` on POSIX,
+    `msvcrt.locking` on Windows). The lock is also exclusive between threads
+    of the same process, since each acquisition opens the lock file anew. The
+    lock file is not removed on release (which would be prone to races).
+    """
+
+    def __init__(
+        self, path: FilePath, timeout: Optional[float] = None, poll: float = 0.1
+    ):
+        self.path = Path(path)
+        self.timeout = timeout
+        self.poll = poll
+        self._file: Optional[IO] = None
+
+    @property
+    def locked(self) -> bool:
+        return self._file is not None
+
+    def acquire(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file = open(self.path, 'a+')
+        start = time.monotonic()
+        waiting = False
+        while not _try_lock(file):
+            if not waiting:
+                logger.info(f'Waiting for lock: {self.path}')
+                waiting = True
+            if (self.timeout is not None) and (time.monotonic() - start > self.timeout):
+                file.close()
+                raise TimeoutError(f'Could not acquire lock: {self.path}')
+            time.sleep(self.poll)
+        self._file = file
+        return self
+
+    def release(self):
+        if self._file is None:
+            return
+        try:
+            _unlock(self._file)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *args):
+        self.release()
+
+    def __del__(self):
+        self.release()
+
+
+def atomic_path(filename: FilePath) -> Path:
+    """Returns a unique temporary path next to the given file (keeping the
+    suffix, which may determine the file format)."""
+    path = Path(filename)
+    token = f'{os.getpid()}-{time.monotonic_ns()}'
+    return path.with_name(f'.{path.stem}.{token}.tmp{path.suffix}')
@@ -0,0 +1,26 @@
+import importlib
+from types import ModuleType
+
+
+def import_optional(name: str, feature: str) -> ModuleType:
+    """Imports an optional dependency on first use.
+
+    Args:
+        name (str): The name of the module to import (e.g. `pyarrow.csv`).
+        feature (str): A short description of the feature that requires the
+            module; used in the error message.
+
+    Raises:
+        ImportError: If the module is not installed.
+
+    Returns:
+        ModuleType: The imported module.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        package = name.split('.')[0]
+        raise ImportError(
+            f'{feature} requires the optional dependency `{package}`. '
+            + f'Install it with `pip install {package}`.'
+        ) from e
@@ -52,6 +52,8 @@ class ProcessNode:
         self.parent = parent
         self.runner = runner
         self.params = params
+        # read hints passed down from the following processes
+        self.hints: Dict[str, Any] = {}
 
     def run(self):
         return self.runner._run(self)
@@ -91,3 +93,13 @@ class RunnableProcessParam:
 
     def get_value(self):
         return self.node.run()
+
+
+class RunnableProcessMappingParam(ProcessParam):
+    # a mapping of named processes (e.g. multiple data sources), which are
+    # evaluated in order of their definition
+    def __init__(self, nodes: Dict[str, ProcessNode]):
+        self.nodes = nodes
+
+    def get_value(self):
+        return {name: node.run() for name, node in self.nodes.items()}
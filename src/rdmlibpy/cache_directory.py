@@ -0,0 +1,253 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional
+
+from ._filelock import FileLock, lock_path
+from ._typing import FilePath
+from .memory_cache import get_memory_cache
+
+logger = logging.getLogger(__name__)
+
+EvictionPolicy = Literal['lru', 'value']
+
+INDEX_FILENAME = '.rdmlibpy-cache.json'
+
+# access times are only updated if older than the given resolution (seconds),
+# which avoids rewriting the index on every cache hit
+ACCESS_RESOLUTION = 60.0
+
+
+def disk_usage(path: Path) -> int:
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob('*') if p.is_file())
+    return path.stat().st_size
+
+
+def _remove(path: Path):
+    if path.is_dir():
+        shutil.rmtree(path)
+    else:
+        path.unlink(missing_ok=True)
+
+
+class CacheDirectory:
+    """A managed cache root with a quota (in bytes). Cache files (or
+    directories) written below the root are registered in an index holding
+    their size, last access time and the time required to build them. If the
+    quota is exceeded, entries are evicted by one of the following policies:
+
+    - `lru`: least recently used entries first.
+    - `value`: entries with the lowest value first, where the value is the
+      rebuild time per byte (entries without recorded rebuild time have no
+      value); ties are broken by the access time.
+    """
+
+    def __init__(self, root: FilePath, max_bytes: int, policy: EvictionPolicy = 'lru'):
+        self.root = Path(root).resolve()
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self._lock = threading.RLock()
+        # access times recorded by this process (by key), such that cache hits
+        # within the access resolution don't read the index
+        self._accessed: Dict[str, float] = {}
+
+    @property
+    def index_file(self) -> Path:
+        return self.root / INDEX_FILENAME
+
+    def contains(self, path: FilePath) -> bool:
+        return Path(path).resolve().is_relative_to(self.root)
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the index entries (keyed by path relative to the root)."""
+        with self._lock:
+            return self._load_index()['entries']
+
+    def usage(self) -> int:
+        """Returns the total size (in bytes) of all registered entries."""
+        return sum(entry['size'] for entry in self.entries().values())
+
+    def record_access(self, path: FilePath):
+        """Updates the access time of an entry (e.g. on a cache hit). Access
+        times are only updated if older than `ACCESS_RESOLUTION`."""
+        key = self._key(path)
+        now = time.time()
+        with self._lock:
+            accessed = self._accessed.get(key)
+        if (accessed is not None) and (now - accessed < ACCESS_RESOLUTION):
+            return
+
+        def update(entries):
+            entry = entries.get(key)
+            if entry is None:
+                entries[key] = self._entry(path, now)
+            elif now - entry['atime'] < ACCESS_RESOLUTION:
+                # recorded by another process
+                self._accessed[key] = entry['atime']
+                return False
+            else:
+                entry['atime'] = now
+            self._accessed[key] = now
+            return True
+
+        self._update(update)
+
+    def record_build(self, path: FilePath, duration: Optional[float]):
+        """Registers a (re)built entry with its build duration (in seconds) and
+        evicts entries if the quota is exceeded."""
+        key = self._key(path)
+
+        def update(entries):
+            entries[key] = self._entry(path, time.time(), duration)
+            self._accessed[key] = entries[key]['atime']
+            return True
+
+        self._update(update)
+        self.evict(protect=[path])
+
+    def evict(self, protect: Iterable[FilePath] = ()) -> List[Path]:
+        """Removes entries until the total size is within the quota.
+
+        Args:
+            protect (Iterable[FilePath], optional): Entries which must not be
+                evicted (e.g. the entry that has just been built).
+
+        Returns:
+            List[Path]: The evicted files.
+        """
+        protected = {self._key(path) for path in protect}
+        evicted = []
+
+        def update(entries):
+            # drop entries, which were removed by other means
+            for key in [key for key in entries if not (self.root / key).exists()]:
+                del entries[key]
+
+            total = sum(entry['size'] for entry in entries.values())
+            if total <= self.max_bytes:
+                return True
+            candidates = sorted(
+                (key for key in entries if key not in protected),
+                key=lambda key: self._priority(entries[key]),
+            )
+            for key in candidates:
+                if total <= self.max_bytes:
+                    break
+                path = self.root / key
+                if not self._remove_entry(key, path):
+                    continue
+                total -= entries.pop(key)['size']
+                self._accessed.pop(key, None)
+                evicted.append(path)
+            return True
+
+        self._update(update)
+        return evicted
+
+    def _remove_entry(self, key: str, path: Path) -> bool:
+        # the build lock of the entry (see `Cache.build_lock`) is held while
+        # removing it; entries being (re)built are skipped instead of waiting,
+        # since the builder may wait for the index lock held by the caller
+        lock = FileLock(lock_path(path), timeout=0)
+        try:
+            lock.acquire()
+        except TimeoutError:
+            logger.info(f'Not evicting cache entry in use: {key} ({self.root})')
+            return False
+        try:
+            logger.info(f'Evicting cache entry: {key} ({self.root})')
+            _remove(path)
+            get_memory_cache().invalidate(path)
+        finally:
+            lock.release()
+        return True
+
+    def _priority(self, entry: Dict[str, Any]):
+        # entries with the lowest priority are evicted first
+        if self.policy == 'value':
+            value = (entry.get('build_time') or 0.0) / max(entry['size'], 1)
+            return (value, entry['atime'])
+        return (entry['atime'],)
+
+    def _key(self, path: FilePath) -> str:
+        return Path(path).resolve().relative_to(self.root).as_posix()
+
+    def _entry(
+        self, path: FilePath, now: float, duration: Optional[float] = None
+    ) -> Dict[str, Any]:
+        return dict(size=disk_usage(Path(path)), atime=now, build_time=duration)
+
+    def _load_index(self) -> Dict[str, Any]:
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return dict(entries={})
+        except json.JSONDecodeError:
+            logger.warning(f'Resetting invalid cache index: {self.index_file}')
+            return dict(entries={})
+
+    def _update(self, update: Callable[[Dict[str, Any]], bool]):
+        # the index is shared by all processes using the cache root (e.g. the
+        # workers warming up caches), updates must not get lost
+        with self._lock, FileLock(lock_path(self.index_file)):
+            index = self._load_index()
+            if not update(index['entries']):
+                return
+
+            # replace index atomically
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.root, prefix=INDEX_FILENAME)
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(index, file, indent=2)
+            os.replace(tmp, self.index_file)
+
+
+_cache_directories: List[CacheDirectory] = []
+
+
+def configure_cache_directory(
+    root: FilePath, max_bytes: int, policy: EvictionPolicy = 'lru'
+) -> CacheDirectory:
+    """Registers a managed cache root. Cache files of `dataframe.cache` and
+    `file.cache` processes written below the root are tracked and evicted
+    if the quota (`max_bytes`) is exceeded.
+    """
+    directory = CacheDirectory(root, max_bytes, policy)
+    remove_cache_directory(directory.root)
+    _cache_directories.append(directory)
+    return directory
+
+
+def remove_cache_directory(root: FilePath):
+    root = Path(root).resolve()
+    _cache_directories[:] = [d for d in _cache_directories if d.root != root]
+
+
+def get_cache_directory(path: FilePath) -> Optional[CacheDirectory]:
+    """Returns the managed cache root containing the given path (if any)."""
+    matches = [d for d in _cache_directories if d.contains(path)]
+    # use the innermost root
+    return max(matches, key=lambda d: len(d.root.parts), default=None)
+
+
+def record_access(paths: Iterable[FilePath]):
+    """Updates the access time of cache files in managed cache roots."""
+    for path in paths:
+        directory = get_cache_directory(path)
+        if (directory is not None) and Path(path).exists():
+            directory.record_access(path)
+
+
+def record_build(paths: Iterable[FilePath], duration: Optional[float]):
+    """Registers (re)built cache files in managed cache roots."""
+    for path in paths:
+        directory = get_cache_directory(path)
+        if (directory is not None) and Path(path).exists():
+            directory.record_build(path, duration)
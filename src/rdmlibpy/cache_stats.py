@@ -0,0 +1,188 @@
+import contextlib
+import contextvars
+import json
+import logging
+import threading
+import time
+from collections import Counter, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Literal, Optional, Tuple
+
+import pydantic
+
+from ._typing import FilePath
+from .cache_directory import disk_usage
+
+logger = logging.getLogger(__name__)
+
+CacheEventKind = Literal['hit', 'miss']
+
+
+class CacheEvent(pydantic.BaseModel):
+    """A single cache access (durations in seconds)."""
+
+    process: str
+    key: str
+    kind: CacheEventKind
+    # reason for rebuilding the cache (misses) or for a delayed hit
+    reason: Optional[str] = None
+    # size of the data read from the cache files, estimated by the size of the
+    # loaded data (e.g. of the selected columns and rows) up to the size of
+    # the files; 0 for hits served by the memory cache
+    bytes_read: int = 0
+    memory_hit: bool = False
+    bytes_written: int = 0
+    read_time: float = 0.0
+    write_time: float = 0.0
+    build_time: float = 0.0
+    timestamp: float = pydantic.Field(default_factory=time.time)
+
+
+def files_size(files: Iterable[FilePath]) -> int:
+    """Returns the total size of the existing (cache) files in bytes."""
+    return sum(disk_usage(Path(path)) for path in files if Path(path).exists())
+
+
+class CacheStats:
+    """Collects cache events and aggregates them per cache (key). Only the
+    most recent `max_events` events are kept (the aggregates include all
+    events).
+    """
+
+    _FIELDS = (
+        'bytes_read',
+        'bytes_written',
+        'read_time',
+        'write_time',
+        'build_time',
+    )
+
+    def __init__(self, max_events: Optional[int] = 10_000):
+        self._events: Deque[CacheEvent] = deque(maxlen=max_events)
+        self._caches: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def events(self) -> List[CacheEvent]:
+        with self._lock:
+            return list(self._events)
+
+    def record(self, event: CacheEvent):
+        with self._lock:
+            self._events.append(event)
+            cache = self._caches.setdefault(
+                event.key,
+                dict(
+                    process=event.process,
+                    hits=0,
+                    memory_hits=0,
+                    misses=0,
+                    reasons=Counter(),
+                    hit_read_time=0.0,
+                    **{field: 0 for field in self._FIELDS},
+                ),
+            )
+            if event.kind == 'hit':
+                cache['hits'] += 1
+                cache['memory_hits'] += int(event.memory_hit)
+                cache['hit_read_time'] += event.read_time
+            else:
+                cache['misses'] += 1
+                if event.reason:
+                    cache['reasons'][event.reason] += 1
+            for field in self._FIELDS:
+                cache[field] += getattr(event, field)
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+            self._caches.clear()
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Aggregates the events per cache.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Hits (and hits served by the memory
+                cache), misses, rebuild reasons, bytes and durations per
+                cache. `saved_time` estimates the time saved by the cache
+                (average build time for each hit minus the time spent
+                reading).
+        """
+        with self._lock:
+            caches = {
+                key: dict(cache, reasons=dict(cache['reasons']))
+                for key, cache in self._caches.items()
+            }
+
+        summary = {}
+        for key, cache in caches.items():
+            hits, misses = cache['hits'], cache['misses']
+            avg_build_time = cache['build_time'] / misses if misses else None
+            summary[key] = dict(
+                process=cache['process'],
+                hits=hits,
+                memory_hits=cache['memory_hits'],
+                misses=misses,
+                hit_rate=hits / (hits + misses),
+                reasons=cache['reasons'],
+                **{field: cache[field] for field in self._FIELDS},
+                avg_build_time=avg_build_time,
+                saved_time=(
+                    hits * avg_build_time - cache['hit_read_time']
+                    if avg_build_time is not None
+                    else None
+                ),
+            )
+        return summary
+
+    def totals(self) -> Dict[str, Any]:
+        caches = self.summary().values()
+        return {
+            field: sum(cache[field] for cache in caches)
+            for field in ('hits', 'memory_hits', 'misses') + self._FIELDS
+        }
+
+    def to_dict(self, events: bool = False) -> Dict[str, Any]:
+        result: Dict[str, Any] = dict(totals=self.totals(), caches=self.summary())
+        if events:
+            result['events'] = [event.model_dump() for event in self.events]
+        return result
+
+    def to_json(
+        self, filename: Optional[FilePath] = None, events: bool = False, indent=2
+    ) -> str:
+        """Dumps the statistics as JSON (and writes them to a file, if given)."""
+        text = json.dumps(self.to_dict(events=events), indent=indent)
+        if filename is not None:
+            Path(filename).write_text(text, encoding='utf-8')
+        return text
+
+
+_process_stats = CacheStats()
+_run_stats: contextvars.ContextVar[Tuple[CacheStats, ...]] = contextvars.ContextVar(
+    'rdmlibpy_run_stats', default=()
+)
+
+
+def get_cache_stats() -> CacheStats:
+    """Returns the statistics of all cache accesses of the current process."""
+    return _process_stats
+
+
+@contextlib.contextmanager
+def collect_stats():
+    """Collects the statistics of all cache accesses within this context
+    (e.g. during a workflow run)."""
+    stats = CacheStats()
+    token = _run_stats.set(_run_stats.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _run_stats.reset(token)
+
+
+def record_event(event: CacheEvent):
+    logger.debug(f'Cache {event.kind}: {event.key} ({event.process})')
+    _process_stats.record(event)
+    for stats in _run_stats.get():
+        stats.record(event)
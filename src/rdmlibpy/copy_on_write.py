@@ -0,0 +1,47 @@
+import contextlib
+import contextvars
+from typing import Any
+
+import pandas as pd
+
+_copy_on_write: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    'rdmlibpy_copy_on_write', default=False
+)
+
+
+def copy_on_write_enabled() -> bool:
+    """Returns True if processes run in copy-on-write mode (see
+    `copy_on_write_mode`)."""
+    return _copy_on_write.get()
+
+
+@contextlib.contextmanager
+def copy_on_write_mode(enabled: bool = True):
+    """Runs processes in copy-on-write mode: pandas' copy-on-write is enabled
+    and transforms modifying their source in place receive a (lazy) copy of
+    the source instead, such that shared data frames (e.g. cached or used by
+    multiple branches) are never modified and never copied defensively.
+
+    Note: pandas options are global, i.e. the mode applies to all threads
+    while the context is active.
+    """
+    token = _copy_on_write.set(enabled)
+    try:
+        with pd.option_context('mode.copy_on_write', enabled):
+            yield
+    finally:
+        _copy_on_write.reset(token)
+
+
+def lazy_copy(value: Any) -> Any:
+    """Returns a copy of a data frame (or series), which shares the data with
+    the original until either of them is modified (copy-on-write mode only).
+    Data frames within dicts and lists (e.g. mappings of process results) are
+    copied likewise, other values are returned unchanged."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=not pd.options.mode.copy_on_write)
+    if isinstance(value, dict):
+        return {key: lazy_copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [lazy_copy(item) for item in value]
+    return value
@@ -1,11 +1,18 @@
 from ..registry import register
+from .expressions import DataFrameEval
+from .hdf5 import DataFrameReadHDF5, DataFrameWriteHDF5
 from .io import DataFrameFileCache, DataFrameReadCSV, DataFrameWriteCSV
-from .selection import SelectColumns, SelectTimespan
+from .partitioned import DataFrameReadPartitioned, DataFrameWritePartitioned
+from .resample import DataFrameResample
+from .sql import DataFrameReadSQL, DataFrameWriteSQL
+from .selection import SelectColumns, SelectTimespan, SelectTimespans
 from .transforms import (
+    DataFrameAlign,
     DataFrameAttributes,
     DataFrameFillNA,
     DataFrameInterpolate,
     DataFrameJoin,
+    DataFrameJoinMany,
     DataFrameSetIndex,
     DataFrameUnits,
 )
@@ -13,13 +20,24 @@ from .transforms import (
 register(DataFrameReadCSV())
 register(DataFrameWriteCSV())
 register(DataFrameFileCache())
+register(DataFrameReadHDF5())
+register(DataFrameWriteHDF5())
+register(DataFrameReadPartitioned())
+register(DataFrameWritePartitioned())
+register(DataFrameReadSQL())
+register(DataFrameWriteSQL())
 
+register(DataFrameAlign())
 register(DataFrameAttributes())
+register(DataFrameEval())
 register(DataFrameFillNA())
 register(DataFrameInterpolate())
 register(DataFrameJoin())
+register(DataFrameJoinMany())
+register(DataFrameResample())
 register(DataFrameSetIndex())
 register(DataFrameUnits())
 
 register(SelectColumns())
 register(SelectTimespan())
+register(SelectTimespans())
@@ -0,0 +1,267 @@
+from typing import Any, Dict, Literal, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+import pint_pandas
+
+from .interpolation import exact_indexer, float_magnitudes, interpolate_onto, time_base
+from .units import column_arrays
+
+AsofDirection = Literal['backward', 'forward', 'nearest']
+AlignPolicy = Literal['interpolate', 'exact', 'backward', 'forward', 'nearest']
+GridMethod = Literal['interpolate', 'nearest', 'mean']
+
+
+def union_index(indices: Sequence[pd.Index]) -> pd.Index:
+    """Merges sorted indices into a single sorted index without duplicates.
+    The sorted runs are merged in a single pass (stable sort), which is linear
+    in the total number of values for a small number of indices."""
+    if len(indices) == 1:
+        return indices[0].unique()
+
+    values = np.concatenate([time_base(index) for index in indices])
+    values = np.sort(values, kind='stable')
+    if len(values) > 0:
+        keep = np.empty(len(values), dtype=bool)
+        keep[0] = True
+        np.not_equal(values[1:], values[:-1], out=keep[1:])
+        values = values[keep]
+
+    return from_time_base(values, indices)
+
+
+def from_time_base(values: np.ndarray, indices: Sequence[pd.Index]) -> pd.Index:
+    """Creates an index of the type (and name) of the given indices from values
+    on their time base (inverse of `time_base`)."""
+    names = {index.name for index in indices}
+    name = names.pop() if len(names) == 1 else None
+    first = indices[0]
+    if isinstance(first, pd.DatetimeIndex):
+        index = pd.DatetimeIndex(values.view('datetime64[ns]'), name=name)
+        return (
+            index if first.tz is None else index.tz_localize('UTC').tz_convert(first.tz)
+        )
+    elif isinstance(first, pd.TimedeltaIndex):
+        return pd.TimedeltaIndex(values.view('timedelta64[ns]'), name=name)
+    return pd.Index(values, name=name)
+
+
+def grid_step(index: pd.Index, freq: None | str | float = None) -> int | float:
+    """Returns the step of a regular grid on the time base of an index (see
+    `time_base`): the given frequency (a time delta, e.g. `1s`, for datetime
+    indices) or the median spacing of the index."""
+    if freq is None:
+        spacing = np.diff(time_base(index))
+        if len(spacing) == 0:
+            raise ValueError('Cannot derive the grid frequency from a single row.')
+        step = np.median(spacing)
+    elif isinstance(index, (pd.DatetimeIndex, pd.TimedeltaIndex)):
+        step = pd.Timedelta(freq).value
+    else:
+        step = float(freq)
+    if isinstance(index, (pd.DatetimeIndex, pd.TimedeltaIndex)):
+        step = int(step)
+    if step <= 0:
+        raise ValueError(f'Invalid grid frequency: {freq}')
+    return step
+
+
+def regular_grid(indices: Sequence[pd.Index], step: int | float) -> pd.Index:
+    """Creates a regular grid covering all indices. The grid values are
+    multiples of the step (e.g. full seconds for a step of `1s`)."""
+    bounds = [time_base(index[[0, -1]]) for index in indices if len(index) > 0]
+    if not bounds:
+        return indices[0][:0]
+    start = min(b[0] for b in bounds) // step
+    end = max(b[1] for b in bounds) // step
+    values = np.arange(start, end + 1) * step
+    return from_time_base(values, indices)
+
+
+def concat_columns(*frames: pd.DataFrame) -> pd.DataFrame:
+    """Combines the columns of data frames with identical indices (same as
+    `join`, but without aligning the indices). The attrs of the first data
+    frame are kept."""
+    columns = pd.Index([]).append([df.columns.unique() for df in frames])
+    if columns.has_duplicates:
+        overlap = list(columns[columns.duplicated()].unique())
+        raise ValueError(f'columns overlap but no suffix specified: {overlap}')
+    df_new = pd.concat(frames, axis=1, copy=False)
+
+    # preserve attrs dictionary
+    df_new.attrs = dict(frames[0].attrs)
+
+    return df_new
+
+
+def exact_onto(df: pd.DataFrame, index: pd.Index) -> pd.DataFrame:
+    """Selects the rows of a data frame at the values of another (sorted) index
+    (missing values for index values not contained in the data frame)."""
+    indexer = exact_indexer(time_base(index), time_base(df.index))
+    df_new = pd.DataFrame(
+        {
+            position: pd.api.extensions.take(values, indexer, allow_fill=True)
+            for position, values in enumerate(column_arrays(df))
+        },
+        index=index,
+        copy=False,
+    )
+    df_new.columns = df.columns
+
+    # preserve attrs dictionary
+    df_new.attrs.update(df.attrs)
+
+    return df_new
+
+
+def asof_onto(
+    df: pd.DataFrame,
+    index: pd.Index,
+    direction: AsofDirection = 'backward',
+    tolerance: None | str | float = None,
+) -> pd.DataFrame:
+    """Matches the rows of a data frame to the values of another (sorted) index
+    by the previous (`backward`), next (`forward`) or nearest index value
+    within the given tolerance (a time delta, e.g. `5s`, for datetime indices).
+    """
+    if isinstance(index, pd.DatetimeIndex) and isinstance(df.index, pd.DatetimeIndex):
+        # merge keys must have the same resolution
+        df = df.copy(deep=False)
+        df.index = df.index.as_unit(index.unit)
+    if (tolerance is not None) and isinstance(index, pd.DatetimeIndex):
+        tolerance = pd.Timedelta(tolerance)
+
+    df_new = pd.merge_asof(
+        pd.DataFrame(index=index),
+        df,
+        left_index=True,
+        right_index=True,
+        direction=direction,
+        tolerance=tolerance,
+    )
+    df_new.index = index
+
+    # preserve attrs dictionary
+    df_new.attrs.update(df.attrs)
+
+    return df_new
+
+
+def align_onto(
+    df: pd.DataFrame,
+    index: pd.Index,
+    policy: AlignPolicy = 'interpolate',
+    tolerance: None | str | float = None,
+) -> pd.DataFrame:
+    """Aligns a data frame with another (sorted) index by the given policy:
+    `interpolate` (linear interpolation), `exact` (identical index values only)
+    or an as-of direction (`backward`, `forward` or `nearest`, see
+    `asof_onto`)."""
+    match policy:
+        case 'interpolate':
+            return interpolate_onto(df, index)
+        case 'exact':
+            return exact_onto(df, index)
+        case 'backward' | 'forward' | 'nearest':
+            return asof_onto(df, index, policy, tolerance)
+        case _:
+            raise ValueError(f'Invalid alignment policy: {policy}')
+
+
+def mean_onto(df: pd.DataFrame, index: pd.Index) -> pd.DataFrame:
+    """Averages the rows of a data frame within the bins of a (sorted, regular)
+    index: each value `index[i]` labels the bin up to `index[i + 1]`, the last
+    bin has the width of the previous one. Missing values are ignored, bins
+    without values are missing. Columns that can't be averaged (e.g. strings)
+    are only matched at identical index values."""
+    x = time_base(index)
+    xs = time_base(df.index)
+
+    # bin of each row (-1 for rows outside the grid)
+    bins = np.searchsorted(x, xs, side='right') - 1
+    if len(x) > 1:
+        bins[xs >= x[-1] + (x[-1] - x[-2])] = -1
+    else:
+        bins[xs != x[0]] = -1
+    inside = bins >= 0
+    if not inside.all():
+        bins = bins[inside]
+    else:
+        inside = slice(None)
+    # shared by all columns without missing values
+    counts_all = np.bincount(bins, minlength=len(x))
+
+    result: Dict[int, Any] = {}
+    arrays = column_arrays(df)
+    for position, values in enumerate(arrays):
+        magnitudes = float_magnitudes(values)
+        if magnitudes is None:
+            # exact matches only
+            result[position] = pd.api.extensions.take(
+                values, exact_indexer(x, xs), allow_fill=True
+            )
+            continue
+        magnitudes = magnitudes[inside]
+        valid = ~np.isnan(magnitudes)
+        if valid.all():
+            sums = np.bincount(bins, magnitudes, minlength=len(x))
+            counts = counts_all
+        else:
+            sums = np.bincount(bins[valid], magnitudes[valid], minlength=len(x))
+            counts = np.bincount(bins[valid], minlength=len(x))
+        means: Any = np.divide(
+            sums, counts, out=np.full(len(x), np.nan), where=counts > 0
+        )
+        if isinstance(values, pint_pandas.PintArray):
+            means = pint_pandas.PintArray(means, dtype=values.dtype)
+        result[position] = means
+
+    df_new = pd.DataFrame(
+        {position: result[position] for position in range(len(arrays))},
+        index=index,
+        copy=False,
+    )
+    df_new.columns = df.columns
+
+    # preserve attrs dictionary
+    df_new.attrs.update(df.attrs)
+
+    return df_new
+
+
+def grid_onto(
+    df: pd.DataFrame,
+    index: pd.Index,
+    method: GridMethod = 'interpolate',
+    methods: Mapping[Any, GridMethod] | None = None,
+    tolerance: None | str | float = None,
+) -> pd.DataFrame:
+    """Aligns the columns of a data frame with a regular grid by their method:
+    `interpolate` (linear interpolation), `nearest` (nearest value within the
+    given tolerance) or `mean` (average within the bins, see `mean_onto`).
+    Columns are processed in one pass per method."""
+    groups: Dict[str, list] = {}
+    for position, label in enumerate(df.columns):
+        m = (methods or {}).get(label, method)
+        groups.setdefault(m, []).append(position)
+
+    aligned = []
+    for m, positions in groups.items():
+        subset = df if len(positions) == df.shape[1] else df.iloc[:, positions]
+        match m:
+            case 'interpolate':
+                aligned.append(interpolate_onto(subset, index))
+            case 'nearest':
+                aligned.append(asof_onto(subset, index, 'nearest', tolerance))
+            case 'mean':
+                aligned.append(mean_onto(subset, index))
+            case _:
+                raise ValueError(f'Invalid grid method: {m}')
+    if len(aligned) == 1:
+        return aligned[0]
+
+    # restore the order of the columns
+    order = np.argsort(np.concatenate(list(groups.values())), kind='stable')
+    df_new = concat_columns(*aligned).iloc[:, order]
+    df_new.attrs = dict(df.attrs)
+    return df_new
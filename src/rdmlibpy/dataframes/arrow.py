@@ -0,0 +1,196 @@
+import functools
+import json
+import logging
+import operator
+import pickle
+from typing import List, Optional
+
+import pandas as pd
+import pint_pandas
+
+from .._optional import import_optional
+from .._typing import FilePath
+from .units import apply_column_units, column_arrays, format_unit, split_units
+
+logger = logging.getLogger(__name__)
+
+# keys of the schema metadata entries holding units and (pickled) attrs
+METADATA_KEY = b'rdmlibpy'
+ATTRS_KEY = b'rdmlibpy.attrs'
+
+
+def _pyarrow(name: str = 'pyarrow'):
+    return import_optional(name, 'Arrow/Parquet support')
+
+
+def to_arrow(df: pd.DataFrame):
+    """Converts a data frame (possibly containing pint columns) to an arrow
+    table. Units (by field name) and the attrs dictionary are stored in the
+    schema metadata. The attrs are pickled (same as in HDF5 files), such that
+    values like timestamps are restored unchanged.
+
+    Args:
+        df (pd.DataFrame): The data frame.
+
+    Returns:
+        pyarrow.Table: The arrow table.
+    """
+    pa = _pyarrow()
+
+    units = [
+        format_unit(values.dtype) if isinstance(values, pint_pandas.PintArray) else None
+        for values in column_arrays(df)
+    ]
+    df, _ = split_units(df)
+    table = pa.Table.from_pandas(df, preserve_index=True)
+
+    # the columns are stored first (followed by the index) as fields named by
+    # the string representation of the column labels (e.g. of ints, tuples)
+    names = table.schema.names
+    metadata = dict(table.schema.metadata or {})
+    metadata[METADATA_KEY] = json.dumps(
+        dict(units={name: unit for name, unit in zip(names, units) if unit})
+    ).encode('utf-8')
+    metadata[ATTRS_KEY] = pickle.dumps(df.attrs)
+    return table.replace_schema_metadata(metadata)
+
+
+def from_arrow(table) -> pd.DataFrame:
+    """Converts an arrow table created by `to_arrow` back to a data frame.
+    Numeric columns without missing values are not copied (if the table
+    was memory mapped, the data frame references the mapped file).
+
+    Args:
+        table (pyarrow.Table): The arrow table.
+
+    Returns:
+        pd.DataFrame: The data frame (with units and attrs).
+    """
+    schema_metadata = table.schema.metadata or {}
+    metadata = json.loads(schema_metadata.get(METADATA_KEY, b'{}'))
+    units = metadata.get('units', {})
+
+    df = table.to_pandas(split_blocks=True)
+    # fields of the columns (in order), except the fields storing the index
+    index_columns = (table.schema.pandas_metadata or {}).get('index_columns', [])
+    names = [name for name in table.schema.names if name not in index_columns]
+    df = apply_column_units(df, [units.get(name) for name in names])
+    if ATTRS_KEY in schema_metadata:
+        df.attrs.update(pickle.loads(schema_metadata[ATTRS_KEY]))
+    return df
+
+
+def write_arrow(
+    df: pd.DataFrame, filename: FilePath, compression: Optional[str] = None
+):
+    """Writes a data frame to an arrow IPC file (uncompressed by default, which
+    allows memory mapping the file when reading)."""
+    pa = _pyarrow()
+    ipc = _pyarrow('pyarrow.ipc')
+
+    table = to_arrow(df)
+    options = ipc.IpcWriteOptions(compression=compression)
+    with pa.OSFile(str(filename), 'wb') as sink:
+        with ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+
+
+def read_arrow(
+    filename: FilePath,
+    columns: Optional[List[str]] = None,
+    memory_map: bool = True,
+    column: Optional[str] = None,
+    start=None,
+    stop=None,
+) -> pd.DataFrame:
+    pa = _pyarrow()
+    ipc = _pyarrow('pyarrow.ipc')
+
+    logger.info(f'Loading arrow file: {filename}')
+    source = (
+        pa.memory_map(str(filename), 'r')
+        if memory_map
+        else pa.OSFile(str(filename), 'rb')
+    )
+    with source:
+        table = ipc.open_file(source).read_all()
+    expression = time_filter(table.schema, column, start, stop)
+    if expression is not None:
+        table = table.filter(expression)
+    if columns is not None:
+        table = table.select(_with_index_columns(table, columns))
+    return from_arrow(table)
+
+
+def write_parquet(
+    df: pd.DataFrame, filename: FilePath, compression: Optional[str] = 'snappy'
+):
+    parquet = _pyarrow('pyarrow.parquet')
+    parquet.write_table(to_arrow(df), str(filename), compression=compression)
+
+
+def read_parquet(
+    filename: FilePath,
+    columns: Optional[List[str]] = None,
+    filters=None,
+    memory_map: bool = True,
+    column: Optional[str] = None,
+    start=None,
+    stop=None,
+) -> pd.DataFrame:
+    parquet = _pyarrow('pyarrow.parquet')
+
+    logger.info(f'Loading parquet file: {filename}')
+    schema = parquet.read_schema(str(filename))
+    if columns is not None:
+        columns = _with_index_columns(schema, columns)
+    expression = time_filter(schema, column, start, stop)
+    if expression is not None:
+        filters = expression if filters is None else (expression & filters)
+    table = parquet.read_table(
+        str(filename), columns=columns, filters=filters, memory_map=memory_map
+    )
+    return from_arrow(table)
+
+
+def time_filter(schema, column: Optional[str], start=None, stop=None):
+    """Creates a filter expression selecting the time range [start, stop]
+    (inclusive) of the given column (or the index if `column` is None).
+
+    Raises:
+        KeyError: If the table contains no such column.
+
+    Returns:
+        pyarrow.compute.Expression: The expression (None if neither start
+            nor stop is given).
+    """
+    if (start is None) and (stop is None):
+        return None
+    pc = _pyarrow('pyarrow.compute')
+
+    if column is None:
+        # the (named or unnamed) index is stored as regular column
+        index_columns = (schema.pandas_metadata or {}).get('index_columns', [])
+        column = next((name for name in index_columns if isinstance(name, str)), None)
+    if (column is None) or (column not in schema.names):
+        raise KeyError(f'No time column `{column}` found in table')
+
+    field = pc.field(column)
+    expressions = []
+    if start is not None:
+        expressions.append(field >= pd.Timestamp(start))
+    if stop is not None:
+        expressions.append(field <= pd.Timestamp(stop))
+    return functools.reduce(operator.and_, expressions)
+
+
+def _with_index_columns(table_or_schema, columns: List[str]) -> List[str]:
+    # add columns that store the (pandas) index, such that it is restored
+    schema = getattr(table_or_schema, 'schema', table_or_schema)
+    pandas_metadata = schema.pandas_metadata or {}
+    index_columns = [
+        name
+        for name in pandas_metadata.get('index_columns', [])
+        if isinstance(name, str) and name not in columns
+    ]
+    return index_columns + list(columns)
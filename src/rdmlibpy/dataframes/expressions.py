@@ -0,0 +1,461 @@
+import ast
+import collections
+import copy
+import functools
+import re
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numexpr
+import numpy as np
+import pandas as pd
+import pandas.arrays
+import pint
+import pint_pandas
+
+from ..process import Transform
+from .interpolation import float_magnitudes
+from .properties import replace_columns
+from .units import column_arrays, magnitude
+
+# functions supported by pandas' expression engine (and numpy for units)
+FUNCTIONS = frozenset(
+    {
+        'abs',
+        'arccos',
+        'arccosh',
+        'arcsin',
+        'arcsinh',
+        'arctan',
+        'arctanh',
+        'ceil',
+        'cos',
+        'cosh',
+        'exp',
+        'expm1',
+        'floor',
+        'log',
+        'log10',
+        'log1p',
+        'sin',
+        'sinh',
+        'sqrt',
+        'tan',
+        'tanh',
+    }
+)
+
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Compare,
+    ast.BoolOp,
+    ast.Call,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+    ast.operator,
+    ast.unaryop,
+    ast.cmpop,
+    ast.boolop,
+)
+
+_BACKTICKS = re.compile(r'`([^`]+)`')
+
+
+def parse_expression(expression: str) -> Tuple[ast.Expression, Dict[str, str]]:
+    """Parses an arithmetic expression of column names (column names, which
+    are not identifiers, are quoted by backticks, e.g. `sample-upstream`).
+
+    Returns:
+        Tuple[ast.Expression, Dict[str, str]]: The syntax tree and the column
+            names by variable name.
+    """
+    names: Dict[str, str] = {}
+
+    def quote(match):
+        name = f'__column_{len(names)}'
+        names[name] = match.group(1)
+        return name
+
+    tree = ast.parse(_BACKTICKS.sub(quote, expression.strip()), mode='eval')
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f'Unsupported expression: {expression}')
+        if isinstance(node, ast.Call) and not (
+            isinstance(node.func, ast.Name) and (node.func.id in FUNCTIONS)
+        ):
+            raise ValueError(f'Unsupported function in expression: {expression}')
+        if isinstance(node, ast.Call) and node.keywords:
+            raise ValueError(f'Unsupported function in expression: {expression}')
+        if isinstance(node, ast.Name) and (node.id not in names):
+            names[node.id] = node.id
+    for call in (n for n in ast.walk(tree) if isinstance(n, ast.Call)):
+        names.pop(call.func.id, None)  # type: ignore
+    return tree, names
+
+
+class _Substitute(ast.NodeTransformer):
+    # replaces variables by (sub) expressions (source or syntax trees)
+    def __init__(self, replacements: Mapping[str, str | ast.expr]):
+        self.replacements = replacements
+
+    def visit_Call(self, node: ast.Call):
+        # keep function names
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+    def visit_Name(self, node: ast.Name):
+        replacement = self.replacements.get(node.id)
+        if replacement is None:
+            return node
+        if isinstance(replacement, str):
+            return ast.parse(replacement, mode='eval').body
+        # replacements may contain other variables
+        return self.visit(copy.deepcopy(replacement))
+
+
+class _Logical(ast.NodeTransformer):
+    # element-wise logical operators for arrays (as in pandas' expressions):
+    # `and`, `or`, `not` and chained comparisons become `&`, `|` and `~`
+    def visit_BoolOp(self, node: ast.BoolOp):
+        self.generic_visit(node)
+        op = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+        return functools.reduce(lambda a, b: ast.BinOp(a, op, b), node.values)
+
+    def visit_UnaryOp(self, node: ast.UnaryOp):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return ast.UnaryOp(ast.Invert(), node.operand)
+        return node
+
+    def visit_Compare(self, node: ast.Compare):
+        self.generic_visit(node)
+        if len(node.ops) == 1:
+            return node
+        operands = [node.left, *node.comparators]
+        return functools.reduce(
+            lambda a, b: ast.BinOp(a, ast.BitAnd(), b),
+            [
+                ast.Compare(left, [op], [right])
+                for left, op, right in zip(operands, node.ops, operands[1:])
+            ],
+        )
+
+
+_COMPOUND = (ast.BinOp, ast.UnaryOp, ast.Compare, ast.BoolOp, ast.Call)
+
+
+class _Temporaries(ast.NodeTransformer):
+    # replaces sub-expressions by temporaries (by their source)
+    def __init__(self, names: Mapping[str, str]):
+        self.names = names
+
+    def visit(self, node: ast.AST):
+        if isinstance(node, _COMPOUND) and (ast.unparse(node) in self.names):
+            return ast.Name(self.names[ast.unparse(node)], ast.Load())
+        return super().visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        # keep function names
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+
+def _is_candidate(node: ast.AST) -> bool:
+    # sub-expressions of a single variable without function calls (e.g. the
+    # conversion of a column to base units) are cheaper to evaluate again
+    if not isinstance(node, _COMPOUND):
+        return False
+    variables = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Call):
+            return True
+        if isinstance(child, ast.Name):
+            variables.add(child.id)
+    return len(variables) > 1
+
+
+def eliminate_subexpressions(
+    trees: Sequence[ast.expr],
+) -> Tuple[List[ast.expr], Dict[str, ast.expr]]:
+    """Replaces sub-expressions, which occur more than once (within or across
+    expressions), by temporaries (`__t<i>`), such that they are evaluated only
+    once.
+
+    Returns:
+        Tuple[List[ast.expr], Dict[str, ast.expr]]: The expressions and the
+            definitions of the temporaries by name.
+    """
+    counts = collections.Counter(
+        ast.unparse(node)
+        for tree in trees
+        for node in ast.walk(tree)
+        if _is_candidate(node)
+    )
+    names = {
+        source: f'__t{i}'
+        for i, source in enumerate(s for s, count in counts.items() if count > 1)
+    }
+
+    # definitions use the temporaries of the sub-expressions they contain
+    definitions: Dict[str, ast.expr] = {}
+    for source, name in names.items():
+        others = {key: other for key, other in names.items() if key != source}
+        tree = ast.parse(source, mode='eval').body
+        definitions[name] = _Temporaries(others).visit(tree)
+    trees = [_Temporaries(names).visit(copy.deepcopy(tree)) for tree in trees]
+
+    # inline temporaries used only once (e.g. within a larger sub-expression)
+    uses = collections.Counter(
+        node.id
+        for tree in [*trees, *definitions.values()]
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Name) and (node.id in definitions)
+    )
+    single = {
+        name: definitions.pop(name) for name in list(definitions) if uses[name] < 2
+    }
+    inline = _Substitute(single)
+    return (
+        [inline.visit(tree) for tree in trees],
+        {name: inline.visit(tree) for name, tree in definitions.items()},
+    )
+
+
+class _Operand:
+    # unit of a column (or result) and the conversion of its magnitudes to
+    # base units (`magnitude * scale + offset`)
+    def __init__(self, alias: str, unit: Optional[pint.Unit], registry):
+        self.alias = alias
+        self.original = unit
+        self.unit = unit
+        self.scale = 1.0
+        self.offset = 0.0
+        if unit is not None:
+            zero = registry.Quantity(0.0, unit).to_base_units()
+            one = registry.Quantity(1.0, unit).to_base_units()
+            self.unit = zero.units
+            self.scale = float(one.magnitude - zero.magnitude)
+            self.offset = float(zero.magnitude)
+
+    @property
+    def term(self) -> str:
+        # magnitudes in base units
+        if self.scale == 1.0 and self.offset == 0.0:
+            return self.alias
+        elif self.offset == 0.0:
+            return f'({self.alias} * {self.scale!r})'
+        return f'({self.alias} * {self.scale!r} + {self.offset!r})'
+
+    def inverse(self, source: str) -> str:
+        # magnitudes in the unit of the operand (from base units)
+        if self.scale == 1.0 and self.offset == 0.0:
+            return source
+        elif self.offset == 0.0:
+            return f'({source}) / {self.scale!r}'
+        return f'(({source}) - {self.offset!r}) / {self.scale!r}'
+
+
+def _eval_python(tree: ast.expr, values: Mapping[str, Any]) -> Any:
+    # evaluates an expression using numpy (scalars, quantities or arrays)
+    namespace: Dict[str, Any] = {name: getattr(np, name) for name in FUNCTIONS}
+    namespace['abs'] = abs
+    namespace.update(values)
+    code = compile(
+        ast.fix_missing_locations(ast.Expression(tree)), '<expression>', 'eval'
+    )
+    with np.errstate(all='ignore'):
+        return eval(code, {'__builtins__': {}}, namespace)
+
+
+def _eval_array(tree: ast.expr, values: Mapping[str, Any], engine: str) -> Any:
+    if engine == 'numexpr':
+        # single (multi-threaded) pass without intermediate arrays
+        return numexpr.evaluate(ast.unparse(tree), local_dict=values, global_dict={})
+    return _eval_python(tree, values)
+
+
+def _result_units(
+    tree: ast.Expression, operands: Mapping[str, _Operand], registry
+) -> Tuple[Optional[pint.Unit], Optional[pint.Unit]]:
+    # evaluates the expression on scalar quantities to derive the unit of the
+    # result (and to check the operations as pint does, e.g. dimensionality
+    # or multiplications of temperatures in °C): the base unit and the unit
+    # derived from the units of the operands (if it is a simple unit, e.g.
+    # `ppm` for `NO + NO2`, but not `ppm / %`)
+    result = _eval_python(
+        tree.body,
+        {
+            # distinct values (avoid differences of zero)
+            name: np.float64(1.0 + i / 7)
+            if operand.original is None
+            else registry.Quantity(np.float64(1.0 + i / 7), operand.original)
+            for i, (name, operand) in enumerate(operands.items())
+        },
+    )
+    if not isinstance(result, pint.Quantity):
+        return None, None
+    base = result.to_base_units().units
+    factors = list(result.unit_items())
+    if (len(factors) == 1) and (factors[0][1] == 1):
+        return base, result.units
+    return base, None
+
+
+def _magnitudes(values: Any) -> np.ndarray:
+    # magnitudes of a column (integers are converted to float)
+    magnitudes = float_magnitudes(values)
+    if magnitudes is not None:
+        return magnitudes
+    if isinstance(values, pint_pandas.PintArray):
+        values = magnitude(values)
+    if isinstance(values, pandas.arrays.IntegerArray):  # type: ignore
+        return values.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = np.asarray(values)
+    if values.dtype.kind in 'iu':
+        return values.astype(np.float64)
+    return values
+
+
+def evaluate(
+    df: pd.DataFrame,
+    expressions: Mapping[str, str],
+    units: Optional[Mapping[str, str]] = None,
+    engine: Literal['numexpr', 'python'] = 'numexpr',
+) -> Dict[str, Any]:
+    """Evaluates expressions of columns (in order). Each expression may use the
+    results of the preceding expressions; names starting with an underscore
+    are temporary results, which are not returned.
+
+    Sub-expressions, which occur more than once (within or across the
+    expressions), are evaluated only once. Each expression (and common
+    sub-expression) is evaluated in a single vectorized pass by numexpr.
+    Units of pint columns are respected: the magnitudes are converted to base
+    units within the expression and the unit of the result is derived from
+    the expression (operations, which pint does not support, raise pint's
+    errors). Results are returned in the given unit, in the unit derived from
+    the operands (if it is a simple unit, e.g. `ppm` for `NO + NO2` or `km`
+    for `2 * L`) or in base units. Dimensionless results without such unit
+    (e.g. ratios) are returned as plain arrays.
+
+    Args:
+        df (pd.DataFrame): The data frame.
+        expressions (Mapping[str, str]): The expressions by result name.
+        units (Mapping[str, str], optional): Units of the results. Defaults to
+            None.
+        engine (str, optional): Evaluate by `numexpr` or by `python` (numpy
+            operations). Defaults to 'numexpr'.
+
+    Returns:
+        Dict[str, Any]: The results (arrays) by name.
+    """
+    registry = pint_pandas.PintType.ureg
+    units = units or {}
+    labels = {label: position for position, label in enumerate(df.columns)}
+    arrays = column_arrays(df)
+
+    # operands by column label or name of a preceding result, the magnitudes
+    # of the operands by alias
+    operands: Dict[Any, _Operand] = {}
+    values: Dict[str, Any] = {}
+
+    def operand(label: Any) -> _Operand:
+        if label not in operands:
+            if label not in labels:
+                raise KeyError(f'Unknown column in expression: {label}')
+            position = labels[label]
+            column = arrays[position]
+            alias = f'__c{position}'
+            values[alias] = _magnitudes(column)
+            unit = column.units if isinstance(column, pint_pandas.PintArray) else None
+            operands[label] = _Operand(alias, unit, registry)
+        return operands[label]
+
+    # derive the units of the results and the expressions of their magnitudes
+    # in terms of the magnitudes of the columns (converted to base units)
+    results: Dict[str, _Operand] = {}
+    trees = []
+    for i, (name, expression) in enumerate(expressions.items()):
+        tree, names = parse_expression(expression)
+        used = {variable: operand(label) for variable, label in names.items()}
+        unit, preferred = _result_units(tree, used, registry)
+
+        target = None if unit is None else (units.get(name) or preferred)
+        if (target is None) and (unit is not None) and unit.dimensionless:
+            # e.g. ratios
+            target = 'dimensionless'
+        if target is not None:
+            unit = registry.Unit(target)
+        if unit == registry.Unit('dimensionless'):
+            unit = None
+        result = _Operand(f'__r{i}', unit, registry)
+
+        tree = _Substitute({v: used[v].term for v in used}).visit(tree)
+        source = result.inverse(ast.unparse(_Logical().visit(tree)))
+        trees.append(ast.parse(source, mode='eval').body)
+        operands[name] = results[name] = result
+
+    trees, definitions = eliminate_subexpressions(trees)
+
+    def evaluate_tree(tree: ast.expr):
+        # evaluates the temporaries used by the expression (once) first
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and (node.id in definitions):
+                if node.id not in values:
+                    values[node.id] = evaluate_tree(definitions[node.id])
+        return _eval_array(tree, values, engine)
+
+    for tree, result in zip(trees, results.values()):
+        magnitudes = np.asarray(evaluate_tree(tree))
+        if magnitudes.ndim == 0:
+            magnitudes = np.full(len(df), magnitudes)
+        values[result.alias] = magnitudes
+
+    return {
+        name: values[result.alias]
+        if result.original is None
+        else pint_pandas.PintArray(values[result.alias], dtype=result.original)
+        for name, result in results.items()
+        if not name.startswith('_')
+    }
+
+
+class DataFrameEval(Transform):
+    name: str = 'dataframe.eval'
+    version: str = '1'
+    mutates_source: ClassVar[bool] = True
+
+    def run(
+        self,
+        source: pd.DataFrame,
+        expressions: Mapping[str, str],
+        units: Optional[Mapping[str, str]] = None,
+    ):
+        """Adds columns derived from expressions of other columns, e.g.
+        `{'_NOx': 'NO + NO2', 'conversion': '1 - _NOx / `NOx-inlet`'}` (see
+        `evaluate`). Existing columns with the same name are replaced.
+
+        Args:
+            source (pd.DataFrame): The data frame.
+            expressions (Mapping[str, str]): The expressions by column name.
+            units (Mapping[str, str], optional): Units of the new columns.
+                Defaults to None.
+
+        Returns:
+            pd.DataFrame: The data frame with the new columns.
+        """
+        results = evaluate(source, expressions, units)
+        for name, values in results.items():
+            source[name] = values
+        return replace_columns(source, results)
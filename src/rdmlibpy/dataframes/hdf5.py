@@ -0,0 +1,232 @@
+import logging
+from typing import Any, Dict, List, Literal, Optional
+
+import numpy as np
+import pandas as pd
+import pydantic
+
+from .._typing import FilePath
+from ..process import Loader, Writer
+from .selection import select_timespan
+from .units import apply_units, split_units
+
+logger = logging.getLogger(__name__)
+
+WriteMode = Literal['append', 'overwrite']
+
+
+def open_store(
+    filename: FilePath,
+    mode: str = 'a',
+    complib: Optional[str] = None,
+    complevel: int = 0,
+) -> pd.HDFStore:
+    """Opens an HDF5 store, whose new arrays and tables are compressed as given
+    (byte shuffled by pandas; `zlib` if only the level is given). Arrays of the
+    fixed format are only chunked if compression is enabled.
+    """
+    compression = (
+        dict(complib=complib or 'zlib', complevel=complevel) if complevel > 0 else {}
+    )
+    return pd.HDFStore(filename, mode=mode, **compression)
+
+
+class DataFrameWriteHDF5(Writer):
+    name: str = 'dataframe.write.hdf5'
+    version: str = '1'
+
+    key: str = 'data'
+    column: Optional[str] = 'timestamp'
+    mode: WriteMode = 'append'
+    complib: Optional[str] = 'blosc:lz4'
+    complevel: int = 5
+    # expected number of rows of the table, from which PyTables derives the
+    # chunk shape (defaults to the number of rows written first)
+    expectedrows: Optional[int] = None
+    chunksize: Optional[int] = None
+    options: Dict[str, Any] = pydantic.Field(default_factory=dict)  # type: ignore
+
+    def run(self, source: pd.DataFrame, filename: FilePath, **kwargs):
+        key = kwargs.pop('key', self.key)
+        column = kwargs.pop('column', self.column)
+        mode = kwargs.pop('mode', self.mode)
+
+        # store magnitudes and keep units separately
+        df, units = split_units(source)
+
+        # create path (if necessary)
+        filename = self.ensure_path(filename)
+
+        # compression of the table (if it is created)
+        options = self.options | kwargs
+        store_options = dict(
+            complib=options.pop('complib', self.complib),
+            complevel=options.pop('complevel', self.complevel),
+        )
+
+        with open_store(filename, mode='a', **store_options) as store:
+            if (mode == 'overwrite') and (key in store):
+                store.remove(key)
+
+            if key in store:
+                df = self._select_new_rows(store, key, df, column, units)
+            else:
+                logger.info(f'Creating HDF5 table: {key} ({filename})')
+
+            if not df.empty:
+                self._append(store, key, df, column, **options)
+
+                # save units, attributes and the most recent timestamp
+                storer_attrs = store.get_storer(key).attrs  # type: ignore
+                storer_attrs.units = units
+                storer_attrs.time_column = column
+                storer_attrs.last_timestamp = self._timestamps(df, column).max()
+                storer_attrs.my_metadata = source.attrs
+
+        # return unaltered data as input for the next process
+        return source
+
+    def _append(
+        self,
+        store: pd.HDFStore,
+        key: str,
+        df: pd.DataFrame,
+        column: Optional[str],
+        **kwargs,
+    ):
+        options: Dict[str, Any] = dict(
+            format='table',
+            data_columns=[column] if column is not None else None,
+            chunksize=self.chunksize,
+            expectedrows=self.expectedrows,
+        )
+        options |= kwargs
+        store.append(key, df, **options)
+
+    def _select_new_rows(
+        self,
+        store: pd.HDFStore,
+        key: str,
+        df: pd.DataFrame,
+        column: Optional[str],
+        units: Dict[Any, str],
+    ):
+        storer_attrs = store.get_storer(key).attrs  # type: ignore
+        if getattr(storer_attrs, 'time_column', column) != column:
+            raise ValueError(
+                f'The table uses `{storer_attrs.time_column}` as time column; '
+                + f'cannot append data using `{column}`.'
+            )
+        if getattr(storer_attrs, 'units', units) != units:
+            raise ValueError(
+                f'Units of appended data ({units}) do not match the units '
+                + f'of the stored data ({storer_attrs.units}).'
+            )
+
+        # only append rows that are newer than the most recent stored row
+        last = getattr(storer_attrs, 'last_timestamp', None)
+        if last is None:
+            return df
+        mask = np.asarray(self._timestamps(df, column) > last)
+        logger.info(f'Appending {mask.sum()} of {len(df)} rows to table: {key}')
+        return df if mask.all() else df.loc[mask]
+
+    @staticmethod
+    def _timestamps(df: pd.DataFrame, column: Optional[str]):
+        return df.index if column is None else df[column]
+
+
+class DataFrameReadHDF5(Loader):
+    name: str = 'dataframe.read.hdf5'
+    version: str = '1'
+
+    key: str = 'data'
+    concatenate: bool = True
+
+    def run(
+        self,
+        source: FilePath,
+        start=None,
+        stop=None,
+        columns: None | List[str] = None,
+    ):
+        data = [
+            read_table(path, self.key, start=start, stop=stop, columns=columns)
+            for path in Loader.glob(source)
+        ]
+        if self.concatenate:
+            data = pd.concat(data)
+        return data
+
+
+def read_table(
+    filename: FilePath,
+    key: str = 'data',
+    start=None,
+    stop=None,
+    columns: None | List[str] = None,
+    column: Optional[str] = None,
+):
+    """Reads (a selection of) a table written by `DataFrameWriteHDF5`. The time
+    range is evaluated by PyTables using the index on the time column, such
+    that only matching rows are loaded.
+
+    Args:
+        filename (FilePath): The HDF5 file.
+        key (str, optional): The key of the table. Defaults to 'data'.
+        start (optional): Start of the time range (inclusive). Defaults to None.
+        stop (optional): End of the time range (inclusive). Defaults to None.
+        columns (None | List[str], optional): The columns to load. Defaults
+            to None (all columns).
+        column (Optional[str], optional): The column used to select the time
+            range. Defaults to None (the time column of the table).
+
+    Returns:
+        pd.DataFrame: The selected data (with units).
+    """
+    logger.info(f'Loading HDF5 table: {key} ({filename})')
+    with pd.HDFStore(filename, mode='r') as store:
+        df = select_table(store, key, start, stop, columns, column)
+    return df
+
+
+def select_table(
+    store: pd.HDFStore,
+    key: str = 'data',
+    start=None,
+    stop=None,
+    columns: None | List[str] = None,
+    column: Optional[str] = None,
+):
+    """Selects data from a table of an open store (see `read_table`). If the
+    time range is given for a column, which is not a data column of the table,
+    the rows are selected after loading.
+    """
+    storer = store.get_storer(key)
+    storer_attrs = storer.attrs  # type: ignore
+    if column is None:
+        column = getattr(storer_attrs, 'time_column', None) or 'index'
+
+    # `where` expressions reference the local variables start/stop
+    start = None if start is None else pd.Timestamp(start)  # noqa: F841
+    stop = None if stop is None else pd.Timestamp(stop)  # noqa: F841
+    where = []
+    queryable = (column == 'index') or (column in storer.data_columns)
+    if queryable:
+        if start is not None:
+            where.append(f'{column} >= start')
+        if stop is not None:
+            where.append(f'{column} <= stop')
+
+    load = columns
+    if (not queryable) and (columns is not None) and (column not in columns):
+        load = [*columns, column]
+
+    df = store.select(key, where=where or None, columns=load)
+    if not queryable:
+        df = select_timespan(df, column, start, stop)
+        if load is not columns:
+            df = df[columns]
+    df = apply_units(df, getattr(storer_attrs, 'units', {}))
+    df.attrs.update(getattr(storer_attrs, 'my_metadata', {}))
+    return df
@@ -0,0 +1,251 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pandas.arrays
+import pint_pandas
+
+from .properties import replace_columns
+from .units import column_arrays, magnitude
+
+
+def time_base(index: pd.Index) -> np.ndarray:
+    """Returns the interpolation axis of an index: int64 nanoseconds for
+    datetime and timedelta indices, float64 values otherwise."""
+    if isinstance(index, (pd.DatetimeIndex, pd.TimedeltaIndex)):
+        return index.as_unit('ns').asi8
+    return np.asarray(index, dtype=np.float64)
+
+
+def exact_indexer(x: np.ndarray, xp: np.ndarray) -> np.ndarray:
+    """Returns the positions of the values `x` in `xp` (both sorted) or -1 for
+    values not contained in `xp`."""
+    if len(xp) == 0:
+        return np.full(len(x), -1)
+    j = np.minimum(np.searchsorted(xp, x), len(xp) - 1)
+    return np.where(xp[j] == x, j, -1)
+
+
+def interpolation_weights(
+    x: np.ndarray, valid: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Computes the linear interpolation of the missing values (`~valid`)
+    from the neighbouring valid values: `y[missing] = y[left] * (1 - w) +
+    y[right] * w`. Missing values before the first and after the last valid
+    value are set to the first and last valid value (same as `np.interp`).
+
+    Args:
+        x (np.ndarray): The (sorted) interpolation axis (see `time_base`).
+        valid (np.ndarray): Mask of the valid values (at least one).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The positions
+            of the missing values, of their left and right neighbours and the
+            weights.
+    """
+    known = np.flatnonzero(valid)
+    missing = np.flatnonzero(~valid)
+    j = np.searchsorted(known, missing)
+    left = known[np.clip(j - 1, 0, len(known) - 1)]
+    right = known[np.clip(j, 0, len(known) - 1)]
+
+    # differences are computed on the (exact) int64 time base
+    x0 = x[left]
+    dx = (x[right] - x0).astype(np.float64)
+    w = np.divide(
+        (x[missing] - x0).astype(np.float64),
+        dx,
+        out=np.zeros(len(missing)),
+        where=dx != 0,
+    )
+    return missing, left, right, w
+
+
+def sample_weights(
+    x: np.ndarray, xp: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Computes the linear interpolation of values given at `xp` onto `x`
+    (both sorted): `y = yp[left] * (1 - w) + yp[right] * w`. Values outside
+    of `xp` are set to the first and last value (same as `np.interp`).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The positions of the left
+            and right neighbours (in `xp`) and the weights.
+    """
+    j = np.searchsorted(xp, x, side='right')
+    left = np.clip(j - 1, 0, len(xp) - 1)
+    right = np.clip(j, 0, len(xp) - 1)
+
+    x0 = xp[left]
+    dx = (xp[right] - x0).astype(np.float64)
+    w = np.divide((x - x0).astype(np.float64), dx, out=np.zeros(len(x)), where=dx != 0)
+    return left, right, w
+
+
+def _interpolate_batch(x: np.ndarray, valid: np.ndarray, values: List[np.ndarray]):
+    # interpolates a batch of columns with identical NaN masks (2-D, the rows
+    # of the result are the interpolated columns); the weights are shared by
+    # all columns of the batch
+    result = np.stack(values).astype(np.float64, copy=False)
+    if not valid.any():
+        return result
+
+    missing, left, right, w = interpolation_weights(x, valid)
+    for row in result:
+        # gathering row by row is faster than (2-D) fancy indexing
+        y0 = row.take(left)
+        row[missing] = y0 + (row.take(right) - y0) * w
+    return result
+
+
+def float_magnitudes(values: Any) -> Optional[np.ndarray]:
+    """Returns the float magnitudes of a column array (without copying numpy
+    data) or None, if the column is not a float (or pint float) column."""
+    if isinstance(values, pint_pandas.PintArray):
+        values = magnitude(values)
+    if isinstance(values, pandas.arrays.FloatingArray):  # type: ignore
+        # masked arrays (e.g. pint columns created from lists)
+        values = values.to_numpy(dtype=values.dtype.numpy_dtype, na_value=np.nan)
+    if isinstance(values, np.ndarray) and (values.dtype.kind == 'f'):
+        return values
+    return None
+
+
+def interpolate_frame(
+    df: pd.DataFrame, columns: Optional[Iterable[Any]] = None
+) -> pd.DataFrame:
+    """Fills missing (NaN) values of numeric columns by linear interpolation
+    over the index (in place). Values before the first and after the last
+    valid value are set to the first and last valid value, respectively.
+
+    Columns with identical missing values are interpolated together, such
+    that the interpolation weights are computed only once. Units of pint
+    columns are kept.
+
+    Args:
+        df (pd.DataFrame): The data frame (sorted by index).
+        columns (Iterable, optional): The columns to interpolate. Defaults to
+            None (all columns).
+
+    Returns:
+        pd.DataFrame: The data frame.
+    """
+    selected = None if columns is None else set(columns)
+    x = time_base(df.index)
+
+    # group columns by their mask of valid values
+    groups: Dict[bytes, Tuple[np.ndarray, List[int]]] = {}
+    arrays = column_arrays(df)
+    for position, (label, values) in enumerate(zip(df.columns, arrays)):
+        if (selected is not None) and (label not in selected):
+            continue
+        magnitudes = float_magnitudes(values)
+        if magnitudes is None:
+            continue
+        valid = ~np.isnan(magnitudes)
+        if valid.all():
+            continue
+        key = np.packbits(valid).tobytes()
+        groups.setdefault(key, (valid, []))[1].append(position)
+
+    for valid, positions in groups.values():
+        result = _interpolate_batch(
+            x, valid, [float_magnitudes(arrays[p]) for p in positions]
+        )
+        for row, position in enumerate(positions):
+            values: Any = result[row]
+            if isinstance(arrays[position], pint_pandas.PintArray):
+                values = pint_pandas.PintArray(values, dtype=arrays[position].dtype)
+            df.isetitem(position, values)
+
+    return replace_columns(
+        df, [df.columns[p] for _, positions in groups.values() for p in positions]
+    )
+
+
+def interpolate_onto(df: pd.DataFrame, index: pd.Index) -> pd.DataFrame:
+    """Interpolates the columns of a data frame onto another index (both
+    sorted) without joining the indices. Missing values are ignored, i.e.
+    each column is interpolated from its valid values. Columns that can't be
+    interpolated (e.g. strings) are only matched at identical index values.
+
+    Args:
+        df (pd.DataFrame): The data frame.
+        index (pd.Index): The target index.
+
+    Returns:
+        pd.DataFrame: The interpolated data frame with the given index.
+    """
+    df = as_float(df)
+    x = time_base(index)
+    xs = time_base(df.index)
+
+    # group columns by their mask of valid values
+    groups: Dict[bytes, Tuple[np.ndarray, List[int]]] = {}
+    arrays = column_arrays(df)
+    result: Dict[int, Any] = {}
+    for position, values in enumerate(arrays):
+        magnitudes = float_magnitudes(values)
+        if magnitudes is None:
+            # exact matches only
+            result[position] = pd.api.extensions.take(
+                values, exact_indexer(x, xs), allow_fill=True
+            )
+            continue
+        valid = ~np.isnan(magnitudes)
+        key = np.packbits(valid).tobytes()
+        groups.setdefault(key, (valid, []))[1].append(position)
+
+    for valid, positions in groups.values():
+        known = np.flatnonzero(valid)
+        if len(known) > 0:
+            left, right, w = sample_weights(x, xs[known])
+            left, right = known[left], known[right]
+        for position in positions:
+            if len(known) > 0:
+                magnitudes = float_magnitudes(arrays[position])
+                y0 = magnitudes.take(left)
+                values: Any = y0 + (magnitudes.take(right) - y0) * w
+            else:
+                values = np.full(len(x), np.nan)
+            if isinstance(arrays[position], pint_pandas.PintArray):
+                values = pint_pandas.PintArray(values, dtype=arrays[position].dtype)
+            result[position] = values
+
+    df_new = pd.DataFrame(
+        {position: result[position] for position in range(len(arrays))},
+        index=index,
+        copy=False,
+    )
+    df_new.columns = df.columns
+
+    # preserve attrs dictionary
+    df_new.attrs.update(df.attrs)
+
+    return df_new
+
+
+def as_float(df: pd.DataFrame) -> pd.DataFrame:
+    """Converts integer columns (including pint columns) to float, such that
+    they can hold missing values (e.g. after an outer join) and can be
+    interpolated."""
+    changed = {}
+    for position, values in enumerate(column_arrays(df)):
+        is_pint = isinstance(values, pint_pandas.PintArray)
+        data = magnitude(values) if is_pint else values
+        if isinstance(data, np.ndarray) and (data.dtype.kind in 'iu'):
+            data = data.astype(np.float64)
+        elif is_pint and isinstance(data, pandas.arrays.IntegerArray):
+            data = data.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            continue
+        if is_pint:
+            data = pint_pandas.PintArray(data, dtype=values.dtype)
+        changed[position] = data
+    if not changed:
+        return df
+
+    df = df.copy(deep=False)
+    for position, data in changed.items():
+        df.isetitem(position, data)
+    return df
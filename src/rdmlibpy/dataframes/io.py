@@ -1,7 +1,8 @@
+import io
 import logging
 import textwrap
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, cast
+from typing import Any, ClassVar, Dict, FrozenSet, List, Literal, Optional
 
 import numpy as np
 import pandas as pd
@@ -11,8 +12,14 @@ import pint_pandas.pint_array
 import pydantic
 from omegaconf import OmegaConf
 
+from .._optional import import_optional
 from .._typing import FilePath, ReadCsvBuffer, WriteBuffer
+from ..memory_cache import config_key, get_memory_cache
 from ..process import Cache, Loader, Writer
+from .arrow import read_arrow, read_parquet, write_arrow, write_parquet
+from .hdf5 import open_store, select_table
+from .selection import select_timespan
+from .units import dequantify, format_unit, quantify, split_units
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +33,13 @@ class DataFrameReadCSVBase(Loader):
     concatenate: bool = True
     date_format: str = 'ISO8601'
     parse_dates: ParseDatesType = None
+    # streaming mode: yield chunks of the given number of rows (e.g. to be
+    # reduced by `dataframe.resample`) instead of a single data frame
+    chunksize: Optional[int] = None
 
     def run(self, source: FilePath | ReadCsvBuffer, **kwargs):
+        if self.chunksize is not None:
+            return self._iter_chunks(source, **kwargs)
         if isinstance(source, FilePath):
             # load using filename (possible a glob pattern)
             data = [self._read_csv(path, **kwargs) for path in Loader.glob(source)]
@@ -38,6 +50,13 @@ class DataFrameReadCSVBase(Loader):
             # load from text buffer (e.g. file buffer or StringIO)
             return self._read_csv(source, **kwargs)
 
+    def _iter_chunks(self, source: FilePath | ReadCsvBuffer, **kwargs):
+        sources = Loader.glob(source) if isinstance(source, FilePath) else [source]
+        for path in sources:
+            with self._load(path, chunksize=self.chunksize, **kwargs) as reader:
+                for chunk in reader:
+                    yield self._parse_dates(chunk)
+
     def _read_csv(self, source: FilePath | ReadCsvBuffer, **kwargs):
         df = self._load(source, **kwargs)
         df = self._parse_dates(df)
@@ -125,6 +144,19 @@ class DataFrameReadCSV(DataFrameReadCSVBase):
 IndexHandling = bool | Literal['reset-named'] | Literal['reset']
 UnitHandling = Literal['auto', 'keep-units', 'dequantify']
 AttributesHandling = Literal['auto', 'discard']
+CSVEngine = Literal['pandas', 'pyarrow']
+
+# date formats, which can be rendered by numpy in a single vectorized call
+# (mapped to the corresponding datetime64 unit)
+ISO_DATE_FORMATS = {
+    r'%Y-%m-%dT%H:%M:%S.%f': 'us',
+    r'%Y-%m-%dT%H:%M:%S': 's',
+    r'%Y-%m-%dT%H:%M': 'm',
+    r'%Y-%m-%d': 'D',
+}
+
+# to_csv options supported by the pyarrow engine
+ARROW_CSV_OPTIONS = {'sep', 'decimal', 'date_format', 'index', 'na_rep'}
 
 
 class DataFrameWriteCSV(Writer):
@@ -138,6 +170,10 @@ class DataFrameWriteCSV(Writer):
     date_format: Optional[str] = r'%Y-%m-%dT%H:%M:%S.%f'
     units: UnitHandling = 'auto'
     attributes: AttributesHandling = 'auto'
+    chunksize: int = 100_000
+    # the pyarrow engine is considerably faster, but uses arrow's formatting of
+    # numbers (e.g. floats with integral values are written without decimals)
+    engine: CSVEngine = 'pandas'
 
     def run(
         self,
@@ -174,52 +210,330 @@ class DataFrameWriteCSV(Writer):
         )
 
         # handling of indices
-        index, source = self._handle_indices(source, kwargs.pop('index', self.index))
+        index, reset = self._handle_indices(source, kwargs.pop('index', self.index))
         write_csv_options['index'] = index
 
         # promote units to multi-index header
         match kwargs.pop('units', self.units):
             case 'auto':
-                if not source.select_dtypes('pint[]').empty:  # type: ignore
-                    source = dequantify(source)
+                with_units = not source.select_dtypes('pint[]').empty  # type: ignore
             case 'dequantify':
-                source = dequantify(source)
-            case 'keep-units':
-                pass
+                with_units = True
+            case _:
+                with_units = False
 
-        # save attributes as comment
         attributes = kwargs.pop('attributes', self.attributes)
-        if (attributes == 'auto') and source.attrs:
-            yaml = OmegaConf.to_yaml(OmegaConf.create(source.attrs))
-            buffer.write(textwrap.indent(yaml, '# '))
+        chunksize = kwargs.pop('chunksize', self.chunksize)
+        engine = kwargs.pop('engine', self.engine)
 
         # merge process configuration with runtime keyword arguments
         write_csv_options |= self.options
         write_csv_options |= kwargs
+        header = write_csv_options.pop('header', True)
+        if engine == 'pyarrow':
+            self._check_arrow_options(write_csv_options)
+
+        # save attributes as comment
+        if (attributes == 'auto') and source.attrs:
+            yaml = OmegaConf.to_yaml(OmegaConf.create(source.attrs))
+            buffer.write(textwrap.indent(yaml, '# '))
 
-        # write data to csv
-        source.to_csv(buffer, **write_csv_options)  # type: ignore
+        # collect the columns to write (without copying any data);
+        # units are promoted to the header and pint columns are replaced
+        # by their magnitudes
+        columns, arrays = self._collect_columns(source, reset, with_units)
+
+        # write data to csv (chunk by chunk)
+        for start in range(0, max(len(source), 1), chunksize):
+            stop = start + chunksize
+            chunk = self._create_chunk(
+                source, columns, arrays, start, stop, write_csv_options
+            )
+            if engine == 'pyarrow':
+                self._write_chunk_arrow(
+                    chunk, buffer, header if start == 0 else False, write_csv_options
+                )
+            else:
+                chunk.to_csv(
+                    buffer, header=header if start == 0 else False, **write_csv_options
+                )  # type: ignore
 
     def _handle_indices(self, source: pd.DataFrame, index: IndexHandling):
+        # returns a tuple of flags (write index, reset index)
         match index:
             case bool(value):
-                return value, source
+                return value, False
             case 'reset':
-                return False, source.reset_index()
+                return False, True
             case 'reset-named':
-                if source.index.name:
-                    source = source.reset_index()
-                return False, source
+                return False, bool(source.index.name)
+
+    def _collect_columns(self, source: pd.DataFrame, reset: bool, with_units: bool):
+        labels = []
+        arrays = []
+        units = []
+
+        if reset:
+            # only the index is copied when resetting an empty frame
+            reset_index = source[[]].reset_index()
+            for i, label in enumerate(reset_index.columns):
+                labels.append(label)
+                arrays.append(reset_index.iloc[:, i].array)
+                units.append(pint_pandas.pint_array.NO_UNIT)
+
+        for i, label in enumerate(source.columns):
+            values = source.iloc[:, i].array
+            labels.append(label)
+            if with_units and isinstance(values, pint_pandas.PintArray):
+                arrays.append(values.data)
+                units.append(format_unit(values.dtype))
+            else:
+                arrays.append(values)
+                units.append(pint_pandas.pint_array.NO_UNIT)
+
+        if with_units:
+            names = list(source.columns.names) + ['unit']
+            tuples = [
+                (*(label if isinstance(label, tuple) else (label,)), unit)
+                for label, unit in zip(labels, units)
+            ]
+            columns = pd.MultiIndex.from_tuples(tuples, names=names)
+        else:
+            columns = pd.Index(labels, tupleize_cols=False)
+            columns.names = source.columns.names
+
+        return columns, arrays
+
+    def _create_chunk(
+        self,
+        source: pd.DataFrame,
+        columns: pd.Index,
+        arrays: List[Any],
+        start: int,
+        stop: int,
+        options: Dict[str, Any],
+    ):
+        date_format = options.get('date_format')
+        na_rep = options.get('na_rep', '')
+
+        chunk = pd.DataFrame(
+            {
+                i: self._format_values(values[start:stop], date_format, na_rep)
+                for i, values in enumerate(arrays)
+            },
+            index=source.index[start:stop],
+            copy=False,
+        )
+        chunk.columns = columns
+        return chunk
+
+    @staticmethod
+    def _format_values(values, date_format: str | None, na_rep: str):
+        if isinstance(values, pandas.arrays.FloatingArray):  # type: ignore
+            # writing masked arrays is considerably slower than writing plain
+            # numpy arrays (missing values are written as `na_rep` in both cases)
+            return values.to_numpy(dtype=values.dtype.numpy_dtype, na_value=np.nan)
+
+        # fast path: render (timezone naive) datetime values in ISO 8601 format
+        # using numpy instead of calling strftime on each value
+        if (date_format not in ISO_DATE_FORMATS) or not (
+            isinstance(values.dtype, np.dtype) and values.dtype.kind == 'M'
+        ):
+            return values
+        values = np.asarray(values)
+        formatted = np.datetime_as_string(
+            values, unit=ISO_DATE_FORMATS[date_format]  # type: ignore
+        ).astype(object)
+        formatted[np.isnat(values)] = na_rep
+        return formatted
+
+    @staticmethod
+    def _check_arrow_options(options: Dict[str, Any]):
+        # pandas options (e.g. float_format) would be silently ignored by arrow
+        unsupported = set(options) - ARROW_CSV_OPTIONS
+        if unsupported:
+            raise ValueError(
+                'Options not supported by the pyarrow engine: '
+                + ', '.join(sorted(unsupported))
+            )
+        if options.get('decimal', '.') != '.':
+            raise ValueError(
+                'The pyarrow engine only supports "." as decimal separator'
+            )
+        if options.get('na_rep', '') != '':
+            raise ValueError(
+                'The pyarrow engine only supports empty strings for missing values'
+            )
+
+    def _write_chunk_arrow(
+        self,
+        chunk: pd.DataFrame,
+        buffer: WriteBuffer[str] | WriteBuffer[bytes],
+        header: bool,
+        options: Dict[str, Any],
+    ):
+        pa = import_optional('pyarrow', 'Writing CSV files with the pyarrow engine')
+
+        # write header using pandas (supports multi-line headers with units)
+        if header:
+            chunk.iloc[:0].to_csv(buffer, **options)  # type: ignore
+
+        # remaining datetime columns are formatted by pandas, since arrow does
+        # not support custom date formats
+        date_format = options.get('date_format')
+
+        def convert(column: pd.Series):
+            if isinstance(column.dtype, pint_pandas.PintType):
+                # quantities (with units) are written as text like pandas does,
+                # missing values are kept as nulls
+                return column.astype(str).where(column.notna(), None)
+            elif (column.dtype.kind == 'M') and date_format:
+                return column.dt.strftime(date_format)
+            else:
+                return column
+
+        data = chunk.reset_index() if options.get('index', False) else chunk
+        data = pd.DataFrame(
+            {str(i): convert(data.iloc[:, i]) for i in range(data.shape[1])},
+            copy=False,
+        )
+
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        try:
+            # only quote values if necessary (like pandas does)
+            content = self._arrow_csv(table, 'none', options)
+        except pa.ArrowInvalid:
+            content = self._arrow_csv(table, 'needed', options)
+        if isinstance(buffer, io.TextIOBase):
+            buffer.write(content.decode('utf-8'))  # type: ignore
+        else:
+            buffer.write(content)  # type: ignore
+
+    @staticmethod
+    def _arrow_csv(table, quoting_style: str, options: Dict[str, Any]) -> bytes:
+        pa = import_optional('pyarrow', 'Writing CSV files with the pyarrow engine')
+        csv = import_optional(
+            'pyarrow.csv', 'Writing CSV files with the pyarrow engine'
+        )
+
+        sink = pa.BufferOutputStream()
+        csv.write_csv(
+            table,
+            sink,
+            write_options=csv.WriteOptions(
+                include_header=False,
+                delimiter=options.get('sep', ','),
+                quoting_style=quoting_style,
+            ),
+        )
+        return sink.getvalue().to_pybytes()
+
+
+CacheFormat = Literal['hdf5', 'arrow', 'parquet']
+HDF5Layout = Literal['fixed', 'table']
 
 
 class DataFrameFileCache(Cache):
     name: str = 'dataframe.cache'
     version: str = '1'
+    format: CacheFormat = 'hdf5'
+    memory_map: bool = True
+    # the `table` layout allows reading selected columns and time ranges
+    # without loading the complete data frame
+    layout: HDF5Layout = 'fixed'
+    column: Optional[str] = None
+    # compression of HDF5 files (disabled by default)
+    complib: Optional[str] = None
+    complevel: int = 0
+    # expected number of rows of `table` layouts, from which PyTables derives
+    # the chunk shape (defaults to the number of rows)
+    expectedrows: Optional[int] = None
+
+    read_hints: ClassVar[FrozenSet[str]] = frozenset(
+        ['columns', 'column', 'start', 'stop']
+    )
+
+    def read(
+        self,
+        filename: FilePath,
+        rebuild: bool = False,
+        columns: None | List[str] = None,
+        column: Optional[str] = None,
+        start=None,
+        stop=None,
+        **kwargs,
+    ):
+        """Reads (a selection of) the cached data frame.
+
+        Args:
+            filename (FilePath): The cache file.
+            rebuild (bool, optional): Unused. Defaults to False.
+            columns (None | List[str], optional): The columns to load.
+                Defaults to None (all columns).
+            column (Optional[str], optional): The column used to select the
+                time range. Defaults to None (`column` of the cache, or the
+                index).
+            start (optional): Start of the time range (inclusive).
+            stop (optional): End of the time range (inclusive).
+
+        Returns:
+            pd.DataFrame: The cached data.
+        """
+        selection = dict(
+            columns=columns,
+            column=column if column is not None else self.column,
+            start=start,
+            stop=stop,
+        )
+
+        # repeated reads are served by the (process-wide) memory cache
+        return get_memory_cache().load(
+            filename,
+            lambda: self._read(filename, **selection),
+            config=config_key(self, **selection),
+        )
+
+    def _read(self, filename: FilePath, **selection):
+        match self.format:
+            case 'arrow':
+                return read_arrow(filename, memory_map=self.memory_map, **selection)
+            case 'parquet':
+                return read_parquet(filename, memory_map=self.memory_map, **selection)
+            case _:
+                return self._read_hdf5(filename, **selection)
 
-    def read(self, filename: FilePath, rebuild: bool = False, **kwargs):
+    def write(
+        self, source: pd.DataFrame, filename: FilePath, rebuild: bool = False, **kwargs
+    ):
+        # write to a temporary file (creating the path if necessary), which
+        # atomically replaces the cache file when complete
+        with self.atomic(filename) as tmp:
+            match self.format:
+                case 'arrow':
+                    write_arrow(source, tmp)
+                case 'parquet':
+                    write_parquet(source, tmp)
+                case _ if self.layout == 'table':
+                    self._write_hdf5_table(source, tmp)
+                case _:
+                    self._write_hdf5(source, tmp)
+        get_memory_cache().invalidate(filename)
+
+    def _read_hdf5(
+        self,
+        filename: FilePath,
+        columns: None | List[str] = None,
+        column: Optional[str] = None,
+        start=None,
+        stop=None,
+    ):
         # load data from HDF5 file
         # cached = pd.read_hdf(filename, key='data')
         with pd.HDFStore(filename, 'r') as store:
+            if store.get_storer('data').is_table:
+                # only load the selected data
+                return select_table(store, 'data', start, stop, columns, column)
+
             cached = store['data']
 
             # load attributes
@@ -234,12 +548,15 @@ class DataFrameFileCache(Cache):
         # is released
         cached = quantify(cached, level=-1)
 
+        # select data (fixed layout can't be queried)
+        cached = select_timespan(cached, column, start, stop)
+        if columns is not None:
+            cached = cached[list(columns)]
+
         # return cached data
         return cached
 
-    def write(
-        self, source: pd.DataFrame, filename: FilePath, rebuild: bool = False, **kwargs
-    ):
+    def _write_hdf5(self, source: pd.DataFrame, filename: FilePath):
         # promote units to multi-index
         df = dequantify(source)
 
@@ -252,58 +569,48 @@ class DataFrameFileCache(Cache):
             ):
                 df[col] = np.array(df[col])
 
-        # create path (if necessary)
-        self.ensure_path(filename)
-
         # write data to HDF5 file
         # source.to_hdf(filename, key='data')
-        with pd.HDFStore(filename, mode='w') as store:
+        with self._open_store(filename) as store:
             store['data'] = df
 
             # save attributes
             store.get_storer('data').attrs.my_metadata = df.attrs  # type: ignore
-            self.ensure_path(filename)
-
-    def cache_is_valid(self, filename: FilePath, rebuild: bool = False):
-        if rebuild:
-            return False
-        return Path(filename).exists()
-
-
-def dequantify(df: pd.DataFrame):
-    df_new = df.pint.dequantify()
-    df_new = cast(pd.DataFrame, df_new)
-
-    # preserve attrs dictionary
-    df_new.attrs.update(df.attrs)
-
-    return df_new
 
-
-def quantify(df, level=-1):
-    # Fix for https://github.com/hgrecco/pint-pandas/pull/217
-    # (remove once that fix is rolled out in the next release of
-    # pint-pandas)
-    df_columns = df.columns.to_frame()
-    unit_col_name = df_columns.columns[level]
-    units = df_columns[unit_col_name]
-    df_columns = df_columns.drop(columns=unit_col_name)
-
-    df_new = pd.DataFrame(
-        {
-            i: (
-                pint_pandas.PintArray(df.iloc[:, i], unit)
-                if unit != pint_pandas.pint_array.NO_UNIT
-                else df.iloc[:, i]
+    def _write_hdf5_table(self, source: pd.DataFrame, filename: FilePath):
+        # store magnitudes and keep units separately
+        df, units = split_units(source)
+
+        with self._open_store(filename) as store:
+            store.append(
+                'data',
+                df,
+                format='table',
+                data_columns=[self.column] if self.column is not None else None,
+                expectedrows=self.expectedrows,
             )
-            for i, unit in enumerate(units.values)
-        }
-    )
 
-    df_new.columns = df_columns.index.droplevel(unit_col_name)
-    df_new.index = df.index
+            # save units & attributes
+            storer_attrs = store.get_storer('data').attrs  # type: ignore
+            storer_attrs.units = units
+            storer_attrs.time_column = self.column
+            storer_attrs.my_metadata = source.attrs
+
+    def _open_store(self, filename: FilePath):
+        return open_store(
+            filename,
+            mode='w',
+            complib=self.complib,
+            complevel=self.complevel,
+        )
+
+    def cache_files(self, filename: FilePath, **kwargs):
+        return [Path(filename)]
 
-    # preserve attrs dictionary
-    df_new.attrs.update(df.attrs)
+    def invalid_reason(self, filename: FilePath, rebuild: bool = False, **kwargs):
+        return 'rebuild' if rebuild else 'missing'
 
-    return df_new
+    def cache_is_valid(self, filename: FilePath, rebuild: bool = False):
+        if rebuild:
+            return False
+        return Path(filename).exists()
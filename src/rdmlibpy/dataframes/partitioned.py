@@ -0,0 +1,212 @@
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional
+
+import numpy as np
+import pandas as pd
+from omegaconf import OmegaConf
+
+from .._typing import FilePath
+from ..process import Loader, Writer
+from .io import DataFrameFileCache
+from .selection import select_timespan
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = 'manifest.yaml'
+PARTITION_SUFFIX = '.h5'
+
+PartitionFrequency = Literal['day', 'hour']
+
+# strftime formats of the partition names (per frequency)
+_PERIOD_FORMATS = {
+    'day': r'%Y-%m-%d',
+    'hour': r'%Y-%m-%dT%H',
+}
+_PERIOD_FREQUENCIES = {
+    'day': 'D',
+    'hour': 'h',
+}
+
+
+def _sanitize(value: Any) -> str:
+    # make partition keys safe to be used as filenames
+    return re.sub(r'[^\w.\-]+', '_', str(value))
+
+
+def _timestamps(df: pd.DataFrame, column: Optional[str]) -> pd.Series:
+    if column is None:
+        return pd.Series(df.index, index=df.index)
+    else:
+        return df[column]
+
+
+def load_manifest(path: FilePath) -> Dict[str, Any]:
+    """Loads the manifest of a partitioned dataset.
+
+    Args:
+        path (FilePath): The root directory of the dataset.
+
+    Returns:
+        Dict[str, Any]: The manifest (an empty manifest if the dataset
+            does not exist yet).
+    """
+    filename = Path(path) / MANIFEST_FILENAME
+    if not filename.exists():
+        return dict(column=None, partitions=[])
+    return OmegaConf.to_object(OmegaConf.load(filename))  # type: ignore
+
+
+def save_manifest(path: FilePath, manifest: Dict[str, Any]):
+    filename = Path(path) / MANIFEST_FILENAME
+    with open(filename, 'w', encoding='utf-8') as file:
+        file.write(OmegaConf.to_yaml(OmegaConf.create(manifest)))
+
+
+class DataFrameWritePartitioned(Writer):
+    name: str = 'dataframe.write.partitioned'
+    version: str = '1'
+
+    freq: Optional[PartitionFrequency] = 'day'
+    key: Optional[str] = None
+    column: Optional[str] = None
+
+    def run(self, source: pd.DataFrame, path: FilePath, **kwargs):
+        root = Path(path)
+        root.mkdir(parents=True, exist_ok=True)
+
+        column = kwargs.pop('column', self.column)
+        manifest = load_manifest(root)
+        if manifest['partitions'] and (manifest['column'] != column):
+            raise ValueError(
+                f'The dataset uses `{manifest["column"]}` as time column; '
+                + f'cannot add partitions using `{column}`.'
+            )
+        manifest['column'] = column
+
+        # write partitions & update manifest entries
+        entries = {entry['file']: entry for entry in manifest['partitions']}
+        for key, period, part in self._partitions(source, column, **kwargs):
+            part.attrs.update(source.attrs)
+            entry = self._write_partition(root, key, period, part, column)
+            entries[entry['file']] = entry
+
+        manifest['partitions'] = sorted(
+            entries.values(), key=lambda entry: (str(entry['key']), entry['start'])
+        )
+        save_manifest(root, manifest)
+
+        # return unaltered data as input for the next process
+        return source
+
+    def _partitions(self, source: pd.DataFrame, column: Optional[str], **kwargs):
+        freq = kwargs.pop('freq', self.freq)
+        key = kwargs.pop('key', self.key)
+
+        # split by key (either a column or an entry of the attrs dictionary)
+        if key is None:
+            groups = [(None, source)]
+        elif key in source.columns:
+            groups = source.groupby(key, sort=True)
+        elif key in source.attrs:
+            groups = [(source.attrs[key], source)]
+        else:
+            raise KeyError(f'The partition key `{key}` is neither a column nor attr')
+
+        for key_value, group in groups:
+            if freq is None:
+                yield key_value, None, group
+                continue
+
+            # split by time period
+            periods = _timestamps(group, column).dt.floor(_PERIOD_FREQUENCIES[freq])
+            for period, part in group.groupby(periods.values, sort=True):
+                yield key_value, pd.Timestamp(period).strftime(
+                    _PERIOD_FORMATS[freq]
+                ), part
+
+    def _write_partition(
+        self,
+        root: Path,
+        key: Any,
+        period: Optional[str],
+        part: pd.DataFrame,
+        column: Optional[str],
+    ):
+        parts = []
+        if key is not None:
+            parts.append(_sanitize(key))
+        parts.append(period if period is not None else 'data')
+        filename = os.path.join(*parts) + PARTITION_SUFFIX
+
+        if (root / filename).exists():
+            part = self._merge(DataFrameFileCache().read(root / filename), part, column)
+
+        logger.info(f'Writing partition: {filename} ({root})')
+        DataFrameFileCache().write(part, root / filename)
+
+        timestamps = _timestamps(part, column)
+        return dict(
+            file=Path(filename).as_posix(),
+            key=None if key is None else str(key),
+            start=pd.Timestamp(timestamps.min()).isoformat(),
+            stop=pd.Timestamp(timestamps.max()).isoformat(),
+            rows=len(part),
+        )
+
+    @staticmethod
+    def _merge(existing: pd.DataFrame, part: pd.DataFrame, column: Optional[str]):
+        # rows of the existing partition within the timespan of the new rows
+        # are replaced (e.g. data written again), other rows are kept
+        timestamps = _timestamps(existing, column)
+        new = _timestamps(part, column)
+        keep = ((timestamps < new.min()) | (timestamps > new.max())).values
+        merged = pd.concat([existing[keep], part])
+        merged.attrs = existing.attrs | part.attrs
+        order = np.argsort(_timestamps(merged, column).values, kind='stable')
+        return merged.iloc[order]
+
+
+class DataFrameReadPartitioned(Loader):
+    name: str = 'dataframe.read.partitioned'
+    version: str = '1'
+
+    def run(
+        self,
+        source: FilePath,
+        start=None,
+        stop=None,
+        key: None | str | List[str] = None,
+    ):
+        start = None if start is None else np.datetime64(start)
+        stop = None if stop is None else np.datetime64(stop)
+        keys = None if key is None else [str(k) for k in np.atleast_1d(key)]
+
+        frames = []
+        for root in Loader.glob(source):
+            manifest = load_manifest(root)
+            column = manifest['column']
+            for entry in manifest['partitions']:
+                if not self._is_selected(entry, start, stop, keys):
+                    continue
+                logger.info(f'Loading partition: {entry["file"]} ({root})')
+                df = DataFrameFileCache().read(root / entry['file'])
+                frames.append(select_timespan(df, column, start, stop))
+
+        if not frames:
+            raise FileNotFoundError(
+                f'No partitions found matching the selection in: {source}'
+            )
+        return pd.concat(frames)
+
+    @staticmethod
+    def _is_selected(entry, start, stop, keys):
+        if (keys is not None) and (entry['key'] not in keys):
+            return False
+        if (start is not None) and (np.datetime64(entry['stop']) < start):
+            return False
+        if (stop is not None) and (np.datetime64(entry['start']) > stop):
+            return False
+        return True
@@ -0,0 +1,122 @@
+import threading
+import weakref
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+import pydantic
+
+
+class FrameProperties(pydantic.BaseModel):
+    """Known properties of a data frame (None if unknown), which allow the
+    following processes to skip redundant checks and sorts.
+    """
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    # index sorted in ascending order
+    index_sorted: Optional[bool] = None
+    # index without duplicates
+    index_unique: Optional[bool] = None
+    # columns sorted in ascending order
+    sorted_columns: Tuple[str, ...] = ()
+    # regular frequency of the index (e.g. `1s`)
+    freq: Optional[str] = None
+
+
+# properties by id of the data frame; entries are removed when the data frame
+# is garbage collected (ids may be reused afterwards)
+_registry: Dict[int, FrameProperties] = {}
+_lock = threading.Lock()
+
+
+def _discard(key: int):
+    with _lock:
+        _registry.pop(key, None)
+
+
+def get_properties(df: pd.DataFrame) -> FrameProperties:
+    """Returns the known properties of a data frame."""
+    with _lock:
+        return _registry.get(id(df), FrameProperties())
+
+
+def set_properties(df: pd.DataFrame, **properties) -> pd.DataFrame:
+    """Records properties of a data frame (merged with the known properties).
+    The properties describe the data frame as returned by a process; processes
+    replacing columns in place must discard their properties (see
+    `replace_columns`).
+
+    Returns:
+        pd.DataFrame: The data frame.
+    """
+    key = id(df)
+    with _lock:
+        known = _registry.get(key)
+        if known is None:
+            weakref.finalize(df, _discard, key)
+            known = FrameProperties()
+        _registry[key] = known.model_copy(update=properties)
+    return df
+
+
+def replace_columns(df: pd.DataFrame, columns: Iterable[Any]) -> pd.DataFrame:
+    """Discards the known properties of columns which are replaced in place
+    (e.g. by assigning new values), such that stale properties (e.g. sorted
+    order) are not trusted by the following processes.
+
+    Returns:
+        pd.DataFrame: The data frame.
+    """
+    known = get_properties(df)
+    if not known.sorted_columns:
+        return df
+    replaced = set(columns)
+    remaining = tuple(col for col in known.sorted_columns if col not in replaced)
+    if remaining != known.sorted_columns:
+        set_properties(df, sorted_columns=remaining)
+    return df
+
+
+def is_sorted(df: pd.DataFrame, column: Optional[str] = None) -> bool:
+    """Returns True if the index (or a column) is sorted in ascending order.
+    Unknown properties are checked (linear scan), but not recorded: the data
+    frame may be modified in place afterwards, only properties set by the
+    process creating the data frame (or declared explicitly) are trusted."""
+    properties = get_properties(df)
+    if column is None:
+        if properties.index_sorted is not None:
+            return properties.index_sorted
+        # the (immutable) index caches the result itself
+        return df.index.is_monotonic_increasing
+
+    if column in properties.sorted_columns:
+        return True
+    return pd.Index(df[column]).is_monotonic_increasing
+
+
+def is_unique(df: pd.DataFrame) -> bool:
+    """Returns True if the index has no duplicates (checked, but not recorded,
+    if unknown; see `is_sorted`)."""
+    properties = get_properties(df)
+    if properties.index_unique is not None:
+        return properties.index_unique
+    return df.index.is_unique
+
+
+def sort_index(df: pd.DataFrame) -> pd.DataFrame:
+    """Returns the data frame sorted by its index (the data frame itself, if
+    it is known or found to be sorted)."""
+    if is_sorted(df):
+        return df
+    return set_properties(df.sort_index(kind='stable'), index_sorted=True)
+
+
+def derive_properties(df: pd.DataFrame, source: pd.DataFrame, **properties):
+    """Records the properties of a data frame derived from another one by
+    selecting rows (in order) and/or columns, e.g. a time slice."""
+    known = get_properties(source)
+    inherited = known.model_dump(exclude={'sorted_columns'})
+    inherited['sorted_columns'] = tuple(
+        column for column in known.sorted_columns if column in df.columns
+    )
+    return set_properties(df, **(inherited | properties))
@@ -0,0 +1,261 @@
+from typing import Any, Dict, Iterable, List, Literal, Mapping, Optional, Tuple, cast
+
+import numpy as np
+import pandas as pd
+import pint_pandas
+
+from ..process import Transform
+from .alignment import from_time_base, grid_step
+from .interpolation import as_float, float_magnitudes, time_base
+from .properties import set_properties
+from .units import column_arrays
+
+Aggregation = Literal['mean', 'min', 'max', 'last', 'count']
+
+# partial aggregates (states) required by each aggregation
+_STATES: Dict[str, List[str]] = dict(
+    mean=['sum', 'count'],
+    min=['min'],
+    max=['max'],
+    last=['last'],
+    count=['count'],
+)
+
+
+def _reduce_bins(
+    codes: np.ndarray, states: List[Dict[str, Any]]
+) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+    # combines the states of rows (or partial aggregates) with identical bin
+    # codes; rows are sorted by their code first (stable, keeps the order of
+    # the rows within each bin); a count of None counts all rows
+    if (len(codes) > 1) and (np.diff(codes) < 0).any():
+        order = np.argsort(codes, kind='stable')
+        codes = codes[order]
+        states = [
+            {
+                key: None if v is None else pd.api.extensions.take(v, order)
+                for key, v in state.items()
+            }
+            for state in states
+        ]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    sizes = np.diff(np.r_[starts, len(codes)])
+
+    reduced = []
+    for state in states:
+        result: Dict[str, Any] = {}
+        for key, values in state.items():
+            match key:
+                case 'count' if values is None:
+                    result[key] = sizes
+                case 'sum' | 'count':
+                    result[key] = np.add.reduceat(values, starts)
+                case 'min':
+                    result[key] = np.fmin.reduceat(values, starts)
+                case 'max':
+                    result[key] = np.fmax.reduceat(values, starts)
+                case 'last':
+                    # last valid value of each bin
+                    positions = np.where(pd.isna(values), -1, np.arange(len(values)))
+                    result[key] = pd.api.extensions.take(
+                        values, np.maximum.reduceat(positions, starts), allow_fill=True
+                    )
+        reduced.append(result)
+    return codes[starts], reduced
+
+
+class BinAggregator:
+    """Aggregates the rows of data frames within time bins of a fixed width.
+    The data frames may be passed in chunks (e.g. while reading a large file),
+    only the partial aggregates of each chunk are kept. Bins spanning several
+    chunks are combined, when the result is created.
+
+    Units of pint columns are kept (except for counts). Columns that are not
+    numeric only support the aggregations `last` and `count`.
+    """
+
+    def __init__(
+        self,
+        freq: str | float,
+        how: Aggregation = 'mean',
+        aggregations: Optional[Mapping[Any, Aggregation]] = None,
+        column: Optional[str] = None,
+    ):
+        self.freq = freq
+        self.how = how
+        self.aggregations = dict(aggregations or {})
+        self.column = column
+        self._step: Optional[int | float] = None
+        self._index: Optional[pd.Index] = None
+        self._first: Optional[pd.DataFrame] = None
+        self._codes: List[np.ndarray] = []
+        self._states: List[List[Dict[str, Any]]] = []
+
+    def update(self, df: pd.DataFrame):
+        """Adds the rows of a data frame (chunk)."""
+        index = df.index if self.column is None else pd.Index(df[self.column])
+        df = as_float(df)
+        if self._first is None:
+            # empty data frame with the columns, types and attrs of the result
+            self._first = df.iloc[:0]
+            if self.column is not None:
+                self._first = self._first.drop(columns=self.column)
+            self._index = index[:0]
+            self._step = grid_step(index, self.freq)
+        if len(df) == 0:
+            return
+
+        codes = time_base(index) // self._step
+        states = [
+            self._initial_state(label, values)
+            for label, values in zip(df.columns, column_arrays(df))
+            if label != self.column
+        ]
+        codes, states = _reduce_bins(codes, states)
+        self._codes.append(codes)
+        self._states.append(states)
+
+    def result(self) -> pd.DataFrame:
+        """Returns the aggregated data frame (one row per bin with values)."""
+        if self._first is None:
+            raise ValueError('No data to aggregate.')
+        df = self._first
+        if self._codes:
+            codes, states = _reduce_bins(
+                np.concatenate(self._codes),
+                [
+                    {
+                        key: np.concatenate([part[i][key] for part in self._states])
+                        for key in state
+                    }
+                    for i, state in enumerate(self._states[0])
+                ],
+            )
+        else:
+            codes = np.array([], dtype=np.int64)
+            states = [
+                self._initial_state(label, values)
+                for label, values in zip(df.columns, column_arrays(df))
+            ]
+
+        index = from_time_base(codes * self._step, [cast(pd.Index, self._index)])
+        df_new = pd.DataFrame(
+            {
+                position: self._finalize(values, state, self._aggregation(label))
+                for position, (label, values, state) in enumerate(
+                    zip(df.columns, column_arrays(df), states)
+                )
+            },
+            index=index if self.column is None else None,
+            copy=False,
+        )
+        df_new.columns = df.columns
+        if self.column is not None:
+            df_new.insert(0, self.column, index)
+
+        # preserve attrs dictionary
+        df_new.attrs.update(df.attrs)
+
+        # one row per bin (in order)
+        if self.column is None:
+            return set_properties(df_new, index_sorted=True, index_unique=True)
+        return set_properties(df_new, sorted_columns=(self.column,))
+
+    def _aggregation(self, label) -> Aggregation:
+        return self.aggregations.get(label, self.how)
+
+    def _initial_state(self, label, values) -> Dict[str, Any]:
+        how = self._aggregation(label)
+        if how not in _STATES:
+            raise ValueError(f'Invalid aggregation: {how}')
+        magnitudes = float_magnitudes(values)
+        if magnitudes is None:
+            if how not in ('last', 'count'):
+                raise ValueError(f'Cannot aggregate column `{label}` by {how}')
+            magnitudes = values
+        missing = pd.isna(magnitudes)
+        valid = ~missing if missing.any() else None
+
+        state: Dict[str, Any] = {}
+        for key in _STATES[how]:
+            match key:
+                case 'sum':
+                    state[key] = (
+                        magnitudes
+                        if valid is None
+                        else np.where(valid, magnitudes, 0.0)
+                    )
+                case 'count':
+                    state[key] = None if valid is None else valid.astype(np.int64)
+                case _:
+                    state[key] = magnitudes
+        return state
+
+    @staticmethod
+    def _finalize(values, state: Dict[str, Any], how: Aggregation) -> Any:
+        if how == 'count':
+            return state['count']
+        elif how == 'mean':
+            counts = state['count']
+            result = np.divide(
+                state['sum'],
+                counts,
+                out=np.full(len(counts), np.nan),
+                where=counts > 0,
+            )
+        else:
+            result = state[how]
+        if isinstance(values, pint_pandas.PintArray):
+            result = pint_pandas.PintArray(result, dtype=values.dtype)
+        return result
+
+
+def resample(
+    source: pd.DataFrame | Iterable[pd.DataFrame],
+    freq: str | float,
+    how: Aggregation = 'mean',
+    aggregations: Optional[Mapping[Any, Aggregation]] = None,
+    column: Optional[str] = None,
+) -> pd.DataFrame:
+    """Aggregates the rows of a data frame (or an iterable of chunks) within
+    time bins of a fixed width (see `BinAggregator`). The bins are labeled by
+    their start (multiples of the bin width)."""
+    aggregator = BinAggregator(freq, how, aggregations, column)
+    if isinstance(source, pd.DataFrame):
+        aggregator.update(source)
+    else:
+        for chunk in source:
+            aggregator.update(chunk)
+    return aggregator.result()
+
+
+class DataFrameResample(Transform):
+    name: str = 'dataframe.resample'
+    version: str = '1'
+
+    def run(
+        self,
+        source: pd.DataFrame | Iterable[pd.DataFrame],
+        freq: str | float,
+        how: Aggregation = 'mean',
+        aggregations: Optional[Mapping[str, Aggregation]] = None,
+        column: Optional[str] = None,
+    ):
+        """Downsamples a data frame by aggregating the rows within time bins
+        (e.g. per second or per minute). Data frames read in chunks (e.g. by
+        a CSV loader with `chunksize`) are aggregated chunk by chunk.
+
+        Args:
+            source (pd.DataFrame | Iterable[pd.DataFrame]): The data frame or
+                its chunks.
+            freq (str | float): The width of the bins, e.g. `1s` or `1min`.
+            how (Aggregation, optional): The default aggregation (`mean`,
+                `min`, `max`, `last` or `count`). Defaults to 'mean'.
+            aggregations (Mapping[str, Aggregation], optional): Aggregations
+                of individual columns. Defaults to None.
+            column (str, optional): The time column. Defaults to None (index).
+
+        Returns:
+            pd.DataFrame: The aggregated data frame.
+        """
+        return resample(source, freq, how, aggregations, column)
@@ -1,9 +1,153 @@
-from typing import Dict, List, Mapping, Sequence
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
 from ..process import Transform
+from .properties import derive_properties, get_properties, is_sorted, set_properties
+
+
+def select_timespan(
+    source: pd.DataFrame,
+    column: Optional[str],
+    start=None,
+    stop=None,
+    assume_sorted: Optional[bool] = None,
+) -> pd.DataFrame:
+    """Selects the rows within the time range [start, stop] (inclusive).
+
+    Rows of data frames sorted by time are located by binary search and
+    returned as a positional slice (without copying the data); otherwise the
+    rows are selected by a boolean mask.
+
+    Args:
+        source (pd.DataFrame): The data frame.
+        column (Optional[str]): The time column (None selects by index).
+        start (optional): Start of the time range. Defaults to None (open).
+        stop (optional): End of the time range. Defaults to None (open).
+        assume_sorted (Optional[bool]): Whether the time column (or index) is
+            sorted in ascending order. Defaults to None (detected).
+
+    Returns:
+        pd.DataFrame: The selected rows.
+    """
+    if (start is None) and (stop is None):
+        return source
+
+    col = source.index if column is None else source[column]
+    if assume_sorted is None:
+        # known or checked once (linear scan), still cheaper than the masks
+        assume_sorted = is_sorted(source, column)
+    if assume_sorted:
+        first = 0 if start is None else col.searchsorted(np.datetime64(start), 'left')
+        last = (
+            len(source)
+            if stop is None
+            else col.searchsorted(np.datetime64(stop), 'right')
+        )
+        return _sorted_slice(source, column, first, last)
+
+    mask = np.full(len(source), True)
+    if start is not None:
+        mask &= np.asarray(np.datetime64(start) <= col)
+    if stop is not None:
+        mask &= np.asarray(col <= np.datetime64(stop))
+    return source.loc[mask]
+
+
+def _sorted_slice(
+    source: pd.DataFrame, column: Optional[str], first: int, last: int
+) -> pd.DataFrame:
+    # rows of a data frame sorted by time, which stay sorted
+    df = derive_properties(source.iloc[first:last], source)
+    if column is None:
+        return set_properties(df, index_sorted=True)
+    sorted_columns = get_properties(df).sorted_columns
+    if column not in sorted_columns:
+        set_properties(df, sorted_columns=(*sorted_columns, column))
+    return df
+
+
+def _named_intervals(intervals: Mapping | Sequence) -> Dict[Any, Tuple[Any, Any]]:
+    # returns the (start, stop) tuples of named time intervals; intervals are
+    # mappings with `start` & `stop` (and `name`) items or (start, stop) pairs
+    def bounds(interval):
+        if isinstance(interval, Mapping):
+            return interval.get('start'), interval.get('stop')
+        start, stop = interval
+        return start, stop
+
+    if isinstance(intervals, Mapping):
+        return {name: bounds(interval) for name, interval in intervals.items()}
+
+    named: Dict[Any, Tuple[Any, Any]] = {}
+    for position, interval in enumerate(intervals):
+        name = position
+        if isinstance(interval, Mapping):
+            name = interval.get('name', position)
+        if name in named:
+            raise ValueError(f'Duplicate interval name: {name}')
+        named[name] = bounds(interval)
+    return named
+
+
+def select_timespans(
+    source: pd.DataFrame,
+    column: Optional[str],
+    intervals: Mapping | Sequence,
+    assume_sorted: Optional[bool] = None,
+) -> Dict[Any, pd.DataFrame]:
+    """Selects the rows within multiple (named) time ranges [start, stop]
+    (inclusive, see `select_timespan`). The time column is scanned (or sorted)
+    only once for all intervals, which are then located by binary search.
+
+    Args:
+        source (pd.DataFrame): The data frame.
+        column (Optional[str]): The time column (None selects by index).
+        intervals (Mapping | Sequence): The intervals by name (mappings with
+            `start` and `stop` items or (start, stop) pairs) or a list of
+            intervals (named by an optional `name` item or their position).
+        assume_sorted (Optional[bool]): Whether the time column (or index) is
+            sorted in ascending order. Defaults to None (detected).
+
+    Returns:
+        Dict[Any, pd.DataFrame]: The selected rows of each interval.
+    """
+    named = _named_intervals(intervals)
+    col = source.index if column is None else pd.Index(source[column])
+    if assume_sorted is None:
+        assume_sorted = is_sorted(source, column)
+
+    order = None
+    if not assume_sorted:
+        order = np.argsort(np.asarray(col), kind='stable')
+        col = col[order]
+
+    frames = {}
+    for name, (start, stop) in named.items():
+        first = 0 if start is None else col.searchsorted(np.datetime64(start), 'left')
+        last = (
+            len(col) if stop is None else col.searchsorted(np.datetime64(stop), 'right')
+        )
+        if order is None:
+            frames[name] = _sorted_slice(source, column, first, last)
+        else:
+            # keep the original order of the rows
+            frames[name] = source.iloc[np.sort(order[first:last])]
+    return frames
+
+
+def concat_timespans(frames: Mapping[Any, pd.DataFrame], label: str) -> pd.DataFrame:
+    """Concatenates the selected rows of multiple intervals and labels them by
+    the name of their interval (categorical column `label`)."""
+    if not frames:
+        raise ValueError('No time intervals to concatenate.')
+    df = pd.concat(list(frames.values()))
+    codes = np.repeat(np.arange(len(frames)), [len(f) for f in frames.values()])
+    df.insert(
+        0, label, pd.Categorical.from_codes(codes, categories=list(frames.keys()))
+    )
+    return df
 
 
 class SelectColumns(Transform):
@@ -15,31 +159,105 @@ class SelectColumns(Transform):
         source: pd.DataFrame,
         select: None | str | List[str] | Dict[str, str] = None,
     ):
+        # selected columns are views of the source in copy-on-write mode
         if isinstance(select, str):
-            return source[[select]]
+            return derive_properties(source[[select]], source)
         elif isinstance(select, Sequence):
-            return source[list(select)]
+            return derive_properties(source[list(select)], source)
         elif isinstance(select, Mapping):
-            return source[list(select.keys())].rename(columns=dict(select))
+            # rename the columns of the selection (instead of copying it again)
+            df = source[list(select.keys())]
+            df.columns = pd.Index(list(select.values()))
+            return df
         else:
             return source
 
+    def pushdown(
+        self, select: None | str | List[str] | Dict[str, str] = None
+    ) -> Optional[Dict[str, Any]]:
+        if isinstance(select, str):
+            return dict(columns=[select])
+        elif isinstance(select, Sequence):
+            return dict(columns=list(select))
+        elif isinstance(select, Mapping):
+            # renamed columns can't be passed on to preceding processes
+            return None
+        else:
+            return {}
+
 
 class SelectTimespan(Transform):
     name: str = 'dataframe.select.timespan'
     version: str = '1'
 
-    def run(self, source: pd.DataFrame, column: str, start=None, stop=None):
-        col = source[column]
-        if (start is not None) and (stop is not None):
-            start = np.datetime64(start)
-            stop = np.datetime64(stop)
-            return source.loc[(start <= col) & (col <= stop)]
-        elif start is None:
-            stop = np.datetime64(stop)
-            return source.loc[col <= stop]
-        elif stop is None:
-            start = np.datetime64(start)
-            return source.loc[start <= col]
-        else:
-            return source
+    def run(
+        self,
+        source: pd.DataFrame,
+        column: str,
+        start=None,
+        stop=None,
+        assume_sorted: Optional[bool] = None,
+    ):
+        return select_timespan(source, column, start, stop, assume_sorted)
+
+    def pushdown(
+        self, column: str, start=None, stop=None, assume_sorted=None
+    ) -> Dict[str, Any]:
+        return dict(column=column, start=start, stop=stop)
+
+
+class SelectTimespans(Transform):
+    name: str = 'dataframe.select.timespans'
+    version: str = '1'
+
+    def run(
+        self,
+        source: pd.DataFrame,
+        column: str,
+        intervals: Mapping | Sequence,
+        combine: bool = False,
+        label: str = 'step',
+        assume_sorted: Optional[bool] = None,
+    ):
+        """Selects the rows within multiple time intervals (e.g. the steps of
+        an experiment from the metadata) in a single pass.
+
+        Args:
+            source (pd.DataFrame): The data frame.
+            column (str): The time column (None selects by index).
+            intervals (Mapping | Sequence): The (named) intervals, see
+                `select_timespans`.
+            combine (bool, optional): Return a single data frame with a label
+                column instead of a data frame per interval. Defaults to False.
+            label (str, optional): Name of the label column. Defaults to 'step'.
+            assume_sorted (Optional[bool]): Whether the time column (or index)
+                is sorted. Defaults to None (detected).
+
+        Returns:
+            Dict[Any, pd.DataFrame] | pd.DataFrame: The selected rows by name
+                of the interval (or combined).
+        """
+        frames = select_timespans(source, column, intervals, assume_sorted)
+        if combine:
+            return concat_timespans(frames, label)
+        return frames
+
+    def pushdown(
+        self,
+        column: str,
+        intervals: Mapping | Sequence,
+        combine: bool = False,
+        label: str = 'step',
+        assume_sorted=None,
+    ) -> Dict[str, Any]:
+        # load the time range covering all intervals
+        bounds = list(_named_intervals(intervals).values())
+        if not bounds:
+            return dict(column=column)
+        starts = [start for start, _ in bounds]
+        stops = [stop for _, stop in bounds]
+        return dict(
+            column=column,
+            start=None if None in starts else min(starts, key=np.datetime64),
+            stop=None if None in stops else max(stops, key=np.datetime64),
+        )
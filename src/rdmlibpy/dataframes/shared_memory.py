@@ -0,0 +1,216 @@
+import pickle
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pandas.arrays
+import pint_pandas
+import pydantic
+
+from ..shared_memory import SharedMemoryArena, SharedSegment, attach_segment, get_arena
+from ..workflow import WorkflowDescriptorType, run
+from .units import column_arrays, format_unit, magnitude
+
+# alignment (in bytes) of the arrays within a segment
+ALIGNMENT = 64
+
+# numpy dtype kinds placed in shared memory (others are pickled)
+SHARED_KINDS = 'biufcmM'
+
+
+class SharedArray(pydantic.BaseModel):
+    dtype: str
+    offset: int
+    # position of the column (None for the index)
+    position: Optional[int] = None
+    unit: Optional[str] = None
+
+
+class SharedFrame(SharedSegment):
+    """Descriptor of a data frame placed in a shared memory segment. The
+    descriptor is small and cheap to pickle (e.g. to pass it to or from a
+    worker process). Columns that can't be shared (e.g. strings) are pickled
+    along with the column labels and attrs (`header`)."""
+
+    nrows: int
+    arrays: List[SharedArray]
+    header: bytes
+
+
+def _shareable(values: Any) -> Tuple[Optional[np.ndarray], Optional[str]]:
+    # returns the numpy array (and unit) of a column, if it can be shared
+    unit = None
+    if isinstance(values, pint_pandas.PintArray):
+        unit = format_unit(values.dtype)
+        values = magnitude(values)
+    if isinstance(
+        values,
+        (
+            pandas.arrays.NumpyExtensionArray,
+            pandas.arrays.DatetimeArray,
+            pandas.arrays.TimedeltaArray,
+        ),
+    ) and (getattr(values, 'tz', None) is None):
+        # no copy for numpy backed arrays
+        values = np.asarray(values)
+    if isinstance(values, np.ndarray) and (values.dtype.kind in SHARED_KINDS):
+        return values, unit
+    return None, None
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def share_frame(
+    df: pd.DataFrame, arena: Optional[SharedMemoryArena] = None
+) -> SharedFrame:
+    """Copies the numeric columns (and index) of a data frame into a shared
+    memory segment (a single copy) and returns its descriptor. Units of pint
+    columns are kept.
+
+    Args:
+        df (pd.DataFrame): The data frame.
+        arena (SharedMemoryArena, optional): The arena owning the segment.
+            Defaults to None (arena of the current context, see
+            `shared_memory_arena`).
+
+    Returns:
+        SharedFrame: The descriptor (see `attach_frame`).
+    """
+    if arena is None:
+        arena = get_arena()
+
+    shared: List[Tuple[SharedArray, np.ndarray]] = []
+    other: Dict[int, Any] = {}
+    offset = 0
+
+    def add(values: np.ndarray, **kwargs):
+        nonlocal offset
+        offset = _aligned(offset)
+        shared.append(
+            (SharedArray(dtype=values.dtype.str, offset=offset, **kwargs), values)
+        )
+        offset += values.nbytes
+
+    for position, values in enumerate(column_arrays(df)):
+        array, unit = _shareable(values)
+        if array is None:
+            other[position] = values
+        else:
+            add(array, position=position, unit=unit)
+
+    index = df.index
+    share_index = not isinstance(index, (pd.RangeIndex, pd.MultiIndex))
+    if share_index:
+        array, _ = _shareable(index.array)
+        share_index = array is not None
+        if share_index:
+            add(array)
+
+    segment = arena.allocate(offset)
+    for descriptor, values in shared:
+        target = segment[descriptor.offset : descriptor.offset + values.nbytes]
+        target.view(values.dtype)[:] = values
+    filename = str(segment.filename)
+    segment.flush()
+    del segment
+
+    header = dict(
+        columns=df.columns,
+        index=None if share_index else index,
+        index_name=index.name,
+        freq=getattr(index, 'freq', None),
+        other=other,
+        attrs=df.attrs,
+    )
+    return SharedFrame(
+        filename=filename,
+        nrows=len(df),
+        arrays=[descriptor for descriptor, _ in shared],
+        header=pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL),
+    )
+
+
+def attach_frame(descriptor: SharedFrame, release: bool = True) -> pd.DataFrame:
+    """Reconstructs a data frame from a shared memory segment without copying
+    the data (including units and attrs). The columns are private copy-on-write
+    mappings of the segment.
+
+    Args:
+        descriptor (SharedFrame): The descriptor (see `share_frame`).
+        release (bool, optional): Removes the segment after mapping it, which
+            hands the lifetime of the data over to the returned data frame.
+            Use False if the segment is attached by multiple processes (it is
+            then released by the arena that created it). Defaults to True.
+
+    Returns:
+        pd.DataFrame: The data frame.
+    """
+    header = pickle.loads(descriptor.header)
+    segment = attach_segment(descriptor.filename)
+    if release:
+        get_arena().release(descriptor.filename)
+
+    def view(shared: SharedArray) -> np.ndarray:
+        dtype = np.dtype(shared.dtype)
+        stop = shared.offset + descriptor.nrows * dtype.itemsize
+        # plain ndarray (view of the map) to avoid memmap subclass semantics
+        return np.asarray(segment[shared.offset : stop]).view(dtype)
+
+    arrays: Dict[int, Any] = dict(header['other'])
+    index = header['index']
+    dtypes: Dict[str, pint_pandas.PintType] = {}
+    for shared in descriptor.arrays:
+        values = view(shared)
+        if shared.position is None:
+            index = pd.Index(values, name=header['index_name'], copy=False)
+            if header['freq'] is not None:
+                index.freq = header['freq']
+            continue
+        if shared.unit is not None:
+            if shared.unit not in dtypes:
+                dtypes[shared.unit] = pint_pandas.PintType(shared.unit)
+            values = pint_pandas.PintArray(values, dtype=dtypes[shared.unit])
+        arrays[shared.position] = values
+
+    df = pd.DataFrame(
+        {position: arrays[position] for position in range(len(arrays))},
+        index=index,
+        copy=False,
+    )
+    df.columns = header['columns']
+
+    # preserve attrs dictionary
+    df.attrs.update(header['attrs'])
+
+    return df
+
+
+def run_workflow(
+    descriptor: WorkflowDescriptorType, copy_on_write: bool = False
+) -> Any:
+    """Runs a workflow (e.g. submitted to a worker process started within
+    `shared_memory_workers`) and places a resulting data frame in shared
+    memory instead of pickling it.
+
+    Args:
+        descriptor (WorkflowDescriptorType): The workflow descriptor.
+        copy_on_write (bool, optional): Run in copy-on-write mode. Defaults to
+            False.
+
+    Returns:
+        Any: The result (a `SharedFrame` for data frames, see `attach_result`).
+    """
+    result = run(descriptor, copy_on_write=copy_on_write)
+    if isinstance(result, pd.DataFrame):
+        return share_frame(result)
+    return result
+
+
+def attach_result(result: Any) -> Any:
+    """Attaches a data frame returned by `run_workflow` (releasing its segment);
+    other results are returned unaltered."""
+    if isinstance(result, SharedFrame):
+        return attach_frame(result)
+    return result
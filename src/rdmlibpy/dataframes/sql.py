@@ -0,0 +1,374 @@
+import contextlib
+import json
+import logging
+import pickle
+import sqlite3
+from typing import Any, Dict, List, Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+from .._typing import FilePath
+from ..process import Loader, Writer
+from .properties import set_properties
+from .units import apply_units, split_units
+
+logger = logging.getLogger(__name__)
+
+IfExists = Literal['append', 'replace', 'fail']
+
+# metadata tables (units, column types and attrs of the stored data frames)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS _rdmlibpy_tables (
+    tbl TEXT PRIMARY KEY,
+    time_column TEXT,
+    is_index INTEGER,
+    key_column TEXT
+);
+CREATE TABLE IF NOT EXISTS _rdmlibpy_columns (
+    tbl TEXT,
+    col TEXT,
+    unit TEXT,
+    kind TEXT,
+    PRIMARY KEY (tbl, col)
+);
+CREATE TABLE IF NOT EXISTS _rdmlibpy_attrs (
+    tbl TEXT,
+    key TEXT,
+    attrs BLOB,
+    PRIMARY KEY (tbl, key)
+);
+"""
+
+# datetime columns are stored as int64 (ns since epoch, UTC for timezone-aware
+# columns), the timezone is appended to the kind (e.g. `datetime:UTC`)
+DATETIME_KIND = 'datetime'
+
+
+def _datetime_kind(dtype) -> str:
+    tz = getattr(dtype, 'tz', None)
+    return DATETIME_KIND if tz is None else f'{DATETIME_KIND}:{tz}'
+
+
+def _timezone(kind: Optional[str]) -> Optional[str]:
+    # timezone of a column of the given kind (None if not timezone-aware)
+    if (kind is None) or not kind.startswith(DATETIME_KIND + ':'):
+        return None
+    return kind[len(DATETIME_KIND) + 1 :]
+
+
+def _nanoseconds(value, tz: Optional[str]) -> int:
+    # the stored value of a timestamp (naive timestamps are assumed to be in
+    # the timezone of the column)
+    timestamp = pd.Timestamp(value)
+    if (tz is not None) and (timestamp.tz is None):
+        timestamp = timestamp.tz_localize(tz)
+    if timestamp.tz is not None:
+        timestamp = timestamp.tz_convert('UTC').tz_localize(None)
+    return int(timestamp.as_unit('ns').value)
+
+
+def _quote(identifier: str) -> str:
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+
+@contextlib.contextmanager
+def _connect(filename: FilePath):
+    # the context manager of sqlite3 connections only handles transactions
+    con = sqlite3.connect(filename)
+    try:
+        with con:
+            yield con
+    finally:
+        con.close()
+
+
+class DataFrameWriteSQL(Writer):
+    name: str = 'dataframe.write.sql'
+    version: str = '1'
+
+    table: str = 'data'
+    column: Optional[str] = 'timestamp'
+    key: Optional[str] = None
+    if_exists: IfExists = 'append'
+    chunksize: int = 10_000
+
+    def run(self, source: pd.DataFrame, filename: FilePath, **kwargs):
+        table = kwargs.pop('table', self.table)
+        column = kwargs.pop('column', self.column)
+        key = kwargs.pop('key', self.key)
+        if_exists = kwargs.pop('if_exists', self.if_exists)
+
+        # store time index as regular column
+        is_index = column is None
+        df = source
+        if is_index:
+            column = df.index.name or 'timestamp'
+            df = df.reset_index(names=column)
+
+        # store magnitudes and keep units separately
+        df, units = split_units(df)
+
+        # store the key (from attrs) in a separate column to allow selecting
+        # data of individual experiments
+        key_value = None
+        if key is not None:
+            key_value = str(source.attrs[key])
+            df.insert(0, key, key_value)
+
+        # store datetime values as int64 (ns since epoch)
+        kinds = {}
+        for col in df.columns:
+            if df[col].dtype.kind == 'M':
+                kinds[col] = _datetime_kind(df[col].dtype)
+                df[col] = df[col].values.astype('datetime64[ns]').view('int64')
+
+        filename = self.ensure_path(filename)
+        with _connect(filename) as con:
+            con.executescript(_SCHEMA)
+            exists = self._table_exists(con, table)
+            if exists and (if_exists == 'fail'):
+                raise ValueError(f'Table `{table}` already exists')
+            elif exists and (if_exists == 'replace'):
+                self._drop(con, table)
+            elif exists:
+                self._validate(con, table, units, kinds, column, key)
+
+            logger.info(f'Inserting {len(df)} rows into table: {table} ({filename})')
+            df.to_sql(
+                table,
+                con,
+                if_exists='append',
+                index=False,
+                chunksize=kwargs.pop('chunksize', self.chunksize),
+                **kwargs,
+            )
+            self._save_metadata(
+                con, table, df, units, kinds, column, is_index, key, key_value
+            )
+
+            # index the time column (for queries across keys) and the key
+            # with the time column (for queries of individual keys)
+            indices = {f'ix_{table}_time': [column]}
+            if key is not None:
+                indices[f'ix_{table}_key_time'] = [key, column]
+            for name, index_columns in indices.items():
+                con.execute(
+                    f'CREATE INDEX IF NOT EXISTS {_quote(name)} ON {_quote(table)} '
+                    + f'({", ".join(map(_quote, index_columns))})'
+                )
+
+        # return unaltered data as input for the next process
+        return source
+
+    @staticmethod
+    def _table_exists(con: sqlite3.Connection, table: str):
+        cursor = con.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table,)
+        )
+        return cursor.fetchone() is not None
+
+    @staticmethod
+    def _drop(con: sqlite3.Connection, table: str):
+        con.execute(f'DROP TABLE {_quote(table)}')
+        for meta in ['_rdmlibpy_tables', '_rdmlibpy_columns', '_rdmlibpy_attrs']:
+            con.execute(f'DELETE FROM {meta} WHERE tbl=?', (table,))
+
+    @staticmethod
+    def _validate(con: sqlite3.Connection, table: str, units, kinds, column, key):
+        stored_kinds = dict(
+            con.execute(
+                'SELECT col, kind FROM _rdmlibpy_columns '
+                + 'WHERE tbl=? AND kind IS NOT NULL',
+                (table,),
+            ).fetchall()
+        )
+        for col, kind in kinds.items():
+            if stored_kinds.get(col, kind) != kind:
+                raise ValueError(
+                    f'Timezone of appended column `{col}` ({_timezone(kind)}) does '
+                    + f'not match the stored data ({_timezone(stored_kinds[col])}).'
+                )
+        stored = dict(
+            con.execute(
+                'SELECT col, unit FROM _rdmlibpy_columns '
+                + 'WHERE tbl=? AND unit IS NOT NULL',
+                (table,),
+            ).fetchall()
+        )
+        if stored != units:
+            raise ValueError(
+                f'Units of appended data ({units}) do not match the units '
+                + f'of the stored data ({stored}).'
+            )
+        row = con.execute(
+            'SELECT time_column, key_column FROM _rdmlibpy_tables WHERE tbl=?',
+            (table,),
+        ).fetchone()
+        if (row is not None) and (tuple(row) != (column, key)):
+            raise ValueError(
+                f'Table `{table}` uses time column `{row[0]}` and key `{row[1]}`; '
+                + f'cannot append data using `{column}` and `{key}`.'
+            )
+
+    @staticmethod
+    def _save_metadata(
+        con: sqlite3.Connection,
+        table: str,
+        df: pd.DataFrame,
+        units: Dict[Any, str],
+        kinds: Dict[Any, str],
+        column: str,
+        is_index: bool,
+        key: Optional[str],
+        key_value: Optional[str],
+    ):
+        con.execute(
+            'INSERT OR REPLACE INTO _rdmlibpy_tables VALUES (?, ?, ?, ?)',
+            (table, column, int(is_index), key),
+        )
+        con.executemany(
+            'INSERT OR REPLACE INTO _rdmlibpy_columns VALUES (?, ?, ?, ?)',
+            [(table, col, units.get(col), kinds.get(col)) for col in df.columns],
+        )
+        con.execute(
+            'INSERT OR REPLACE INTO _rdmlibpy_attrs VALUES (?, ?, ?)',
+            # pickled (same as in HDF5 and arrow files), such that attrs of any
+            # type are restored
+            (table, key_value or '', pickle.dumps(df.attrs)),
+        )
+
+
+def _load_attrs(value: bytes | str) -> Dict[str, Any]:
+    if isinstance(value, str):
+        # stored as JSON by earlier versions
+        return json.loads(value)
+    return pickle.loads(value)
+
+
+class DataFrameReadSQL(Loader):
+    name: str = 'dataframe.read.sql'
+    version: str = '1'
+
+    table: str = 'data'
+    concatenate: bool = True
+
+    def run(
+        self,
+        source: FilePath,
+        start=None,
+        stop=None,
+        columns: None | List[str] = None,
+        key: None | str | List[str] = None,
+        **kwargs,
+    ):
+        table = kwargs.pop('table', self.table)
+        data = [
+            read_sql_table(path, table, start, stop, columns, key)
+            for path in Loader.glob(source)
+        ]
+        if self.concatenate:
+            data = pd.concat(data)
+        return data
+
+
+def read_sql_table(
+    filename: FilePath,
+    table: str = 'data',
+    start=None,
+    stop=None,
+    columns: None | List[str] = None,
+    key: None | str | List[str] = None,
+):
+    """Reads (a selection of) a table written by `DataFrameWriteSQL`. The time
+    range, the selected keys and columns are passed to the query, such that
+    only the selected data is loaded (using the index on the time column).
+
+    Args:
+        filename (FilePath): The SQLite database file.
+        table (str, optional): The name of the table. Defaults to 'data'.
+        start (optional): Start of the time range (inclusive). Defaults to None.
+        stop (optional): End of the time range (inclusive). Defaults to None.
+        columns (None | List[str], optional): The columns to load. Defaults
+            to None (all columns).
+        key (None | str | List[str], optional): Only load rows with the given
+            key value(s). Defaults to None (all rows).
+
+    Returns:
+        pd.DataFrame: The selected data (with units). `attrs` is restored if
+            the data belongs to a single key (or the table has no key).
+    """
+    logger.info(f'Loading SQL table: {table} ({filename})')
+    with _connect(filename) as con:
+        row = con.execute(
+            'SELECT time_column, is_index, key_column FROM _rdmlibpy_tables '
+            + 'WHERE tbl=?',
+            (table,),
+        ).fetchone()
+        if row is None:
+            raise KeyError(f'No table `{table}` found in {filename}')
+        column, is_index, key_column = row
+
+        meta = con.execute(
+            'SELECT col, unit, kind FROM _rdmlibpy_columns WHERE tbl=?', (table,)
+        ).fetchall()
+        units = {col: unit for col, unit, _ in meta if unit is not None}
+        datetimes = {
+            col: _timezone(kind)
+            for col, _, kind in meta
+            if (kind is not None) and kind.startswith(DATETIME_KIND)
+        }
+
+        # build query
+        conditions = []
+        params: List[Any] = []
+        if start is not None:
+            conditions.append(f'{_quote(column)} >= ?')
+            params.append(_nanoseconds(start, datetimes.get(column)))
+        if stop is not None:
+            conditions.append(f'{_quote(column)} <= ?')
+            params.append(_nanoseconds(stop, datetimes.get(column)))
+        keys = None if key is None else [str(k) for k in np.atleast_1d(key)]
+        if keys is not None:
+            if key_column is None:
+                raise ValueError(f'Table `{table}` does not define a key column')
+            conditions.append(f'{_quote(key_column)} IN ({", ".join("?" * len(keys))})')
+            params.extend(keys)
+
+        if columns is None:
+            selected = '*'
+        else:
+            if is_index and (column not in columns):
+                columns = [column] + list(columns)
+            selected = ', '.join(map(_quote, columns))
+        query = f'SELECT {selected} FROM {_quote(table)}'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += f' ORDER BY {_quote(column)}'
+
+        df = pd.read_sql_query(query, con, params=params)
+
+        # load attributes
+        attrs = con.execute(
+            'SELECT key, attrs FROM _rdmlibpy_attrs WHERE tbl=?', (table,)
+        ).fetchall()
+        attrs = [a for k, a in attrs if (keys is None) or (k in keys)]
+
+    # restore datetime columns, units and index
+    for col, tz in datetimes.items():
+        if col in df.columns:
+            values = pd.to_datetime(df[col].to_numpy(dtype='int64'), unit='ns')
+            df[col] = values if tz is None else values.tz_localize('UTC').tz_convert(tz)
+    df = apply_units(df, units)
+    if is_index:
+        df = df.set_index(column)
+    if (keys is not None) and (len(keys) == 1) and (key_column in df.columns):
+        # the key column is redundant if a single key was selected
+        df = df.drop(columns=key_column)
+    if len(attrs) == 1:
+        df.attrs.update(_load_attrs(attrs[0]))
+
+    # rows are ordered by the time column
+    if is_index:
+        return set_properties(df, index_sorted=True)
+    return set_properties(df, sorted_columns=(column,))
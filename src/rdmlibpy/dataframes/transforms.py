@@ -1,12 +1,31 @@
-from typing import Iterable, List, Literal, Mapping
+from typing import Any, ClassVar, Dict, Iterable, List, Literal, Mapping, Sequence
 
-import numpy as np
 import pandas as pd
 import pint_pandas
 from omegaconf import OmegaConf
 from pandas._typing import JoinHow
 
 from ..process import Transform
+from .alignment import (
+    AlignPolicy,
+    AsofDirection,
+    GridMethod,
+    align_onto,
+    asof_onto,
+    concat_columns,
+    grid_onto,
+    grid_step,
+    regular_grid,
+    union_index,
+)
+from .interpolation import as_float, interpolate_frame, interpolate_onto
+from .properties import (
+    derive_properties,
+    get_properties,
+    replace_columns,
+    set_properties,
+    sort_index,
+)
 
 
 class DataFrameSetIndex(Transform):
@@ -23,47 +42,25 @@ class DataFrameSetIndex(Transform):
             return source
         else:
             df = source.set_index(index_var)
+            if isinstance(index_var, str) and (
+                index_var in get_properties(source).sorted_columns
+            ):
+                # skip sorting data, which is known to be sorted
+                set_properties(df, index_sorted=True)
             if self.sort:
-                df.sort_index(inplace=True)
+                df = sort_index(df)
             return df
 
 
+InterpolationMode = Literal['union', 'direct']
+
+
 class DataFrameJoin(Transform):
     name: str = 'dataframe.join'
     version: str = '1'
 
     def interpolate(self, df: pd.DataFrame):
-        # check if indices are datetime64
-        if np.issubdtype(df.index.dtype, np.datetime64):  # type: ignore
-            x = (df.index - df.index[0]).total_seconds()
-        else:
-            x = df.index
-
-        # interpolate columns
-        for col in df.columns:
-            if isinstance(df[col].values, pint_pandas.PintArray):
-                isnan = np.isnan(df[col].pint.m)
-                xp = x[~isnan]
-                yp = df[col].pint.m[~isnan]
-                try:
-                    df[col] = pint_pandas.PintArray(
-                        np.interp(x, xp, yp), dtype=df[col].dtype
-                    )
-                except ValueError:
-                    values = df[col].pint.m.values
-                    df[col] = pint_pandas.PintArray(
-                        np.full_like(values, np.nan), dtype=df[col].dtype
-                    )
-            else:
-                isnan = np.isnan(df[col])
-                xp = x[~isnan]
-                yp = df[col][~isnan]
-                try:
-                    df[col] = np.interp(x, xp, yp)
-                except ValueError:
-                    df[col] = np.full_like(df[col].values, np.nan)
-
-        return df
+        return interpolate_frame(df)
 
     def run(
         self,
@@ -71,11 +68,45 @@ class DataFrameJoin(Transform):
         right: pd.DataFrame,
         how: JoinHow = 'outer',
         interpolate: bool = False,
+        asof: AsofDirection | None = None,
+        tolerance: None | str | float = None,
+        mode: InterpolationMode = 'union',
     ):
+        """Joins two data frames by their indices (see `DataFrame.join`).
+
+        With `interpolate`, the columns are interpolated on the union of both
+        indices (`mode='union'`) before selecting the rows of the requested
+        index. For left and right joins, `mode='direct'` interpolates the
+        other frame directly onto the kept index instead, which is faster, but
+        leaves the kept frame (including its missing values) unchanged. With
+        `asof`, the rows of the other frame are matched instead (see
+        `join_asof`).
+        """
+        if asof is not None:
+            if interpolate:
+                raise ValueError('As-of joins can not be interpolated.')
+            return self.join_asof(left, right, how, asof, tolerance)
+
+        if interpolate and (mode == 'direct'):
+            if how == 'left':
+                # interpolate onto the left index (without joining the indices)
+                return concat_columns(
+                    left, interpolate_onto(sort_index(right), left.index)
+                )
+            elif how == 'right':
+                return concat_columns(
+                    interpolate_onto(sort_index(left), right.index), right
+                )
+            raise ValueError(
+                f'Direct interpolation only supports left or right joins: {how}'
+            )
+
         if interpolate:
             # joined = left.join(right, how='outer').interpolate(method='index')
-            joined = left.join(right, how='outer')
-            joined = self.interpolate(joined)
+            # integer columns can't hold the missing values of the join
+            joined = as_float(left).join(as_float(right), how='outer')
+            # the joined index is sorted, as required by the interpolation
+            joined = self.interpolate(set_properties(joined, index_sorted=True))
             if how == 'left':
                 return left[[]].join(joined, how='left')
             elif how == 'right':
@@ -87,10 +118,172 @@ class DataFrameJoin(Transform):
         else:
             return left.join(right, how=how)
 
+    def join_asof(
+        self,
+        left: pd.DataFrame,
+        right: pd.DataFrame,
+        how: JoinHow = 'left',
+        direction: AsofDirection = 'backward',
+        tolerance: None | str | float = None,
+    ):
+        """Matches the rows of the right frame to the (sorted) index of the left
+        frame (or vice versa for `how='right'`) by the previous (`backward`),
+        next (`forward`) or nearest index value within the given tolerance."""
+        if how == 'right':
+            # match the left rows onto the right index
+            return concat_columns(
+                asof_onto(sort_index(left), right.index, direction, tolerance), right
+            )
+        elif how == 'left':
+            return concat_columns(
+                left, asof_onto(sort_index(right), left.index, direction, tolerance)
+            )
+        else:
+            raise ValueError(f'As-of joins only support left or right joins: {how}')
+
+
+def _named_frames(
+    source: pd.DataFrame | None,
+    frames: Mapping[str, pd.DataFrame] | Sequence[pd.DataFrame] | None,
+) -> Dict[Any, pd.DataFrame]:
+    # names the data frames: `source` first, then by key or position
+    named: Dict[Any, pd.DataFrame] = {}
+    if source is not None:
+        named['source'] = source
+    if isinstance(frames, Mapping):
+        named.update(frames)
+    elif frames is not None:
+        named.update(enumerate(frames))
+    if not named:
+        raise ValueError('No data frames to join.')
+    return named
+
+
+class DataFrameJoinMany(Transform):
+    name: str = 'dataframe.join.many'
+    version: str = '1'
+
+    def run(
+        self,
+        source: pd.DataFrame | None = None,
+        frames: Mapping[str, pd.DataFrame] | Sequence[pd.DataFrame] | None = None,
+        index: str | None = None,
+        policy: AlignPolicy = 'interpolate',
+        policies: Mapping[str, AlignPolicy] | None = None,
+        tolerance: None | str | float = None,
+    ):
+        """Joins multiple data frames (sorted by time) in a single pass. All
+        frames are aligned with a common index by their policy (see
+        `align_onto`), which avoids nested (pairwise) joins.
+
+        Args:
+            source (pd.DataFrame, optional): The data frame of the preceding
+                process (named `source`). Defaults to None.
+            frames (Mapping[str, pd.DataFrame] | Sequence[pd.DataFrame]): The
+                (named) data frames, e.g. the results of sub-workflows.
+            index (str, optional): Name of the frame providing the common
+                index. Defaults to None (union of all indices).
+            policy (AlignPolicy, optional): The default alignment policy.
+                Defaults to 'interpolate'.
+            policies (Mapping[str, AlignPolicy], optional): Alignment policies
+                of individual frames. Defaults to None.
+            tolerance (None | str | float, optional): Tolerance of as-of
+                matches. Defaults to None.
+
+        Returns:
+            pd.DataFrame: The joined data frame.
+        """
+        named = {
+            name: sort_index(df) for name, df in _named_frames(source, frames).items()
+        }
+        policies = policies or {}
+
+        if index is None:
+            target = union_index([df.index for df in named.values()])
+        else:
+            target = named[index].index
+
+        aligned = []
+        for name, df in named.items():
+            if df.index.equals(target):
+                aligned.append(df)
+            else:
+                aligned.append(
+                    align_onto(df, target, policies.get(name, policy), tolerance)
+                )
+        df_new = concat_columns(*aligned)
+        if index is None:
+            return set_properties(df_new, index_sorted=True, index_unique=True)
+        return derive_properties(df_new, named[index])
+
+
+class DataFrameAlign(Transform):
+    name: str = 'dataframe.align'
+    version: str = '1'
+
+    def run(
+        self,
+        source: pd.DataFrame | None = None,
+        frames: Mapping[str, pd.DataFrame] | Sequence[pd.DataFrame] | None = None,
+        freq: None | str | float = None,
+        reference: str | None = None,
+        method: GridMethod = 'interpolate',
+        methods: Mapping[str, GridMethod] | None = None,
+        tolerance: None | str | float = None,
+    ):
+        """Aligns multiple data frames (sorted by time) with a common regular
+        grid, which covers the time spans of all frames (or of the reference
+        frame). The columns are computed directly on the grid (no joined
+        intermediate index) by their method (see `grid_onto`), units are kept.
+
+        Args:
+            source (pd.DataFrame, optional): The data frame of the preceding
+                process (named `source`). Defaults to None.
+            frames (Mapping[str, pd.DataFrame] | Sequence[pd.DataFrame]): The
+                (named) data frames, e.g. the results of sub-workflows.
+            freq (None | str | float, optional): The grid frequency, e.g. `1s`.
+                Defaults to None (median spacing of the reference frame).
+            reference (str, optional): Name of the frame defining the time span
+                (and frequency) of the grid. Defaults to None (all frames).
+            method (GridMethod, optional): The default method. Defaults to
+                'interpolate'.
+            methods (Mapping[str, GridMethod], optional): Methods of individual
+                columns. Defaults to None.
+            tolerance (None | str | float, optional): Tolerance of `nearest`
+                matches. Defaults to None.
+
+        Returns:
+            pd.DataFrame: The aligned data frame.
+        """
+        named = {
+            name: sort_index(df) for name, df in _named_frames(source, frames).items()
+        }
+
+        if reference is None:
+            indices = [df.index for df in named.values()]
+            if freq is None:
+                raise ValueError('Either freq or reference has to be specified.')
+        else:
+            indices = [named[reference].index]
+            # the frequency of the reference frame may be known
+            freq = freq or get_properties(named[reference]).freq
+        grid = regular_grid(indices, grid_step(indices[0], freq))
+
+        df_new = concat_columns(
+            *(grid_onto(df, grid, method, methods, tolerance) for df in named.values())
+        )
+        return set_properties(
+            df_new,
+            index_sorted=True,
+            index_unique=True,
+            freq=None if freq is None else str(freq),
+        )
+
 
 class DataFrameInterpolate(Transform):
     name: str = 'dataframe.interpolate'
     version: str = '1'
+    mutates_source: ClassVar[bool] = True
 
     def run(
         self,
@@ -98,43 +291,12 @@ class DataFrameInterpolate(Transform):
         include: None | Iterable[str] = None,
         exclude: None | Iterable[str] = None,
     ):
-        # check if indices are datetime64
-        if np.issubdtype(df.index.dtype, np.datetime64):  # type: ignore
-            x = (df.index - df.index[0]).total_seconds()
-        else:
-            x = df.index
-
         if not include:
             include = list(df.columns)
         if not exclude:
             exclude = []
 
-        # interpolate columns
-        for col in include:
-            if col in exclude:
-                continue
-            if isinstance(df[col].values, pint_pandas.PintArray):
-                isnan = np.isnan(df[col].pint.m)
-                xp = x[~isnan]
-                yp = df[col].pint.m[~isnan]
-                try:
-                    df[col] = pint_pandas.PintArray(
-                        np.interp(x, xp, yp), dtype=df[col].dtype
-                    )
-                except ValueError:
-                    df[col] = pint_pandas.PintArray(
-                        np.full_like(df[col].pint.m.values, np.nan), dtype=df[col].dtype
-                    )
-            else:
-                isnan = np.isnan(df[col])
-                xp = x[~isnan]
-                yp = df[col][~isnan]
-                try:
-                    df[col] = np.interp(x, xp, yp)
-                except ValueError:
-                    df[col] = np.full_like(df[col].values, np.nan)
-
-        return df
+        return interpolate_frame(df, [col for col in include if col not in exclude])
 
 
 FillMethod = Literal['forward', 'backward']
@@ -143,6 +305,7 @@ FillMethod = Literal['forward', 'backward']
 class DataFrameFillNA(Transform):
     name: str = 'dataframe.fillna'
     version: str = '1'
+    mutates_source: ClassVar[bool] = True
 
     def run(
         self,
@@ -157,9 +320,8 @@ class DataFrameFillNA(Transform):
             exclude = []
 
         # interpolate columns
-        for col in include:
-            if col in exclude:
-                continue
+        columns = [col for col in include if col not in exclude]
+        for col in columns:
             if method == 'forward':
                 df[col] = df[col].ffill()
             elif method == 'backward':
@@ -167,12 +329,13 @@ class DataFrameFillNA(Transform):
             else:
                 raise ValueError(f'Invalid fill method: {method}')
 
-        return df
+        return replace_columns(df, columns)
 
 
 class DataFrameUnits(Transform):
     name: str = 'dataframe.units'
     version: str = '1'
+    mutates_source: ClassVar[bool] = True
 
     def run(
         self,
@@ -180,8 +343,11 @@ class DataFrameUnits(Transform):
         units: Mapping[str, str] | None = None,
         default_unit: str | None = None,
     ):
+        changed = []
+
         def set_unit(col, unit):
             source[col] = pint_pandas.PintArray(source[col], dtype=f'pint[{unit}]')
+            changed.append(col)
 
         for col in source.columns:
             if (units is not None) and (col in units):
@@ -191,12 +357,13 @@ class DataFrameUnits(Transform):
             else:
                 # do nothing
                 pass
-        return source
+        return replace_columns(source, changed)
 
 
 class DataFrameAttributes(Transform):
     name: str = 'dataframe.set.attrs'
     version: str = '1'
+    mutates_source: ClassVar[bool] = True
 
     def run(self, source: pd.DataFrame, **kwargs):
         # make deep copy of attributes
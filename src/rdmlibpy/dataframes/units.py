@@ -0,0 +1,185 @@
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pandas.arrays
+import pint_pandas
+import pint_pandas.pint_array
+
+
+def format_unit(dtype: pint_pandas.PintType) -> str:
+    # same formatting as used by `DataFrame.pint.dequantify`
+    return ('{:' + dtype.ureg.default_format + '}').format(dtype.units)
+
+
+def magnitude(values: pint_pandas.PintArray) -> Any:
+    # `PintArray.data` is usually a `NumpyExtensionArray`, which pandas would
+    # scan for missing values when creating a frame; unwrap the numpy array
+    # instead (without copying it)
+    data = values.data
+    if isinstance(data, pandas.arrays.NumpyExtensionArray):
+        return np.asarray(data)
+    return data
+
+
+def column_arrays(df: pd.DataFrame) -> List[Any]:
+    """Returns the arrays of all columns (by position) without copying them.
+    Columns of numpy blocks are returned as numpy arrays (views)."""
+    arrays = []
+    # by position (labels may be duplicated)
+    for i in range(df.shape[1]):
+        values = df.iloc[:, i].array
+        if isinstance(values, pandas.arrays.NumpyExtensionArray):
+            values = np.asarray(values)
+        arrays.append(values)
+    return arrays
+
+
+def dequantify(df: pd.DataFrame):
+    """Replaces pint columns by their magnitudes and adds the units as an
+    additional (last) level `unit` to the column labels (`No Unit` for
+    columns without units), same as `DataFrame.pint.dequantify`. The data
+    is not copied.
+    """
+    units = []
+    arrays = {}
+    # hashing pint dtypes formats their units, use the (cheap) units instead
+    formatted: Dict[Any, str] = {}
+    for i, values in enumerate(column_arrays(df)):
+        if isinstance(values, pint_pandas.PintArray):
+            dtype = values.dtype
+            if dtype.units not in formatted:
+                formatted[dtype.units] = format_unit(dtype)
+            units.append(formatted[dtype.units])
+            arrays[i] = magnitude(values)
+        else:
+            units.append(pint_pandas.pint_array.NO_UNIT)
+            arrays[i] = values
+
+    df_new = pd.DataFrame(arrays, index=df.index, copy=False)
+    df_new.columns = pd.MultiIndex.from_arrays(
+        [df.columns.get_level_values(i) for i in range(df.columns.nlevels)] + [units],
+        names=list(df.columns.names) + ['unit'],
+    )
+
+    # preserve attrs dictionary
+    df_new.attrs.update(df.attrs)
+
+    return df_new
+
+
+def quantify(df: pd.DataFrame, level=-1):
+    """Converts columns to pint columns using the units given by the column
+    labels at `level` (inverse of `dequantify`). The data is not copied and
+    the pint dtype is only created once for each unit.
+    """
+    # Replaces `DataFrame.pint.quantify`, see
+    # https://github.com/hgrecco/pint-pandas/pull/217
+    units = df.columns.get_level_values(level)
+
+    arrays = {}
+    dtypes: Dict[str, pint_pandas.PintType] = {}
+    for i, (values, unit) in enumerate(zip(column_arrays(df), units)):
+        if unit == pint_pandas.pint_array.NO_UNIT:
+            arrays[i] = values
+            continue
+        if unit not in dtypes:
+            dtypes[unit] = pint_pandas.PintType(unit)
+        arrays[i] = pint_pandas.PintArray(values, dtype=dtypes[unit])
+
+    df_new = pd.DataFrame(arrays, index=df.index, copy=False)
+    df_new.columns = df.columns.droplevel(level)
+
+    # preserve attrs dictionary
+    df_new.attrs.update(df.attrs)
+
+    return df_new
+
+
+def split_units(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[Any, str]]:
+    """Replaces pint columns by their magnitudes and returns their units
+    separately. In contrast to `dequantify`, the column labels are left
+    unchanged, which allows storing the data in formats that do not support
+    multi-index columns.
+
+    Args:
+        df (pd.DataFrame): The data frame (possibly containing pint columns).
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[Any, str]]: The data frame containing the
+            magnitudes as plain numpy arrays and a mapping of column labels
+            to units (only for columns that had units).
+    """
+    units = {}
+    arrays = {}
+    for i, (label, values) in enumerate(zip(df.columns, column_arrays(df))):
+        if isinstance(values, pint_pandas.PintArray):
+            units[label] = format_unit(values.dtype)
+            values = magnitude(values)
+        if isinstance(values, pandas.arrays.FloatingArray):  # type: ignore
+            values = values.to_numpy(dtype=values.dtype.numpy_dtype, na_value=np.nan)
+        arrays[i] = values
+
+    df_new = pd.DataFrame(arrays, index=df.index, copy=False)
+    df_new.columns = df.columns
+
+    # preserve attrs dictionary
+    df_new.attrs.update(df.attrs)
+
+    return df_new, units
+
+
+def apply_units(df: pd.DataFrame, units: Mapping[Any, str]) -> pd.DataFrame:
+    """Converts the given columns to pint columns (inverse of `split_units`).
+    Columns that are missing in the data frame are ignored.
+
+    Args:
+        df (pd.DataFrame): The data frame containing the magnitudes.
+        units (Mapping[Any, str]): A mapping of column labels to units.
+
+    Returns:
+        pd.DataFrame: The data frame with pint columns (the data is not
+            copied).
+    """
+    if not any(label in units for label in df.columns):
+        return df
+    return apply_column_units(df, [units.get(label) for label in df.columns])
+
+
+def apply_column_units(
+    df: pd.DataFrame, units: Sequence[Optional[str]]
+) -> pd.DataFrame:
+    """Converts columns to pint columns given the units by column position
+    (None for columns without units), e.g. if column labels are ambiguous or
+    cannot be stored.
+
+    Args:
+        df (pd.DataFrame): The data frame containing the magnitudes.
+        units (Sequence[Optional[str]]): The units of the columns.
+
+    Returns:
+        pd.DataFrame: The data frame with pint columns (the data is not
+            copied).
+    """
+    if all(unit is None for unit in units):
+        return df
+
+    arrays = column_arrays(df)
+    dtypes: Dict[str, pint_pandas.PintType] = {}
+    for i, unit in enumerate(units):
+        if unit is None:
+            continue
+        if unit not in dtypes:
+            dtypes[unit] = pint_pandas.PintType(unit)
+        values = arrays[i]
+        if not isinstance(values, np.ndarray):
+            values = values.to_numpy()
+        arrays[i] = pint_pandas.PintArray(values, dtype=dtypes[unit])
+
+    df_new = pd.DataFrame(dict(enumerate(arrays)), index=df.index, copy=False)
+    df_new.columns = df.columns
+
+    # preserve attrs dictionary
+    df_new.attrs.update(df.attrs)
+
+    return df_new
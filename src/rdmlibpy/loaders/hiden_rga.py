@@ -74,7 +74,10 @@ class HidenRGALoader(DataFrameReadCSVBase):
 
         data = super().run(source)
 
-        if isinstance(data, list):
+        if self.chunksize is not None:
+            # streaming mode (generator of chunks)
+            return (self.create_timestamp(df, t0) for df in data)
+        elif isinstance(data, list):
             return [self.create_timestamp(df, t0) for df in data]
         else:
             return self.create_timestamp(data, t0)
@@ -0,0 +1,239 @@
+import contextlib
+import contextvars
+import copy
+import json
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ._typing import FilePath
+
+logger = logging.getLogger(__name__)
+
+# environment variable holding the default size (in bytes) of the memory cache
+MEMORY_CACHE_SIZE_ENV = 'RDMLIBPY_MEMORY_CACHE_SIZE'
+
+
+def sizeof(value: Any, deep: bool = True) -> int:
+    """Estimates the memory used by a (cached) value in bytes (without the
+    contents of python objects, e.g. strings, unless `deep` is True)."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=deep).sum())
+    elif isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=deep))
+    elif isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    else:
+        return sys.getsizeof(value)
+
+
+def protected_copy(value: Any) -> Any:
+    """Returns a copy of a cached value, such that callers can't modify the
+    cached value. Data frames are returned as (shallow) views if pandas'
+    copy-on-write mode is enabled; otherwise they are copied.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=not pd.options.mode.copy_on_write)
+    elif isinstance(value, np.ndarray):
+        view = value.view()
+        view.flags.writeable = False
+        return view
+    else:
+        return copy.deepcopy(value)
+
+
+class LoadStats:
+    """Data loaded by the memory cache within a context (see
+    `measure_loads`)."""
+
+    def __init__(self):
+        # estimated size of the data loaded from files (not from memory)
+        self.bytes_loaded = 0
+        self.file_loads = 0
+        self.memory_hits = 0
+
+
+_load_stats: contextvars.ContextVar[Optional[LoadStats]] = contextvars.ContextVar(
+    'rdmlibpy_load_stats', default=None
+)
+
+
+@contextlib.contextmanager
+def measure_loads() -> Iterator[LoadStats]:
+    """Measures the data loaded by the memory cache (from files or from
+    memory) within this context, e.g. the data actually read by a cache."""
+    stats = LoadStats()
+    token = _load_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _load_stats.reset(token)
+
+
+class MemoryCache:
+    """A thread-safe, size-limited in-memory cache with LRU eviction. Values
+    are stored for a file (identified by its path, modification time and size)
+    and the configuration used to load the file, such that modified files are
+    never served from memory.
+    """
+
+    def __init__(self, max_bytes: int = 0):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Tuple, Tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(filename: FilePath, config: Hashable = None) -> Optional[Tuple]:
+        """Creates the key of a file and load configuration. Returns None if
+        the file does not exist."""
+        path = Path(filename).resolve()
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return (str(path), stat.st_mtime_ns, stat.st_size, config)
+
+    def load(
+        self, filename: FilePath, loader: Callable[[], Any], config: Hashable = None
+    ):
+        """Returns the value of the file from memory, or loads (and stores) it
+        using the given loader.
+
+        Args:
+            filename (FilePath): The file.
+            loader (Callable[[], Any]): Function loading the file.
+            config (Hashable, optional): The configuration used to load the
+                file (e.g. options of the loader). Defaults to None.
+
+        Returns:
+            Any: A copy of the value (see `protected_copy`).
+        """
+        key = self.key(filename, config) if self.enabled else None
+        if key is None:
+            return self._load(loader)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                logger.debug(f'Loading from memory cache: {filename}')
+                stats = _load_stats.get()
+                if stats is not None:
+                    stats.memory_hits += 1
+                return protected_copy(entry[0])
+            self.misses += 1
+
+        value = self._load(loader)
+        self.put(key, value)
+        return protected_copy(value)
+
+    @staticmethod
+    def _load(loader: Callable[[], Any]):
+        value = loader()
+        stats = _load_stats.get()
+        if stats is not None:
+            stats.file_loads += 1
+            stats.bytes_loaded += sizeof(value, deep=False)
+        return value
+
+    def put(self, key: Tuple, value: Any):
+        size = sizeof(value)
+        if size > self.max_bytes:
+            # never evict all entries to store a single (huge) value
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size)
+            self._bytes += size
+            self._evict()
+
+    def invalidate(self, filename: FilePath):
+        """Removes all entries of the given file."""
+        path = str(Path(filename).resolve())
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path]:
+                self._remove(key)
+
+    def resize(self, max_bytes: int):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        return dict(
+            entries=len(self._entries),
+            bytes=self._bytes,
+            max_bytes=self.max_bytes,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+    def _remove(self, key: Tuple):
+        _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def _evict(self):
+        # remove least recently used entries
+        while self._entries and (self._bytes > self.max_bytes):
+            key = next(iter(self._entries))
+            logger.debug(f'Evicting from memory cache: {key[0]}')
+            self._remove(key)
+
+
+def config_key(process, **kwargs) -> str:
+    """Creates a (hashable) key from the configuration of a process and
+    additional load arguments."""
+    return json.dumps(
+        dict(process=process.fullname, config=process.model_dump(), **kwargs),
+        default=str,
+        sort_keys=True,
+    )
+
+
+_memory_cache = MemoryCache(int(os.environ.get(MEMORY_CACHE_SIZE_ENV, 0)))
+
+
+def get_memory_cache() -> MemoryCache:
+    """Returns the process-wide memory cache (used by the file caches)."""
+    return _memory_cache
+
+
+def configure_memory_cache(max_bytes: int):
+    """Sets the size of the process-wide memory cache in bytes (0 disables the
+    memory cache). The default size is taken from the environment variable
+    `RDMLIBPY_MEMORY_CACHE_SIZE`.
+    """
+    _memory_cache.resize(max_bytes)
+    if max_bytes <= 0:
+        _memory_cache.clear()
@@ -184,6 +184,11 @@ class Metadata:
     def to_container(metadata: MetadataNode, *, resolve: bool = True):
         return OmegaConf.to_container(metadata._container, resolve=resolve)
 
+    @staticmethod
+    def to_config(metadata: MetadataNode):
+        # the underlying OmegaConf node, interpolations left unresolved
+        return metadata._container
+
 
 def load_yaml(filename: PathLike):
     return Metadata.load_yaml(filename)
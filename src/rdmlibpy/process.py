@@ -1,9 +1,32 @@
 import abc
+import contextlib
+import logging
 import os
+import time
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, List, Optional
 
+from rdmlibpy._filelock import FileLock, atomic_path, lock_path
 from rdmlibpy.base import ProcessBase, ProcessNode
+from rdmlibpy.cache_directory import record_access, record_build
+from rdmlibpy.cache_stats import CacheEvent, files_size, record_event
+from rdmlibpy.copy_on_write import copy_on_write_enabled, lazy_copy
+from rdmlibpy.memory_cache import measure_loads
+
+
+logger = logging.getLogger(__name__)
+
+
+def _stamp(files: List[Path]):
+    # identifies the current state of the cache files
+    stamps = []
+    for path in files:
+        try:
+            stat = path.stat()
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            stamps.append(None)
+    return stamps
 
 
 class DelegatedSource(ProcessBase):
@@ -57,6 +80,27 @@ class Writer(ProcessBase):
 
         return path
 
+    @classmethod
+    @contextlib.contextmanager
+    def atomic(cls, filepath: str | os.PathLike):
+        """Yields a temporary path next to the given file, which replaces the
+        file once the context exits without errors. Readers thus never see a
+        partially written file.
+
+        Args:
+            filepath (str | os.PathLike): The path and filename to the file.
+
+        Yields:
+            Path: The temporary path to write to.
+        """
+        path = cls.ensure_path(filepath)
+        tmp = atomic_path(path)
+        try:
+            yield tmp
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+
 
 class Serializer(ProcessBase):
     def ensure_parent_path_exists(self, uri: Path):
@@ -70,12 +114,41 @@ class Serializer(ProcessBase):
     def write(self, source, uri: Path):
         pass
 
+    def preserves_source(self) -> bool:
+        """Returns True if loading a written object yields an equal object,
+        such that caches may return the source instead of loading it again.
+        """
+        return False
+
 
 class Transform(ProcessBase):
-    pass
+    # transforms modifying their source in place (e.g. setting columns or
+    # attributes) receive a lazy copy of the source in copy-on-write mode
+    mutates_source: ClassVar[bool] = False
+
+    def _run(self, node: ProcessNode):
+        if not (self.mutates_source and copy_on_write_enabled()):
+            return super()._run(node)
+
+        # the source and data frames passed as parameters (e.g. results of
+        # other nodes) may be shared (e.g. cached), only the copies are modified
+        params = {key: lazy_copy(value) for key, value in node.get_params().items()}
+        if node.parent is None:
+            return self.run(**params)
+        return self.run(lazy_copy(node.parent.run()), **params)
+
+    def pushdown(self, **kwargs) -> Optional[Dict[str, Any]]:
+        """Returns the read hints (e.g. selected columns or time range) that
+        preceding processes may use to load only the data required by this
+        transform. Returns None if the transform can't be pushed down.
+        """
+        return None
 
 
 class Cache(Writer):
+    # read hints (keyword arguments of `read`) supported by the cache
+    read_hints: ClassVar[FrozenSet[str]] = frozenset()
+
     def run(self, source, **kwargs):
         # write source to cache
         self.write(source, **kwargs)
@@ -88,12 +161,104 @@ class Cache(Writer):
         params = node.get_params()
 
         # check if cache is valid
+        files = self.cache_files(**params)
         if self.cache_is_valid(**params):
-            # return cached value
-            return self.read(**params)
+            return self._hit(node, params, files)
+
+        # only a single process (or thread) builds the cache; others wait for
+        # the lock and read the result
+        stamp = _stamp(files)
+        with self.build_lock(files):
+            if self.cache_is_valid(**params) or (
+                files and (_stamp(files) != stamp) and all(p.exists() for p in files)
+            ):
+                logger.info(f'Cache was built by another process: {self.fullname}')
+                return self._hit(node, params, files, reason='built concurrently')
+
+            return self._build(node, params, files)
+
+    def _hit(
+        self,
+        node: ProcessNode,
+        params: Dict[str, Any],
+        files: List[Path],
+        reason: Optional[str] = None,
+    ):
+        record_access(files)
+
+        # return cached value (only loading data required by the following
+        # processes, if supported)
+        hints = {
+            key: value for key, value in node.hints.items() if key in self.read_hints
+        }
+        start = time.perf_counter()
+        with measure_loads() as loads:
+            result = self.read(**(hints | params))
+        read_time = time.perf_counter() - start
+        if loads.file_loads or loads.memory_hits:
+            bytes_read = min(loads.bytes_loaded, files_size(files))
         else:
-            # run process normally (and save value to cache)
-            return super()._run(node)
+            # caches reading without the memory cache
+            bytes_read = files_size(files)
+        record_event(
+            CacheEvent(
+                process=self.fullname,
+                key=self._stats_key(files),
+                kind='hit',
+                reason=reason,
+                bytes_read=bytes_read,
+                memory_hit=(loads.memory_hits > 0) and not loads.file_loads,
+                read_time=read_time,
+            )
+        )
+        return result
+
+    def _build(self, node: ProcessNode, params: Dict[str, Any], files: List[Path]):
+        reason = self.invalid_reason(**params)
+
+        # run process normally (and save value to cache); the build time
+        # is recorded for managed cache directories
+        start = time.perf_counter()
+        if node.parent is not None:
+            source = node.parent.run()
+            write_start = time.perf_counter()
+            result = self.run(source, **params)
+        else:
+            write_start = time.perf_counter()
+            result = self.run(**params)
+        end = time.perf_counter()
+
+        record_build(files, end - start)
+        record_event(
+            CacheEvent(
+                process=self.fullname,
+                key=self._stats_key(files),
+                kind='miss',
+                reason=reason,
+                bytes_written=files_size(files),
+                write_time=end - write_start,
+                build_time=end - start,
+            )
+        )
+        return result
+
+    def _stats_key(self, files: List[Path]) -> str:
+        return str(Path(files[0]).resolve()) if files else self.fullname
+
+    def invalid_reason(self, **kwargs) -> str:
+        """Describes why the cache is invalid (reported in cache statistics)."""
+        return 'invalid'
+
+    def build_lock(self, files: List[Path]):
+        """Returns the lock held while building the cache (a lock file next to
+        the first cache file)."""
+        if not files:
+            return contextlib.nullcontext()
+        return FileLock(lock_path(files[0]))
+
+    def cache_files(self, **kwargs) -> List[Path]:
+        """Returns the files (or directories) holding the cached data."""
+        return []
 
     @abc.abstractmethod
     def read(self, **kwargs):
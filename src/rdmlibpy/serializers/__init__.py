@@ -1,6 +1,10 @@
 from ..registry import register
 from .file_cache import FileCache
+from .json_data import JsonSerializer
+from .numpy_array import NumpyArraySerializer
 from .pandas_dataframe import PandasDataFrameSerializer
 
 register(FileCache())
+register(JsonSerializer())
+register(NumpyArraySerializer())
 register(PandasDataFrameSerializer())
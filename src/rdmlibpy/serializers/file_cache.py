@@ -1,21 +1,46 @@
+import time
 from pathlib import Path
-import pandas as pd
+from typing import Dict, Optional
 
+import numpy as np
+import pandas as pd
 
-from ..process import ProcessBase, Serializer
-from .pandas_dataframe import PandasDataFrameSerializer
+from ..cache_directory import record_access, record_build
+from ..cache_stats import CacheEvent, files_size, record_event
+from ..memory_cache import config_key, get_memory_cache, measure_loads
+from .._filelock import FileLock, lock_path
+from ..base import ProcessNode
+from ..process import ProcessBase, Serializer, Writer
+from .json_data import JsonSerializer
+from .numpy_array import NumpyArraySerializer
+from .pandas_dataframe import DataFrameFormat, PandasDataFrameSerializer
 from ..registry import get_runner
 
+# binary data frame formats selected by the suffix of the target (`auto`)
+DATAFRAME_SUFFIXES: Dict[str, DataFrameFormat] = {
+    '.parquet': 'parquet',
+    '.feather': 'feather',
+    '.pkl': 'pickle',
+    '.pickle': 'pickle',
+}
+
 
 class FileCache(ProcessBase):
     name: str = 'file.cache'
     version: str = '1'
     serializer: str = 'auto'
 
-    def get_serializer(self, source):
+    def get_serializer(self, source, target: Optional[Path] = None):
         if self.serializer == 'auto':
             if isinstance(source, pd.DataFrame):
-                return PandasDataFrameSerializer()
+                suffix = target.suffix.lower() if target is not None else ''
+                return PandasDataFrameSerializer(
+                    format=DATAFRAME_SUFFIXES.get(suffix, 'csv')
+                )
+            elif isinstance(source, np.ndarray):
+                return NumpyArraySerializer()
+            elif isinstance(source, (dict, list)):
+                return JsonSerializer()
             else:
                 raise ValueError(f'No matching serializer for type {type(source)}')
         else:
@@ -23,10 +48,53 @@ class FileCache(ProcessBase):
             assert isinstance(ser, Serializer)
             return ser
 
+    def _run(self, node: ProcessNode):
+        if node.parent is None:
+            return super()._run(node)
+
+        # the build time includes running the preceding processes
+        params = node.get_params()
+        start = time.perf_counter()
+        return self._cache(node.parent.run(), build_start=start, **params)
+
     def run(self, source, target: Path):
-        ser = self.get_serializer(source)
+        return self._cache(source, target, build_start=time.perf_counter())
+
+    def _cache(self, source, target: Path, build_start: float):
+        ser = self.get_serializer(source, target)
+
+        # only a single process (or thread) writes the file; the file is
+        # written to a temporary file first and atomically renamed
+        event = CacheEvent(process=self.fullname, key=str(target.resolve()), kind='hit')
+        with FileLock(lock_path(target)):
+            if not target.exists():
+                start = time.perf_counter()
+                with Writer.atomic(target) as tmp:
+                    ser.write(source, tmp)
+                get_memory_cache().invalidate(target)
+                event.kind = 'miss'
+                event.reason = 'missing'
+                end = time.perf_counter()
+                event.write_time = end - start
+                event.build_time = end - build_start
+                event.bytes_written = files_size([target])
+                record_build([target], event.build_time)
+            else:
+                record_access([target])
 
-        if not target.exists():
-            ser.write(source, target)
+        if (event.kind == 'miss') and ser.preserves_source():
+            # the written data is still in memory, no need to load it again
+            record_event(event)
+            return source
 
-        return ser.load(target)
+        # repeated loads are served by the (process-wide) memory cache
+        start = time.perf_counter()
+        with measure_loads() as loads:
+            result = get_memory_cache().load(
+                target, lambda: ser.load(target), config=config_key(ser)
+            )
+        event.read_time = time.perf_counter() - start
+        event.bytes_read = min(loads.bytes_loaded, files_size([target]))
+        event.memory_hit = loads.file_loads == 0
+        record_event(event)
+        return result
@@ -0,0 +1,22 @@
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+from ..process import Serializer
+
+
+class JsonSerializer(Serializer):
+    name: str = 'json'
+    version: str = '1'
+    indent: Optional[int] = None
+
+    def load(self, uri: Path):
+        with open(uri, 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    def write(self, source: Any, uri: Path):
+        with open(self.ensure_parent_path_exists(uri), 'w', encoding='utf-8') as file:
+            json.dump(source, file, indent=self.indent)
+
+    def run(self, *args, **kwargs):
+        return args[0]
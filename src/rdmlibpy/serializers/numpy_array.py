@@ -0,0 +1,27 @@
+from pathlib import Path
+
+import numpy as np
+
+from ..process import Serializer
+
+
+class NumpyArraySerializer(Serializer):
+    name: str = 'numpy.array'
+    version: str = '1'
+    # memory-map the file on load (read-only) instead of reading it
+    mmap: bool = True
+
+    def load(self, uri: Path):
+        return np.load(uri, mmap_mode='r' if self.mmap else None, allow_pickle=False)
+
+    def write(self, source: np.ndarray, uri: Path):
+        # write via file object, since `np.save` appends `.npy` to filenames
+        # with other suffixes
+        with open(self.ensure_parent_path_exists(uri), 'wb') as file:
+            np.save(file, np.asanyarray(source), allow_pickle=False)
+
+    def preserves_source(self) -> bool:
+        return True
+
+    def run(self, *args, **kwargs):
+        return args[0]
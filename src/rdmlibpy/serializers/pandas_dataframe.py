@@ -1,12 +1,16 @@
 from pathlib import Path
-from typing import Any, Dict, Literal
+from typing import Any, Dict, Literal, Optional
 
 import pandas as pd
 import pydantic
 
+from ..dataframes.hdf5 import open_store
 from ..process import Serializer
 
-DataFrameFormat = Literal['csv', 'HDF5']
+DataFrameFormat = Literal['csv', 'HDF5', 'parquet', 'feather', 'pickle']
+
+# formats restoring index, column labels and dtypes of written data frames
+BINARY_FORMATS = ('HDF5', 'parquet', 'feather', 'pickle')
 
 
 class PandasDataFrameSerializer(Serializer):
@@ -14,6 +18,9 @@ class PandasDataFrameSerializer(Serializer):
     version: str = '1'
     format: DataFrameFormat = 'csv'
     options: Dict[str, Any] = pydantic.Field(default_factory=dict)  # type: ignore
+    # HDF5 compression (disabled by default)
+    complib: Optional[str] = None
+    complevel: int = 0
 
     def load(self, uri: Path):
         match self.format:
@@ -21,6 +28,13 @@ class PandasDataFrameSerializer(Serializer):
                 return pd.read_csv(uri, encoding='utf-8', **self.options)
             case 'HDF5':
                 return pd.read_hdf(uri, self.options.get('key', 'data'))
+            case 'parquet':
+                # memory map the file instead of reading it (pyarrow)
+                return pd.read_parquet(uri, memory_map=True)
+            case 'feather':
+                return pd.read_feather(uri)
+            case 'pickle':
+                return pd.read_pickle(uri)
             case _:
                 raise ValueError(f'Unsupported format: {self.format}')
 
@@ -30,11 +44,24 @@ class PandasDataFrameSerializer(Serializer):
                 source.to_csv(self.ensure_parent_path_exists(uri), **self.options)
             case 'HDF5':
                 options = self.options.copy()
-                if 'key' not in options:
-                    options.update(key='data')
-                source.to_hdf(self.ensure_parent_path_exists(uri), **options)
+                key = options.pop('key', 'data')
+                mode = options.pop('mode', 'a')
+                uri = self.ensure_parent_path_exists(uri)
+                with open_store(
+                    uri, mode=mode, complib=self.complib, complevel=self.complevel
+                ) as store:
+                    store.put(key, source, **options)
+            case 'parquet':
+                source.to_parquet(self.ensure_parent_path_exists(uri), **self.options)
+            case 'feather':
+                source.to_feather(self.ensure_parent_path_exists(uri), **self.options)
+            case 'pickle':
+                source.to_pickle(self.ensure_parent_path_exists(uri), **self.options)
             case _:
                 raise ValueError(f'Unsupported format: {self.format}')
 
+    def preserves_source(self) -> bool:
+        return self.format in BINARY_FORMATS
+
     def run(self, *args, **kwargs):
         return args[0]
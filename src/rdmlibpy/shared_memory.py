@@ -0,0 +1,183 @@
+import atexit
+import contextlib
+import contextvars
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Iterator, Optional, Set
+
+import numpy as np
+import pydantic
+
+from ._typing import FilePath
+
+logger = logging.getLogger(__name__)
+
+# environment variable holding the directory of the shared memory segments
+SHARED_MEMORY_DIR_ENV = 'RDMLIBPY_SHARED_MEMORY_DIR'
+
+SEGMENT_PREFIX = 'rdmlibpy-'
+
+
+def default_directory() -> Path:
+    """Returns the directory of shared memory segments: `/dev/shm` (a RAM
+    backed file system) if available, otherwise the temporary directory."""
+    directory = os.environ.get(SHARED_MEMORY_DIR_ENV)
+    if directory:
+        return Path(directory)
+    if Path('/dev/shm').is_dir():
+        return Path('/dev/shm')
+    return Path(tempfile.gettempdir())
+
+
+def attach_segment(filename: FilePath) -> np.memmap:
+    """Maps a shared memory segment (without copying it). The mapping is
+    private (copy-on-write), such that modifications are neither visible to
+    other processes nor written to the segment. The mapping stays valid after
+    the segment is released.
+    """
+    return np.memmap(filename, dtype=np.uint8, mode='c')
+
+
+def release_segment(filename: FilePath):
+    """Removes a shared memory segment (existing mappings stay valid)."""
+    Path(filename).unlink(missing_ok=True)
+
+
+class SharedSegment(pydantic.BaseModel):
+    """Base class of descriptors of data placed in a shared memory segment."""
+
+    filename: str
+
+
+def iter_segments(value: Any) -> Iterator[SharedSegment]:
+    """Yields the segment descriptors contained in a (nested) result."""
+    if isinstance(value, SharedSegment):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from iter_segments(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from iter_segments(item)
+
+
+class SharedMemoryArena:
+    """Creates shared memory segments (memory mapped files) for passing data
+    between processes and owns them until they are released by the receiving
+    process or the arena is closed (e.g. when the creating process exits).
+    """
+
+    def __init__(self, directory: Optional[FilePath] = None):
+        self._directory = Path(directory) if directory else None
+        self._segments: Set[Path] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        # the default is resolved on use (see `shared_memory_workers`)
+        return self._directory if self._directory else default_directory()
+
+    @property
+    def segments(self) -> Set[Path]:
+        with self._lock:
+            return set(self._segments)
+
+    def allocate(self, nbytes: int) -> np.memmap:
+        """Creates a new (zero-filled) segment of the given size and maps it
+        for writing. The filename is available as `filename` attribute of the
+        returned map."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f'{SEGMENT_PREFIX}{os.getpid()}-{uuid.uuid4().hex}'
+        with open(path, 'wb') as file:
+            file.truncate(max(nbytes, 1))
+        with self._lock:
+            self._segments.add(path)
+        return np.memmap(path, dtype=np.uint8, mode='r+', shape=(max(nbytes, 1),))
+
+    def release(self, filename: FilePath):
+        path = Path(filename)
+        with self._lock:
+            self._segments.discard(path)
+        release_segment(path)
+
+    def detach(self, filename: FilePath):
+        """Removes a segment from the arena without releasing it (the segment
+        is no longer released when the arena is closed)."""
+        with self._lock:
+            self._segments.discard(Path(filename))
+
+    def adopt(self, filename: FilePath):
+        """Takes over the ownership of a segment (e.g. detached from another
+        arena)."""
+        with self._lock:
+            self._segments.add(Path(filename))
+
+    def close(self):
+        """Releases all remaining segments of the arena."""
+        with self._lock:
+            segments, self._segments = self._segments, set()
+        for path in segments:
+            logger.debug(f'Releasing shared memory segment: {path}')
+            release_segment(path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+_process_arena = SharedMemoryArena()
+atexit.register(_process_arena.close)
+
+_current_arena: contextvars.ContextVar[
+    Optional[SharedMemoryArena]
+] = contextvars.ContextVar('rdmlibpy_shared_memory_arena', default=None)
+
+
+def get_arena() -> SharedMemoryArena:
+    """Returns the arena of the current context (see `shared_memory_arena`)
+    or the process-wide arena (closed when the process exits)."""
+    arena = _current_arena.get()
+    return arena if arena is not None else _process_arena
+
+
+@contextlib.contextmanager
+def shared_memory_arena(directory: Optional[FilePath] = None):
+    """Segments created within this context are released when the context
+    is left (unless they have been released before)."""
+    arena = SharedMemoryArena(directory)
+    token = _current_arena.set(arena)
+    try:
+        yield arena
+    finally:
+        _current_arena.reset(token)
+        arena.close()
+
+
+@contextlib.contextmanager
+def shared_memory_workers():
+    """Context of a process pool: segments created by worker processes started
+    within this context are placed in a private directory, which is removed
+    when the context is left (after the workers are finished). Pool workers
+    exit without running exit handlers, so segments which were not released
+    by the receiver would be left behind otherwise.
+    """
+    directory = Path(tempfile.mkdtemp(prefix=SEGMENT_PREFIX, dir=default_directory()))
+    previous = os.environ.get(SHARED_MEMORY_DIR_ENV)
+    # inherited by worker processes (independent of the start method)
+    os.environ[SHARED_MEMORY_DIR_ENV] = str(directory)
+    try:
+        with shared_memory_arena(directory) as arena:
+            yield arena
+    finally:
+        if previous is None:
+            os.environ.pop(SHARED_MEMORY_DIR_ENV, None)
+        else:
+            os.environ[SHARED_MEMORY_DIR_ENV] = previous
+        shutil.rmtree(directory, ignore_errors=True)
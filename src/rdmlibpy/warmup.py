@@ -0,0 +1,298 @@
+"""Prebuilds the caches of all workflows defined in metadata files.
+
+Usage:
+    rdmlibpy-warmup metadata.yaml [--workers 4] [--threads] [--dry-run]
+"""
+
+import argparse
+import contextlib
+import logging
+import os
+import sys
+import time
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Literal, Optional, Tuple
+
+import pydantic
+from omegaconf import DictConfig, ListConfig, OmegaConf
+
+from . import base
+from ._typing import FilePath
+from .metadata import Metadata
+from .process import Cache
+from .shared_memory import shared_memory_workers
+from .workflow import Workflow
+
+logger = logging.getLogger(__name__)
+
+MetadataPath = Tuple[str | int, ...]
+WarmupStatus = Literal['valid', 'built', 'failed']
+
+
+class CacheTask(pydantic.BaseModel):
+    # location of the workflow within the metadata tree
+    path: MetadataPath
+    # index of the cache node within the workflow (see `iter_cache_nodes`)
+    index: int
+    process: str
+    filename: Optional[Path] = None
+    valid: bool = False
+
+    @property
+    def label(self) -> str:
+        location = '.'.join(map(str, self.path)) or '<root>'
+        return f'{self.filename or self.process} ({location})'
+
+
+class WarmupResult(pydantic.BaseModel):
+    task: CacheTask
+    status: WarmupStatus
+    duration: float = 0.0
+    error: Optional[str] = None
+
+
+def _is_workflow(conf: Any) -> bool:
+    # a process descriptor (`run: name@vX`) or a sequence of workflows
+    if isinstance(conf, DictConfig):
+        if '__process__' in conf:
+            return True
+        if ('run' not in conf) or OmegaConf.is_interpolation(conf, 'run'):
+            return False
+        return isinstance(conf.run, str) and ('@v' in conf.run)
+    elif isinstance(conf, ListConfig):
+        return (len(conf) > 0) and all(
+            (not OmegaConf.is_interpolation(conf, i)) and _is_workflow(conf[i])
+            for i in range(len(conf))
+        )
+    return False
+
+
+def find_workflows(conf: Any, path: MetadataPath = ()) -> Iterator[MetadataPath]:
+    """Finds the locations of all workflow descriptors within a metadata tree
+    (workflows nested in other workflows are not reported separately).
+
+    Args:
+        conf (DictConfig | ListConfig): The metadata tree.
+        path (MetadataPath, optional): Location of `conf`. Defaults to ().
+
+    Yields:
+        MetadataPath: The location (keys/indices) of each workflow.
+    """
+    if _is_workflow(conf):
+        yield path
+        return
+
+    if isinstance(conf, DictConfig):
+        keys = list(conf.keys())
+    elif isinstance(conf, ListConfig):
+        keys = list(range(len(conf)))
+    else:
+        return
+
+    for key in keys:
+        if OmegaConf.is_interpolation(conf, key):
+            continue
+        child = conf[key]
+        if isinstance(child, (DictConfig, ListConfig)):
+            yield from find_workflows(child, path + (key,))
+
+
+def _get_node(conf: Any, path: MetadataPath):
+    for key in path:
+        conf = conf[key]
+    return conf
+
+
+def iter_nodes(node: base.ProcessNode) -> Iterator[base.ProcessNode]:
+    """Iterates over all nodes of a workflow (in order of execution)."""
+    if node.parent is not None:
+        yield from iter_nodes(node.parent)
+    for param in node.params.values():
+        if isinstance(param, base.RunnableProcessParam):
+            yield from iter_nodes(param.node)
+        elif isinstance(param, base.RunnableProcessMappingParam):
+            for child in param.nodes.values():
+                yield from iter_nodes(child)
+    yield node
+
+
+def iter_cache_nodes(node: base.ProcessNode) -> Iterator[base.ProcessNode]:
+    return (n for n in iter_nodes(node) if isinstance(n.runner, Cache))
+
+
+def _plain_params(node: base.ProcessNode):
+    return {
+        key: param.get_value()
+        for key, param in node.params.items()
+        if isinstance(param, base.PlainProcessParam)
+    }
+
+
+def _create_task(path: MetadataPath, index: int, node: base.ProcessNode):
+    runner = node.runner
+    assert isinstance(runner, Cache)
+    params = _plain_params(node)
+    try:
+        files = runner.cache_files(**params)
+        valid = runner.cache_is_valid(**params)
+    except (TypeError, KeyError):
+        # parameters are the result of other processes
+        files, valid = [], False
+    return CacheTask(
+        path=path,
+        index=index,
+        process=runner.fullname,
+        filename=Path(files[0]).resolve() if files else None,
+        valid=valid,
+    )
+
+
+def collect_caches(filename: FilePath) -> List[CacheTask]:
+    """Collects the cache nodes of all workflows defined in a metadata file.
+    Caches are deduplicated by their filename.
+
+    Args:
+        filename (FilePath): The metadata (YAML) file.
+
+    Returns:
+        List[CacheTask]: The caches (in order of appearance).
+    """
+    conf = Metadata.to_config(Metadata.load_yaml(filename))
+
+    tasks = {}
+    for path in find_workflows(conf):
+        workflow = Workflow.create(Metadata(_get_node(conf, path)))
+        for index, node in enumerate(iter_cache_nodes(workflow.process)):
+            task = _create_task(path, index, node)
+            key = task.filename if task.filename is not None else (path, index)
+            tasks.setdefault(key, task)
+    return list(tasks.values())
+
+
+def build_cache(filename: FilePath, task: CacheTask) -> WarmupResult:
+    """Builds a single cache (runs the cache node and all preceding nodes
+    of the workflow)."""
+    start = time.perf_counter()
+    try:
+        conf = Metadata.to_config(Metadata.load_yaml(filename))
+        workflow = Workflow.create(Metadata(_get_node(conf, task.path)))
+        node = list(iter_cache_nodes(workflow.process))[task.index]
+        node.run()
+    except Exception as e:
+        logger.exception(f'Building cache failed: {task.label}')
+        return WarmupResult(
+            task=task,
+            status='failed',
+            duration=time.perf_counter() - start,
+            error=f'{type(e).__name__}: {e}',
+        )
+    return WarmupResult(task=task, status='built', duration=time.perf_counter() - start)
+
+
+def warmup(
+    filename: FilePath,
+    workers: Optional[int] = None,
+    threads: bool = False,
+    progress: Optional[Callable[[WarmupResult, int, int], None]] = None,
+) -> List[WarmupResult]:
+    """Builds all invalid caches of the workflows defined in a metadata file
+    in parallel.
+
+    Args:
+        filename (FilePath): The metadata (YAML) file.
+        workers (Optional[int], optional): The number of parallel workers.
+            Defaults to None (number of CPUs).
+        threads (bool, optional): Use threads instead of processes. Defaults
+            to False.
+        progress (Callable[[WarmupResult, int, int], None], optional): Called
+            with the result, the number of finished and total caches whenever
+            a cache is finished. Defaults to None.
+
+    Returns:
+        List[WarmupResult]: The result for each cache.
+    """
+    tasks = collect_caches(filename)
+    total = len(tasks)
+    results = []
+
+    def report(result: WarmupResult):
+        results.append(result)
+        if progress is not None:
+            progress(result, len(results), total)
+
+    for task in tasks:
+        if task.valid:
+            report(WarmupResult(task=task, status='valid'))
+
+    pending = [task for task in tasks if not task.valid]
+    if not pending:
+        return results
+
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    executor: Executor = (
+        ThreadPoolExecutor(workers) if threads else ProcessPoolExecutor(workers)
+    )
+    # shared memory segments left behind by worker processes are removed
+    # after the workers are finished
+    segments = contextlib.nullcontext() if threads else shared_memory_workers()
+    with segments, executor:
+        futures = [executor.submit(build_cache, filename, task) for task in pending]
+        for future in as_completed(futures):
+            report(future.result())
+
+    return results
+
+
+def _print_progress(result: WarmupResult, done: int, total: int):
+    message = f'[{done}/{total}] {result.status:<6} {result.task.label}'
+    if result.status == 'built':
+        message += f' ({result.duration:.1f} s)'
+    elif result.status == 'failed':
+        message += f': {result.error}'
+    print(message, flush=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='rdmlibpy-warmup',
+        description='Builds all caches of the workflows defined in metadata files.',
+    )
+    parser.add_argument('metadata', nargs='+', help='metadata (YAML) files')
+    parser.add_argument(
+        '-j', '--workers', type=int, default=None, help='number of parallel workers'
+    )
+    parser.add_argument(
+        '--threads', action='store_true', help='use threads instead of processes'
+    )
+    parser.add_argument(
+        '--dry-run', action='store_true', help='only list the caches to build'
+    )
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for filename in args.metadata:
+        if args.dry_run:
+            for task in collect_caches(filename):
+                status = 'valid' if task.valid else 'build'
+                print(f'{status:<6} {task.label}')
+            continue
+
+        results = warmup(
+            filename,
+            workers=args.workers,
+            threads=args.threads,
+            progress=_print_progress,
+        )
+        failed += sum(result.status == 'failed' for result in results)
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
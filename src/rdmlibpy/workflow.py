@@ -1,32 +1,55 @@
 from __future__ import annotations
 
+import contextlib
 from collections import deque
 from typing import Any, Dict, Mapping, Optional, Sequence, cast
 
 from . import base
+from .cache_stats import CacheStats, collect_stats
+from .copy_on_write import copy_on_write_mode
 from .registry import get_runner
+from .shared_memory import get_arena, iter_segments, shared_memory_arena
 from .metadata import MetadataNode, Metadata
 
 ProcessDescriptorType = Mapping[str, Any] | MetadataNode
 WorkflowDescriptorType = ProcessDescriptorType | Sequence['WorkflowDescriptorType']
 
 
-def run(workflow: WorkflowDescriptorType):
-    return Workflow.create(workflow).run()
+def run(workflow: WorkflowDescriptorType, copy_on_write: bool = False):
+    return Workflow.create(workflow, copy_on_write=copy_on_write).run()
 
 
 class Workflow:
-    def __init__(self, process: base.ProcessNode):
+    def __init__(self, process: base.ProcessNode, copy_on_write: bool = False):
         self.process = process
+        # run in copy-on-write mode (inputs of processes are never modified)
+        self.copy_on_write = copy_on_write
+        # cache statistics of the most recent run
+        self.stats: Optional[CacheStats] = None
 
     def run(self):
-        return self.process.run()
+        owner = get_arena()
+        with collect_stats() as stats, self._mode(), shared_memory_arena() as arena:
+            self.stats = stats
+            result = self.process.run()
+            # segments created during the run are released when it is finished,
+            # except the returned ones: these are handed over to the enclosing
+            # arena until the receiver of the result attaches them
+            for segment in iter_segments(result):
+                arena.detach(segment.filename)
+                owner.adopt(segment.filename)
+            return result
+
+    def _mode(self):
+        if self.copy_on_write:
+            return copy_on_write_mode()
+        return contextlib.nullcontext()
 
     @staticmethod
-    def create(descriptor: WorkflowDescriptorType):
+    def create(descriptor: WorkflowDescriptorType, copy_on_write: bool = False):
         if isinstance(descriptor, MetadataNode):
             descriptor = cast(dict, Metadata.to_container(descriptor))
-        return Workflow(Workflow._create(None, descriptor))
+        return Workflow(Workflow._create(None, descriptor), copy_on_write)
 
     @staticmethod
     def _create(
@@ -70,15 +93,70 @@ class Workflow:
         if PARAMS_KEY in process:
             for key, value in process[PARAMS_KEY].items():
                 if key.startswith('$'):
-                    # value itself is a process
-                    params[key[1:]] = base.RunnableProcessParam(
-                        Workflow.create(value).process
-                    )
+                    # value itself is a process (or a mapping of processes)
+                    params[key[1:]] = Workflow._create_param(value)
                 else:
                     params[key] = base.PlainProcessParam(value)
 
         # invoke process
-        return base.ProcessNode(parent, runner, params)
+        node = base.ProcessNode(parent, runner, params)
+        Workflow._push_down(node)
+        return node
+
+    @staticmethod
+    def _create_param(
+        descriptor: WorkflowDescriptorType,
+    ) -> base.RunnableProcessParam | base.RunnableProcessMappingParam:
+        # a mapping without `run` (or `__process__`) element holds named
+        # workflows (e.g. multiple data sources)
+        if isinstance(descriptor, Mapping) and not (
+            {'run', '__process__'} & descriptor.keys()
+        ):
+            return base.RunnableProcessMappingParam(
+                {
+                    name: Workflow.create(value).process
+                    for name, value in descriptor.items()
+                }
+            )
+        return base.RunnableProcessParam(Workflow.create(descriptor).process)
+
+    @staticmethod
+    def _push_down(node: base.ProcessNode):
+        # pass the read hints of a transform (e.g. selected columns or time
+        # range) on to the preceding process that provides the data (e.g. a
+        # cache); the hints may only pass other transforms with hints
+        hints = Workflow._get_hints(node)
+        if not hints:
+            return
+
+        target = node.parent
+        while (target is not None) and (Workflow._get_hints(target) is not None):
+            target = target.parent
+        if target is None:
+            return
+
+        # hints of processes closer to the target take precedence
+        for key, value in hints.items():
+            target.hints.setdefault(key, value)
+
+        # the time column is required to select the time range
+        column = target.hints.get('column')
+        columns = target.hints.get('columns')
+        if (column is not None) and (columns is not None) and (column not in columns):
+            target.hints['columns'] = [*columns, column]
+
+    @staticmethod
+    def _get_hints(node: base.ProcessNode) -> Optional[Dict[str, Any]]:
+        pushdown = getattr(node.runner, 'pushdown', None)
+        if (pushdown is None) or not all(
+            isinstance(param, base.PlainProcessParam) for param in node.params.values()
+        ):
+            return None
+        try:
+            return pushdown(**node.get_params())
+        except TypeError:
+            # invalid parameters (reported when running the process)
+            return None
 
     @staticmethod
     def _create_sequence(
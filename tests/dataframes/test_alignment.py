@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+import pint_pandas
+import pytest
+
+from rdmlibpy.dataframes.alignment import (
+    align_onto,
+    concat_columns,
+    exact_onto,
+    grid_onto,
+    grid_step,
+    mean_onto,
+    regular_grid,
+    union_index,
+)
+
+
+def create_frame(offsets_ms, **columns):
+    index = pd.to_datetime('2024-01-01') + pd.to_timedelta(offsets_ms, unit='ms')
+    return pd.DataFrame(columns, index=index.rename('timestamp'))
+
+
+class TestUnionIndex:
+    def test_datetime(self):
+        a = create_frame([0, 1000, 2000], A=[1, 2, 3]).index
+        b = create_frame([500, 1000, 2500], B=[1, 2, 3]).index
+
+        index = union_index([a, b])
+
+        assert isinstance(index, pd.DatetimeIndex)
+        assert index.name == 'timestamp'
+        assert list(index) == sorted(set(a) | set(b))
+
+    def test_numeric(self):
+        index = union_index([pd.Index([0.0, 2.0, 4.0]), pd.Index([1.0, 2.0, 5.0])])
+
+        assert list(index) == [0.0, 1.0, 2.0, 4.0, 5.0]
+
+    def test_timezone(self):
+        a = pd.date_range('2024-01-01', periods=3, freq='s', tz='Europe/Berlin')
+
+        index = union_index([a, a + pd.Timedelta('500ms')])
+
+        assert index.tz == a.tz
+        assert index[0] == a[0]
+
+
+class TestAlignOnto:
+    def test_exact(self):
+        df = create_frame(
+            [0, 1000, 2000],
+            A=pint_pandas.PintArray([1.0, 2.0, 3.0], 'm'),
+            S=['a', 'b', 'c'],
+        )
+        index = create_frame([0, 500, 2000]).index
+
+        result = exact_onto(df, index)
+
+        assert result.index is index
+        assert result['A'].dtype == 'pint[m]'
+        assert np.allclose(result['A'].pint.m, [1.0, np.nan, 3.0], equal_nan=True)
+        assert list(result['S']) == ['a', np.nan, 'c']
+
+    @pytest.mark.parametrize(
+        'policy, expected',
+        [
+            ('interpolate', [1.0, 1.5, 3.0]),
+            ('exact', [1.0, np.nan, 3.0]),
+            ('backward', [1.0, 1.0, 3.0]),
+            ('forward', [1.0, 2.0, 3.0]),
+        ],
+    )
+    def test_policies(self, policy, expected):
+        df = create_frame([0, 1000, 2000], A=[1.0, 2.0, 3.0])
+        index = create_frame([0, 500, 2000]).index
+
+        result = align_onto(df, index, policy)
+
+        assert np.allclose(result['A'], expected, equal_nan=True)
+
+    def test_invalid_policy(self):
+        df = create_frame([0], A=[1.0])
+
+        with pytest.raises(ValueError):
+            align_onto(df, df.index, 'invalid')  # type: ignore
+
+
+class TestConcatColumns:
+    def test_concat(self):
+        a = create_frame([0, 1000], A=[1, 2])
+        b = create_frame([0, 1000], B=[3, 4])
+        a.attrs['name'] = 'a'
+
+        result = concat_columns(a, b)
+
+        assert list(result.columns) == ['A', 'B']
+        assert result.attrs == dict(name='a')
+
+    def test_overlap(self):
+        a = create_frame([0, 1000], A=[1, 2])
+
+        with pytest.raises(ValueError):
+            concat_columns(a, a)
+
+
+class TestGrid:
+    def test_grid_step(self):
+        index = create_frame([0, 1000, 2100, 3000]).index
+
+        assert grid_step(index, '500ms') == 500 * 10**6
+        assert grid_step(index) == 10**9
+        assert grid_step(pd.Index([0.0, 0.5]), 0.25) == 0.25
+        with pytest.raises(ValueError):
+            grid_step(index[:1])
+
+    def test_regular_grid(self):
+        a = create_frame([200, 1500]).index
+        b = create_frame([900, 3100]).index
+
+        grid = regular_grid([a, b], grid_step(a, '1s'))
+
+        assert grid.name == 'timestamp'
+        assert list(grid) == list(create_frame([0, 1000, 2000, 3000]).index)
+
+    def test_mean(self):
+        df = create_frame(
+            [0, 400, 1200, 1500, 3000, 5000],
+            A=pint_pandas.PintArray([1.0, 3.0, 2.0, np.nan, 7.0, 9.0], 'K'),
+        )
+        index = create_frame([0, 1000, 2000, 3000]).index
+
+        result = mean_onto(df, index)
+
+        assert result['A'].dtype == 'pint[K]'
+        assert np.allclose(result['A'].pint.m, [2.0, 2.0, np.nan, 7.0], equal_nan=True)
+
+    def test_methods_per_column(self):
+        df = create_frame(
+            [0, 400, 1000, 2000], A=[0.0, 4.0, 1.0, 3.0], B=[0.0, 4.0, 1.0, 3.0]
+        )
+        index = create_frame([0, 500, 1000, 1500, 2000]).index
+
+        result = grid_onto(df, index, 'mean', methods=dict(A='nearest'))
+
+        assert list(result.columns) == ['A', 'B']
+        assert list(result['A']) == [0.0, 4.0, 1.0, 1.0, 3.0]
+        assert np.allclose(result['B'], [2.0, np.nan, 1.0, np.nan, 3.0], equal_nan=True)
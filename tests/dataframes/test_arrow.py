@@ -0,0 +1,99 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pandas._testing as tm
+import pint_pandas
+import pytest
+
+from rdmlibpy.dataframes.arrow import (
+    METADATA_KEY,
+    from_arrow,
+    read_arrow,
+    read_parquet,
+    to_arrow,
+    write_arrow,
+    write_parquet,
+)
+
+pytest.importorskip('pyarrow')
+
+
+def _get_test_data():
+    df = pd.DataFrame(
+        data=dict(
+            timestamp=pd.date_range('2024-01-16T10:00', periods=5, freq='s'),
+            A=np.arange(5, dtype=float),
+            B=['a', 'b', 'c', 'd', 'e'],
+        )
+    )
+    df['T'] = pint_pandas.PintArray(np.linspace(300, 400, 5), dtype='pint[K]')
+    df.attrs.update(id='2024-01-16A01', inlet=dict(flow_rate='1.0L/min'))
+    return df
+
+
+class TestArrowConversion:
+    def test_schema_metadata(self):
+        df = _get_test_data()
+
+        table = to_arrow(df)
+
+        metadata = json.loads(table.schema.metadata[METADATA_KEY])
+        assert metadata['units'] == {'T': 'K'}
+
+    def test_roundtrip(self):
+        df = _get_test_data()
+
+        actual = from_arrow(to_arrow(df))
+
+        tm.assert_frame_equal(actual, df)
+        assert actual.attrs == df.attrs
+
+    def test_roundtrip_attrs(self):
+        df = _get_test_data()
+        df.attrs.update(start=pd.Timestamp('2024-01-16T10:00'), limits=(1, 2))
+
+        actual = from_arrow(to_arrow(df))
+
+        assert actual.attrs == df.attrs
+        assert isinstance(actual.attrs['start'], pd.Timestamp)
+
+    @pytest.mark.parametrize(
+        'columns', [[0, 1], pd.MultiIndex.from_tuples([('T', 'in'), ('T', 'out')])]
+    )
+    def test_roundtrip_column_labels(self, columns):
+        df = pd.DataFrame(
+            {
+                0: pint_pandas.PintArray([1.0, 2.0], dtype='pint[K]'),
+                1: [3.0, 4.0],
+            }
+        )
+        df.columns = columns
+
+        actual = from_arrow(to_arrow(df))
+
+        tm.assert_frame_equal(actual, df)
+
+
+class TestArrowFiles:
+    def test_read_columns(self, tmp_path):
+        df = _get_test_data().set_index('timestamp')
+        write_arrow(df, tmp_path / 'data.arrow')
+
+        actual = read_arrow(tmp_path / 'data.arrow', columns=['T'])
+
+        tm.assert_frame_equal(actual, df[['T']])
+
+    def test_read_parquet_with_filters(self, tmp_path):
+        df = _get_test_data()
+        write_parquet(df, tmp_path / 'data.parquet')
+
+        actual = read_parquet(
+            tmp_path / 'data.parquet',
+            columns=['timestamp', 'T'],
+            filters=[('timestamp', '>=', pd.Timestamp('2024-01-16T10:00:03'))],
+        )
+
+        tm.assert_frame_equal(
+            actual, df[['timestamp', 'T']].iloc[3:], check_index_type=False
+        )
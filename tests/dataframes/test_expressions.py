@@ -0,0 +1,184 @@
+import ast
+
+import numpy as np
+import pandas as pd
+import pint
+import pint_pandas
+import pytest
+
+from rdmlibpy.dataframes import DataFrameEval
+from rdmlibpy.dataframes.expressions import (
+    eliminate_subexpressions,
+    evaluate,
+    parse_expression,
+)
+
+
+def create_frame():
+    return pd.DataFrame(
+        {
+            'NO': pint_pandas.PintArray([100.0, 200.0, 300.0], 'ppm'),
+            'NO2': pint_pandas.PintArray([0.01, 0.02, 0.03], 'percent'),
+            'T-in': pint_pandas.PintArray([20.0, 30.0, 40.0], 'degC'),
+            'T-out': pint_pandas.PintArray([40.0, 50.0, 60.0], 'degC'),
+            'L': pint_pandas.PintArray([1.0, 2.0, 3.0], 'km'),
+            't': pint_pandas.PintArray([1.0, 2.0, 3.0], 'h'),
+            'n': [1, 2, 3],
+        }
+    )
+
+
+class TestParseExpression:
+    def test_names(self):
+        _, names = parse_expression('sqrt(A) + `T-in` * B')
+
+        assert sorted(names.values()) == ['A', 'B', 'T-in']
+
+    @pytest.mark.parametrize(
+        'expression', ['A.B', 'A[0]', 'open(A)', '__import__("os")', 'lambda: A']
+    )
+    def test_unsupported(self, expression):
+        with pytest.raises(ValueError):
+            parse_expression(expression)
+
+
+class TestEliminateSubexpressions:
+    def test_common_subexpressions(self):
+        trees = [
+            parse_expression(e)[0].body
+            for e in ['(a + b) * c', 'sqrt((a + b) * c) / (a + b)', 'a * 2 + 1']
+        ]
+
+        trees, definitions = eliminate_subexpressions(trees)
+
+        assert {k: ast.unparse(v) for k, v in definitions.items()} == {
+            '__t0': '__t1 * c',
+            '__t1': 'a + b',
+        }
+        assert [ast.unparse(tree) for tree in trees] == [
+            '__t0',
+            'sqrt(__t0) / __t1',
+            'a * 2 + 1',
+        ]
+
+    def test_single_use_is_inlined(self):
+        trees = [parse_expression(e)[0].body for e in ['(a + b) * c', '(a + b) * c']]
+
+        trees, definitions = eliminate_subexpressions(trees)
+
+        assert {k: ast.unparse(v) for k, v in definitions.items()} == {
+            '__t0': '(a + b) * c'
+        }
+        assert [ast.unparse(tree) for tree in trees] == ['__t0', '__t0']
+
+
+class TestEvaluate:
+    def test_units(self):
+        results = evaluate(
+            create_frame(),
+            {
+                'NOx': 'NO + NO2',
+                'T': '`T-in` + (`T-out` - `T-in`) / 2',
+                'dT': '`T-out` - `T-in`',
+                'v': 'L / t',
+                'ratio': 'NO / NO2',
+            },
+        )
+
+        assert results['NOx'].dtype == 'pint[ppm]'
+        np.testing.assert_allclose(results['NOx'].quantity.m, [200.0, 400.0, 600.0])
+        assert results['T'].dtype == 'pint[degC]'
+        np.testing.assert_allclose(results['T'].quantity.m, [30.0, 40.0, 50.0])
+        assert results['dT'].dtype == 'pint[delta_degC]'
+        np.testing.assert_allclose(results['dT'].quantity.m, [20.0, 20.0, 20.0])
+        assert results['v'].dtype == 'pint[m/s]'
+        np.testing.assert_allclose(results['v'].quantity.m, [1 / 3.6] * 3)
+        # dimensionless results are plain
+        np.testing.assert_allclose(results['ratio'], [1.0, 1.0, 1.0])
+
+    def test_ratios(self):
+        df = create_frame().assign(
+            NO2=pint_pandas.PintArray([50.0, 100.0, 150.0], 'ppm')
+        )
+
+        results = evaluate(
+            df,
+            {
+                '_NOx': 'NO + NO2',
+                'conversion': '1 - _NOx / (2 * NO)',
+                'ratio': 'NO / NO2',
+                'log': 'log(NO / NO2)',
+                'F': 'sqrt(L / t)',
+            },
+        )
+
+        np.testing.assert_allclose(results['conversion'], [0.25, 0.25, 0.25])
+        np.testing.assert_allclose(results['ratio'], [2.0, 2.0, 2.0])
+        np.testing.assert_allclose(results['log'], np.log([2.0, 2.0, 2.0]))
+        assert results['F'].dtype == 'pint[meter ** 0.5 / second ** 0.5]'
+        np.testing.assert_allclose(results['F'].quantity.m, [1 / 3.6**0.5] * 3)
+
+    def test_ratio_in_percent(self):
+        results = evaluate(create_frame(), {'r': 'NO / NO2'}, units={'r': '%'})
+
+        assert results['r'].dtype == 'pint[percent]'
+        np.testing.assert_allclose(results['r'].quantity.m, [100.0] * 3)
+
+    def test_offset_units(self):
+        with pytest.raises(pint.errors.OffsetUnitCalculusError):
+            evaluate(create_frame(), {'x': '`T-in` * 2'})
+
+    def test_target_units(self):
+        results = evaluate(create_frame(), {'v': 'L / t'}, units={'v': 'km/h'})
+
+        assert results['v'].dtype == 'pint[km/h]'
+        np.testing.assert_allclose(results['v'].quantity.m, [1.0, 1.0, 1.0])
+
+    def test_temporaries(self):
+        results = evaluate(
+            create_frame(), {'_x': 'n * 2', 'y': '_x + 1', 'z': 'log10(y) > 0.5'}
+        )
+
+        assert list(results.keys()) == ['y', 'z']
+        np.testing.assert_allclose(results['y'], [3.0, 5.0, 7.0])
+        assert list(results['z']) == [False, True, True]
+
+    def test_engines(self):
+        expressions = {
+            'T': '`T-in` + (`T-out` - `T-in`) / 2',
+            'c': '(NO + NO2) / (NO + NO2 + 1) > 0 and not n > 2',
+            'r': '1 < n <= 2',
+        }
+
+        expected = evaluate(create_frame(), expressions, engine='python')
+        results = evaluate(create_frame(), expressions, engine='numexpr')
+
+        np.testing.assert_allclose(results['T'].quantity.m, [30.0, 40.0, 50.0])
+        np.testing.assert_allclose(results['T'].quantity.m, expected['T'].quantity.m)
+        assert list(results['c']) == list(expected['c']) == [True, True, False]
+        assert list(results['r']) == list(expected['r']) == [False, True, False]
+
+    def test_incompatible_units(self):
+        with pytest.raises(pint.errors.DimensionalityError):
+            evaluate(create_frame(), {'x': 'L + t'})
+
+    def test_unknown_column(self):
+        with pytest.raises(KeyError):
+            evaluate(create_frame(), {'x': 'missing * 2'})
+
+
+class TestDataFrameEval:
+    def test_create(self):
+        transform = DataFrameEval()
+
+        assert transform.name == 'dataframe.eval'
+        assert transform.version == '1'
+
+    def test_add_columns(self):
+        df = create_frame()
+
+        result = DataFrameEval().run(df, {'NOx': 'NO + NO2', 'n': 'n * 10'})
+
+        assert list(result.columns) == [*create_frame().columns, 'NOx']
+        assert result['NOx'].dtype == 'pint[ppm]'
+        assert list(result['n']) == [10.0, 20.0, 30.0]
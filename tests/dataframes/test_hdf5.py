@@ -0,0 +1,144 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pandas._testing as tm
+import pint_pandas
+import pytest
+import tables
+
+from rdmlibpy.dataframes import DataFrameReadHDF5, DataFrameWriteHDF5
+
+
+def _get_test_data(periods=10, start='2024-01-16T10:00'):
+    df = pd.DataFrame(
+        data=dict(
+            timestamp=pd.date_range(start, periods=periods, freq='s'),
+            A=np.arange(periods, dtype=float),
+        )
+    )
+    df['T'] = pint_pandas.PintArray(np.linspace(300, 400, periods), dtype='pint[K]')
+    df.attrs.update(id='2024-01-16A01')
+    return df
+
+
+class TestDataFrameWriteHDF5:
+    def test_create(self):
+        writer = DataFrameWriteHDF5()
+
+        assert writer.name == 'dataframe.write.hdf5'
+        assert writer.version == '1'
+        assert writer.mode == 'append'
+
+    def test_write(self, tmp_path: Path):
+        df = _get_test_data()
+        path = tmp_path / 'data.h5'
+
+        actual = DataFrameWriteHDF5().run(df, path)
+
+        # make sure input data is returned unaltered
+        assert actual is df
+
+        with pd.HDFStore(path, 'r') as store:
+            storer = store.get_storer('data')
+            assert storer.is_table
+            assert storer.nrows == 10
+            assert storer.attrs.units == {'T': 'K'}
+            assert storer.table.colindexed['timestamp']
+
+    def test_append_only_new_rows(self, tmp_path: Path):
+        df = _get_test_data(periods=20)
+        path = tmp_path / 'data.h5'
+
+        writer = DataFrameWriteHDF5()
+        writer.run(df.iloc[:10], path)
+        writer.run(df.iloc[5:15], path)
+        writer.run(df, path)
+
+        actual = DataFrameReadHDF5().run(path)
+        tm.assert_frame_equal(actual, df)
+        assert actual.attrs == df.attrs
+
+    def test_overwrite(self, tmp_path: Path):
+        df = _get_test_data(periods=20)
+        path = tmp_path / 'data.h5'
+
+        DataFrameWriteHDF5().run(df, path)
+        DataFrameWriteHDF5(mode='overwrite').run(df.iloc[:5], path)
+
+        actual = DataFrameReadHDF5().run(path)
+        tm.assert_frame_equal(actual, df.iloc[:5])
+
+    def test_append_with_different_units(self, tmp_path: Path):
+        df = _get_test_data(periods=20)
+        path = tmp_path / 'data.h5'
+        DataFrameWriteHDF5().run(df.iloc[:10], path)
+
+        df2 = df.iloc[10:].copy()
+        df2['T'] = df2['T'].pint.to('degC')
+        with pytest.raises(ValueError):
+            DataFrameWriteHDF5().run(df2, path)
+
+    def test_datetime_index(self, tmp_path: Path):
+        df = _get_test_data(periods=20).set_index('timestamp')
+        path = tmp_path / 'data.h5'
+
+        writer = DataFrameWriteHDF5(column=None)
+        writer.run(df.iloc[:10], path)
+        writer.run(df.iloc[5:], path)
+
+        actual = DataFrameReadHDF5().run(path)
+        tm.assert_frame_equal(actual, df, check_freq=False)
+
+    def test_compression_and_expectedrows(self, tmp_path: Path):
+        df = _get_test_data()
+
+        DataFrameWriteHDF5().run(df, tmp_path / 'default.h5')
+        writer = DataFrameWriteHDF5(complib='zlib', complevel=9, expectedrows=10**8)
+        writer.run(df, tmp_path / 'data.h5')
+
+        with tables.open_file(tmp_path / 'default.h5', 'r') as file:
+            default_chunkshape = file.get_node('/data/table').chunkshape
+        with tables.open_file(tmp_path / 'data.h5', 'r') as file:
+            table = file.get_node('/data/table')
+            # larger chunks for larger tables
+            assert table.chunkshape[0] > default_chunkshape[0]
+            assert table.filters.complib == 'zlib'
+            assert table.filters.complevel == 9
+
+
+class TestDataFrameReadHDF5:
+    def test_create(self):
+        loader = DataFrameReadHDF5()
+
+        assert loader.name == 'dataframe.read.hdf5'
+        assert loader.version == '1'
+
+    def test_read_timespan(self, tmp_path: Path):
+        df = _get_test_data()
+        path = tmp_path / 'data.h5'
+        DataFrameWriteHDF5().run(df, path)
+
+        actual = DataFrameReadHDF5().run(
+            path, start='2024-01-16T10:00:02', stop='2024-01-16T10:00:04.5'
+        )
+
+        tm.assert_frame_equal(actual, df.iloc[2:5])
+
+    def test_read_timespan_on_index(self, tmp_path: Path):
+        df = _get_test_data().set_index('timestamp')
+        path = tmp_path / 'data.h5'
+        DataFrameWriteHDF5(column=None).run(df, path)
+
+        actual = DataFrameReadHDF5().run(path, start='2024-01-16T10:00:07')
+
+        tm.assert_frame_equal(actual, df.iloc[7:], check_freq=False)
+
+    def test_read_columns(self, tmp_path: Path):
+        df = _get_test_data()
+        path = tmp_path / 'data.h5'
+        DataFrameWriteHDF5().run(df, path)
+
+        actual = DataFrameReadHDF5().run(path, columns=['timestamp', 'T'])
+
+        tm.assert_frame_equal(actual, df[['timestamp', 'T']])
@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+import pint_pandas
+
+from rdmlibpy.dataframes import DataFrameInterpolate
+from rdmlibpy.dataframes.interpolation import (
+    as_float,
+    interpolate_frame,
+    interpolation_weights,
+    time_base,
+)
+
+
+def reference(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    valid = ~np.isnan(y)
+    return np.interp(x, x[valid], y[valid])
+
+
+def create_frame(n: int = 200, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2023-01-01', periods=n, freq='s')
+    index = index + pd.to_timedelta(rng.integers(0, 500, n), unit='ms')
+    shared_mask = rng.random(n) < 0.3
+    data = {}
+    for i in range(6):
+        values = rng.random(n)
+        # columns 0-3 share the same missing values
+        mask = shared_mask if i < 4 else rng.random(n) < 0.5
+        values[mask] = np.nan
+        data[f'c{i}'] = values
+    return pd.DataFrame(data, index=index)
+
+
+class TestInterpolationKernel:
+    def test_time_base(self):
+        index = pd.date_range('2023-01-01', periods=3, freq='s')
+
+        assert time_base(index).dtype == np.int64
+        assert list(np.diff(time_base(index))) == [10**9, 10**9]
+        assert time_base(pd.Index([0, 1.5])).dtype == np.float64
+
+    def test_weights_match_np_interp(self):
+        x = np.array([-5, 0, 5, 10, 15, 20, 30, 40, 50], dtype=np.int64)
+        valid = np.array([0, 1, 0, 1, 0, 1, 0, 1, 0], dtype=bool)
+        yp = np.array([1.0, 2.0, 0.0, 4.0])
+
+        missing, left, right, w = interpolation_weights(x, valid)
+        y = np.full(len(x), np.nan)
+        y[valid] = yp
+        y[missing] = y[left] * (1 - w) + y[right] * w
+
+        np.testing.assert_allclose(y, np.interp(x, x[valid], yp))
+
+    def test_matches_column_wise_interpolation(self):
+        df = create_frame()
+        x = (df.index - df.index[0]).total_seconds().to_numpy()
+        expected = {col: reference(x, df[col].to_numpy()) for col in df.columns}
+
+        result = interpolate_frame(df)
+
+        assert result is df
+        for col in df.columns:
+            np.testing.assert_allclose(result[col].to_numpy(), expected[col])
+
+    def test_units_are_preserved(self):
+        df = create_frame()
+        x = (df.index - df.index[0]).total_seconds().to_numpy()
+        expected = reference(x, df['c0'].to_numpy())
+        df['c0'] = pint_pandas.PintArray(df['c0'].to_numpy(), 'm')
+        df['c1'] = pint_pandas.PintArray(df['c1'].to_numpy(), 's')
+
+        interpolate_frame(df)
+
+        assert df['c0'].dtype == 'pint[m]'
+        assert df['c1'].dtype == 'pint[s]'
+        np.testing.assert_allclose(df['c0'].pint.m.to_numpy(), expected)
+
+    def test_degenerate_columns(self):
+        df = pd.DataFrame(
+            dict(
+                A=[np.nan, np.nan, np.nan],
+                B=[np.nan, 2.0, np.nan],
+                C=['a', 'b', 'c'],
+                D=[1, 2, 3],
+            ),
+            index=[0.0, 1.0, 2.0],
+        )
+
+        interpolate_frame(df)
+
+        assert df['A'].isna().all()
+        assert list(df['B']) == [2.0, 2.0, 2.0]
+        assert list(df['C']) == ['a', 'b', 'c']
+        assert list(df['D']) == [1, 2, 3]
+
+    def test_selected_columns(self):
+        df = create_frame()
+
+        interpolate_frame(df, ['c0'])
+
+        assert not df['c0'].isna().any()
+        assert df['c1'].isna().any()
+
+    def test_as_float(self):
+        df = pd.DataFrame(
+            dict(
+                A=[1, 2],
+                B=pint_pandas.PintArray([1, 2], 'm'),
+                C=pint_pandas.PintArray(np.array([1, 2]), 'm'),
+                D=[1.5, 2.5],
+            )
+        )
+
+        result = as_float(df)
+
+        assert result['A'].dtype == np.float64
+        assert result['B'].dtype == 'pint[m]'
+        assert result['B'].pint.m.dtype == np.float64
+        assert result['C'].pint.m.dtype == np.float64
+        assert df['A'].dtype == np.int64
+
+
+class TestDataFrameInterpolate:
+    def test_create(self):
+        transform = DataFrameInterpolate()
+
+        assert transform.name == 'dataframe.interpolate'
+        assert transform.version == '1'
+
+    def test_include_exclude(self):
+        df = create_frame()
+
+        result = DataFrameInterpolate().run(df, include=['c0', 'c1'], exclude=['c1'])
+
+        assert not result['c0'].isna().any()
+        assert result['c1'].isna().any()
+        assert result['c2'].isna().any()
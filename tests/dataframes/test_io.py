@@ -6,7 +6,9 @@ import numpy as np
 import pandas as pd
 import pandas._testing as tm
 import pint_pandas
+import pytest
 
+from rdmlibpy import Workflow
 from rdmlibpy.base import PlainProcessParam, ProcessNode
 from rdmlibpy.dataframes import DataFrameFileCache, DataFrameReadCSV, DataFrameWriteCSV
 from rdmlibpy.dataframes.io import quantify
@@ -520,6 +522,114 @@ class TestDataFrameWriteCSV:
 
         assert lines == ['A;B\n', '1.1;aa\n', '2.2;bb\n', '3.3;cc\n']
 
+    def test_write_in_chunks(self, tmp_path: Path):
+        df = pd.DataFrame(
+            data=dict(
+                A=[1.1, 2.2, 3.3, 4.4, 5.5],
+                B=['aa', 'bb', 'cc', 'dd', 'ee'],
+            )
+        )
+        df['E'] = pint_pandas.PintArray([1.0, 2.0, np.nan, 4.0, 5.0], dtype='pint[m]')
+
+        expected = io.StringIO()
+        DataFrameWriteCSV(chunksize=100).run(df, expected)
+        actual = io.StringIO()
+        DataFrameWriteCSV(chunksize=2).run(df, actual)
+
+        assert actual.getvalue() == expected.getvalue()
+
+    def test_datetime_formatting_with_missing_values(self):
+        df = pd.DataFrame(
+            data=dict(
+                A=[1.1, 2.2, 3.3],
+                C=[
+                    np.datetime64('2024-01-16T10:05:28.537'),
+                    np.datetime64('NaT'),
+                    np.datetime64('2024-01-16T10:05:30.935'),
+                ],
+            )
+        )
+
+        buffer = io.StringIO()
+        DataFrameWriteCSV().run(df, buffer)
+
+        assert buffer.getvalue().splitlines() == [
+            'A,C',
+            '1.1,2024-01-16T10:05:28.537000',
+            '2.2,',
+            '3.3,2024-01-16T10:05:30.935000',
+        ]
+
+    def test_does_not_modify_source(self, tmp_path: Path):
+        df = pd.DataFrame(
+            data=dict(A=[1.1, 2.2, 3.3]),
+            index=pd.Index(['i', 'ii', 'iii'], name='C'),
+        )
+        df['E'] = pint_pandas.PintArray([1.0, 2.0, 3.0], dtype='pint[m]')
+        expected = df.copy()
+
+        DataFrameWriteCSV().run(df, tmp_path / 'data.csv')
+
+        tm.assert_frame_equal(df, expected)
+
+    def test_pyarrow_engine(self, tmp_path: Path):
+        pytest.importorskip('pyarrow')
+        df = pd.DataFrame(
+            data=dict(
+                A=[1.1, 2.2, np.nan],
+                B=['aa', 'b;b', 'cc'],
+                C=[
+                    np.datetime64('2024-01-16T10:05:28.537'),
+                    np.datetime64('2024-01-16T10:05:29.735'),
+                    np.datetime64('2024-01-16T10:05:30.935'),
+                ],
+            )
+        )
+        df['E'] = pint_pandas.PintArray([1.0, 2.0, 3.0], dtype='pint[m]')
+        path = tmp_path / 'data.csv'
+
+        writer = DataFrameWriteCSV(engine='pyarrow', separator=';', chunksize=2)
+        writer.run(df, path)
+
+        # load data from written file
+        actual = pd.read_csv(
+            path, sep=';', parse_dates=[2], date_format='ISO8601', header=[0, 1]
+        )
+        actual = quantify(actual, level=-1)
+
+        tm.assert_frame_equal(actual, df)
+
+    def test_pyarrow_engine_requires_decimal_point(self):
+        pytest.importorskip('pyarrow')
+        df = pd.DataFrame(data=dict(A=[1.1, 2.2, 3.3]))
+
+        writer = DataFrameWriteCSV(engine='pyarrow', decimal=',', separator=';')
+        with pytest.raises(ValueError):
+            writer.run(df, io.StringIO())
+
+    @pytest.mark.parametrize(
+        'options', [dict(float_format='%.3f'), dict(na_rep='NA'), dict(quoting=1)]
+    )
+    def test_pyarrow_engine_rejects_unsupported_options(self, options):
+        pytest.importorskip('pyarrow')
+        df = pd.DataFrame(data=dict(A=[1.1, 2.2, 3.3]))
+
+        writer = DataFrameWriteCSV(engine='pyarrow', options=options)
+        with pytest.raises(ValueError):
+            writer.run(df, io.StringIO())
+
+    def test_pyarrow_engine_keep_units(self):
+        pytest.importorskip('pyarrow')
+        df = pd.DataFrame(data=dict(A=[1.5, np.nan]))
+        df['T'] = pint_pandas.PintArray([1.5, np.nan], dtype='pint[m]')
+
+        expected = io.StringIO()
+        DataFrameWriteCSV(units='keep-units').run(df, expected)
+        actual = io.StringIO()
+        DataFrameWriteCSV(engine='pyarrow', units='keep-units').run(df, actual)
+
+        assert actual.getvalue() == expected.getvalue()
+
 
 class TestDataFrameFileCache:
     def test_create(self):
@@ -776,3 +886,169 @@ class TestDataFrameFileCache:
         # assert content
         tm.assert_frame_equal(df, cached)
         assert df.attrs == cached.attrs
+
+    @pytest.mark.parametrize('format', ['arrow', 'parquet'])
+    def test_columnar_formats(self, tmp_path, format):
+        pytest.importorskip('pyarrow')
+        path = tmp_path / f'cache.{format}'
+        df = pd.DataFrame(
+            data=dict(
+                A=[1.1, 2.2, 3.3],
+                B=['aa', 'bb', 'cc'],
+                C=[
+                    np.datetime64('2024-01-16T10:05:28.537'),
+                    np.datetime64('2024-01-16T10:05:29.735'),
+                    np.datetime64('2024-01-16T10:05:30.935'),
+                ],
+            ),
+        )
+        df['E'] = pint_pandas.PintArray([1.0, 2.0, 3.0], dtype='pint[m]')
+        df = df.set_index('C')
+        df.attrs.update(
+            dict(date='2024-04-26', inlet=dict(flow_rate='1.0L/min', scale=2.0))
+        )
+
+        workflow = ProcessNode(
+            ProcessNode(None, DelegatedSource(delegate=lambda: df), {}),
+            DataFrameFileCache(format=format),
+            {
+                'filename': PlainProcessParam(str(path)),
+            },
+        )
+
+        # create cache
+        assert not path.exists()
+        workflow.run()
+        assert path.exists()
+
+        # load cached version (by running process again)
+        cached = workflow.run()
+        assert cached is not df
+
+        # assert content
+        tm.assert_frame_equal(df, cached)
+        assert df.attrs == cached.attrs
+
+    def test_arrow_format_is_memory_mapped(self, tmp_path):
+        pytest.importorskip('pyarrow')
+        path = tmp_path / 'cache.arrow'
+        df = pd.DataFrame(data=dict(A=np.arange(1000.0), B=np.arange(1000)))
+
+        cache = DataFrameFileCache(format='arrow')
+        cache.write(df, path)
+        cached = cache.read(path)
+
+        tm.assert_frame_equal(df, cached)
+        # data of memory mapped files is read-only (not copied to memory)
+        assert not cached['A'].to_numpy().flags.writeable
+
+    @pytest.mark.parametrize(
+        'config',
+        [
+            dict(),
+            dict(layout='table', column='C'),
+            dict(format='arrow'),
+            dict(format='parquet'),
+        ],
+    )
+    def test_read_selection(self, tmp_path, config):
+        if config.get('format') is not None:
+            pytest.importorskip('pyarrow')
+        path = tmp_path / 'cache.data'
+        df = pd.DataFrame(
+            data=dict(
+                A=np.arange(10.0),
+                B=np.arange(10),
+                C=pd.date_range('2024-01-16T10:00', periods=10, freq='min'),
+            ),
+        )
+        df['E'] = pint_pandas.PintArray(np.arange(10.0), dtype='pint[m]')
+        df.attrs.update(dict(date='2024-04-26'))
+
+        cache = DataFrameFileCache(**config)
+        cache.write(df, path)
+        cached = cache.read(
+            path,
+            columns=['A', 'E'],
+            column='C',
+            start='2024-01-16T10:02',
+            stop='2024-01-16T10:04',
+        )
+
+        expected = df.iloc[2:5][['A', 'E']]
+        tm.assert_frame_equal(expected, cached, check_index_type=False)
+        assert cached.attrs == df.attrs
+
+    def test_read_hints_of_workflow(self, tmp_path):
+        path = tmp_path / 'cache.h5'
+        df = pd.DataFrame(
+            data=dict(
+                A=np.arange(10.0),
+                B=np.arange(10),
+                C=pd.date_range('2024-01-16T10:00', periods=10, freq='min'),
+            ),
+        )
+        DataFrameFileCache(layout='table', column='C').write(df, path)
+
+        descriptor = [
+            {
+                'run': 'dataframe.cache@v1',
+                'config': {'layout': 'table', 'column': 'C'},
+                'params': {'filename': str(path)},
+            },
+            {
+                'run': 'dataframe.select.timespan@v1',
+                'params': {'column': 'C', 'start': '2024-01-16T10:05'},
+            },
+            {
+                'run': 'dataframe.select.columns@v1',
+                'params': {'select': ['A']},
+            },
+        ]
+        workflow = Workflow.create(descriptor)
+
+        # hints are passed to the cache
+        cache_node = workflow.process.parent.parent
+        assert cache_node.hints == dict(
+            column='C', start='2024-01-16T10:05', stop=None, columns=['A', 'C']
+        )
+
+        result = workflow.run()
+        tm.assert_frame_equal(df.iloc[5:][['A']], result, check_index_type=False)
+
+    @pytest.mark.parametrize('layout', ['fixed', 'table'])
+    def test_compression(self, tmp_path, layout):
+        tables = pytest.importorskip('tables')
+        df = pd.DataFrame(
+            data=dict(
+                A=np.sin(np.linspace(0, 10, 10_000)),
+                B=np.arange(10_000),
+            ),
+            index=pd.date_range('2024-01-16T10:00', periods=10_000, freq='s'),
+        )
+        df['E'] = pint_pandas.PintArray(np.linspace(0, 1, 10_000), dtype='pint[m]')
+
+        plain = DataFrameFileCache(layout=layout)
+        plain.write(df, tmp_path / 'plain.h5')
+        compressed = DataFrameFileCache(
+            layout=layout,
+            complib='blosc:lz4',
+            complevel=5,
+        )
+        compressed.write(df, tmp_path / 'compressed.h5')
+
+        tm.assert_frame_equal(df, compressed.read(tmp_path / 'compressed.h5'))
+        assert (tmp_path / 'compressed.h5').stat().st_size < (
+            tmp_path / 'plain.h5'
+        ).stat().st_size
+
+        with tables.open_file(tmp_path / 'compressed.h5') as file:
+            leaves = [
+                node
+                for node in file.walk_nodes('/data')
+                if isinstance(node, tables.Leaf) and node.filters.complevel
+            ]
+            assert leaves
+            for leaf in leaves:
+                assert leaf.filters.complib == 'blosc:lz4'
+                assert leaf.filters.shuffle
@@ -0,0 +1,188 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pandas._testing as tm
+import pint_pandas
+import pytest
+
+from rdmlibpy import run
+from rdmlibpy.dataframes import DataFrameReadPartitioned, DataFrameWritePartitioned
+from rdmlibpy.dataframes.partitioned import load_manifest
+
+
+def _get_test_data():
+    df = pd.DataFrame(
+        data=dict(
+            timestamp=pd.date_range('2024-01-16T22:00', periods=8, freq='h'),
+            A=np.arange(8, dtype=float),
+            B=['a', 'a', 'a', 'b', 'b', 'b', 'b', 'b'],
+        )
+    )
+    df['C'] = pint_pandas.PintArray(np.arange(8, dtype=float), dtype='pint[K]')
+    df.attrs.update(id='2024-01-16A01')
+    return df
+
+
+class TestDataFrameWritePartitioned:
+    def test_create(self):
+        writer = DataFrameWritePartitioned()
+
+        assert writer.name == 'dataframe.write.partitioned'
+        assert writer.version == '1'
+        assert writer.freq == 'day'
+
+    def test_partition_by_day(self, tmp_path: Path):
+        df = _get_test_data()
+
+        writer = DataFrameWritePartitioned(column='timestamp')
+        actual = writer.run(df, tmp_path / 'dataset')
+
+        # make sure input data is returned unaltered
+        assert actual is df
+
+        assert (tmp_path / 'dataset/2024-01-16.h5').exists()
+        assert (tmp_path / 'dataset/2024-01-17.h5').exists()
+
+        manifest = load_manifest(tmp_path / 'dataset')
+        assert manifest['column'] == 'timestamp'
+        assert [p['file'] for p in manifest['partitions']] == [
+            '2024-01-16.h5',
+            '2024-01-17.h5',
+        ]
+        assert [p['rows'] for p in manifest['partitions']] == [2, 6]
+        assert manifest['partitions'][0]['start'] == '2024-01-16T22:00:00'
+        assert manifest['partitions'][0]['stop'] == '2024-01-16T23:00:00'
+
+    def test_append_to_partition(self, tmp_path: Path):
+        df = _get_test_data()
+
+        writer = DataFrameWritePartitioned(column='timestamp')
+        writer.run(df.iloc[3:6], tmp_path / 'dataset')
+        writer.run(df.iloc[6:], tmp_path / 'dataset')
+        # rewritten rows replace the existing ones
+        writer.run(df.iloc[:4], tmp_path / 'dataset')
+
+        manifest = load_manifest(tmp_path / 'dataset')
+        assert [p['rows'] for p in manifest['partitions']] == [2, 6]
+        assert manifest['partitions'][1]['start'] == '2024-01-17T00:00:00'
+        assert manifest['partitions'][1]['stop'] == '2024-01-17T05:00:00'
+        actual = DataFrameReadPartitioned().run(tmp_path / 'dataset')
+        tm.assert_frame_equal(actual, df, check_index_type=False)
+
+    def test_partition_by_hour_on_index(self, tmp_path: Path):
+        df = _get_test_data().set_index('timestamp')
+
+        writer = DataFrameWritePartitioned(freq='hour')
+        writer.run(df, tmp_path / 'dataset')
+
+        manifest = load_manifest(tmp_path / 'dataset')
+        assert manifest['column'] is None
+        assert len(manifest['partitions']) == 8
+        assert (tmp_path / 'dataset/2024-01-17T05.h5').exists()
+
+    def test_partition_by_key_column(self, tmp_path: Path):
+        df = _get_test_data()
+
+        writer = DataFrameWritePartitioned(column='timestamp', key='B', freq=None)
+        writer.run(df, tmp_path / 'dataset')
+
+        assert (tmp_path / 'dataset/a/data.h5').exists()
+        assert (tmp_path / 'dataset/b/data.h5').exists()
+        manifest = load_manifest(tmp_path / 'dataset')
+        assert [p['key'] for p in manifest['partitions']] == ['a', 'b']
+
+    def test_partition_by_key_from_attrs(self, tmp_path: Path):
+        df = _get_test_data()
+        df2 = df.copy()
+        df2.attrs.update(id='2024-01-16A02')
+
+        writer = DataFrameWritePartitioned(column='timestamp', key='id')
+        writer.run(df, tmp_path / 'dataset')
+        writer.run(df2, tmp_path / 'dataset')
+
+        manifest = load_manifest(tmp_path / 'dataset')
+        assert [p['file'] for p in manifest['partitions']] == [
+            '2024-01-16A01/2024-01-16.h5',
+            '2024-01-16A01/2024-01-17.h5',
+            '2024-01-16A02/2024-01-16.h5',
+            '2024-01-16A02/2024-01-17.h5',
+        ]
+
+    def test_invalid_key(self, tmp_path: Path):
+        writer = DataFrameWritePartitioned(column='timestamp', key='unknown')
+        with pytest.raises(KeyError):
+            writer.run(_get_test_data(), tmp_path / 'dataset')
+
+
+class TestDataFrameReadPartitioned:
+    def test_create(self):
+        loader = DataFrameReadPartitioned()
+
+        assert loader.name == 'dataframe.read.partitioned'
+        assert loader.version == '1'
+
+    def test_roundtrip(self, tmp_path: Path):
+        df = _get_test_data()
+        DataFrameWritePartitioned(column='timestamp').run(df, tmp_path / 'dataset')
+
+        actual = DataFrameReadPartitioned().run(tmp_path / 'dataset')
+
+        tm.assert_frame_equal(actual, df)
+        assert actual.attrs == df.attrs
+
+    def test_read_timespan(self, tmp_path: Path):
+        df = _get_test_data().set_index('timestamp')
+        DataFrameWritePartitioned().run(df, tmp_path / 'dataset')
+
+        actual = DataFrameReadPartitioned().run(
+            tmp_path / 'dataset',
+            start='2024-01-17T01:00',
+            stop='2024-01-17T02:30',
+        )
+
+        tm.assert_frame_equal(actual, df.iloc[3:5])
+
+    def test_read_key(self, tmp_path: Path):
+        df = _get_test_data()
+        writer = DataFrameWritePartitioned(column='timestamp', key='B')
+        writer.run(df, tmp_path / 'dataset')
+
+        actual = DataFrameReadPartitioned().run(tmp_path / 'dataset', key='b')
+
+        assert list(actual.B) == ['b'] * 5
+
+    def test_read_multiple_datasets(self, tmp_path: Path):
+        df = _get_test_data()
+        writer = DataFrameWritePartitioned(column='timestamp')
+        writer.run(df.iloc[:4], tmp_path / 'campaign/run1')
+        writer.run(df.iloc[4:], tmp_path / 'campaign/run2')
+
+        actual = DataFrameReadPartitioned().run(
+            tmp_path / 'campaign/*', start='2024-01-17T00:00'
+        )
+
+        assert len(actual) == 6
+
+    def test_no_matching_partitions(self, tmp_path: Path):
+        df = _get_test_data()
+        DataFrameWritePartitioned(column='timestamp').run(df, tmp_path / 'dataset')
+
+        with pytest.raises(FileNotFoundError):
+            DataFrameReadPartitioned().run(tmp_path / 'dataset', start='2025-01-01')
+
+    def test_workflow(self, tmp_path: Path):
+        df = _get_test_data()
+        DataFrameWritePartitioned(column='timestamp').run(df, tmp_path / 'dataset')
+
+        actual = run(
+            {
+                'run': 'dataframe.read.partitioned@v1',
+                'params': {
+                    'source': str(tmp_path / 'dataset'),
+                    'stop': '2024-01-16T23:59',
+                },
+            }
+        )
+
+        assert len(actual) == 2
@@ -0,0 +1,131 @@
+import gc
+
+import numpy as np
+import pandas as pd
+
+from rdmlibpy.dataframes import (
+    DataFrameAlign,
+    DataFrameEval,
+    DataFrameFillNA,
+    DataFrameSetIndex,
+    DataFrameUnits,
+)
+from rdmlibpy.dataframes.properties import (
+    _registry,
+    get_properties,
+    is_sorted,
+    is_unique,
+    set_properties,
+    sort_index,
+)
+from rdmlibpy.dataframes.selection import select_timespan
+
+
+def create_frame(offsets=(0, 1, 2, 3)):
+    timestamps = pd.to_datetime('2024-01-01') + pd.to_timedelta(offsets, unit='s')
+    return pd.DataFrame(dict(timestamp=timestamps, A=np.arange(len(offsets))))
+
+
+class TestFrameProperties:
+    def test_unknown(self):
+        df = create_frame()
+
+        properties = get_properties(df)
+
+        assert properties.index_sorted is None
+        assert properties.sorted_columns == ()
+
+    def test_set_and_merge(self):
+        df = create_frame()
+
+        assert set_properties(df, index_sorted=True) is df
+        set_properties(df, freq='1s')
+
+        assert get_properties(df).index_sorted is True
+        assert get_properties(df).freq == '1s'
+
+    def test_removed_with_frame(self):
+        df = create_frame()
+        set_properties(df, index_sorted=True)
+        key = id(df)
+
+        del df
+        gc.collect()
+
+        assert key not in _registry
+
+    def test_checks_are_not_recorded(self):
+        df = create_frame((0, 2, 1)).set_index('timestamp')
+        df['t'] = df.index
+
+        assert not is_sorted(df)
+        assert not is_sorted(df, 't')
+        assert is_sorted(df, 'A')
+        assert is_unique(df)
+        assert get_properties(df) == get_properties(pd.DataFrame())
+
+    def test_sort_index(self):
+        df = create_frame((0, 2, 1)).set_index('timestamp')
+
+        result = sort_index(df)
+
+        assert list(result['A']) == [0, 2, 1]
+        assert get_properties(result).index_sorted is True
+        assert sort_index(result) is result
+
+    def test_known_properties_are_trusted(self):
+        df = create_frame((0, 2, 1)).set_index('timestamp')
+        # wrong properties are not checked again
+        set_properties(df, index_sorted=True)
+
+        assert sort_index(df) is df
+
+
+class TestPropagation:
+    def test_setindex_of_sorted_column(self):
+        df = set_properties(create_frame(), sorted_columns=('timestamp',))
+
+        result = DataFrameSetIndex().run(df, 'timestamp')
+
+        assert get_properties(result).index_sorted is True
+
+    def test_select_timespan(self):
+        df = create_frame()
+
+        result = select_timespan(df, 'timestamp', start='2024-01-01T00:00:01')
+
+        assert list(result['A']) == [1, 2, 3]
+        assert get_properties(df).sorted_columns == ()
+        assert 'timestamp' in get_properties(result).sorted_columns
+
+    def test_select_timespan_after_inplace_edit(self):
+        df = create_frame()
+        select_timespan(df, 'timestamp', start='2024-01-01T00:00:02')
+
+        df.loc[2, 'timestamp'] = pd.Timestamp('2024-01-01T00:00:00')
+        result = select_timespan(df, 'timestamp', start='2024-01-01T00:00:01')
+
+        assert list(result['A']) == [1, 3]
+
+    def test_align(self):
+        df = create_frame((0, 3, 1)).set_index('timestamp')
+
+        result = DataFrameAlign().run(df, freq='1s')
+
+        assert list(result['A']) == [0.0, 2.0, 1.5, 1.0]
+        assert get_properties(result).freq == '1s'
+        assert get_properties(result).index_unique is True
+
+    def test_replaced_columns_are_discarded(self):
+        df = create_frame()
+        df['B'] = [0.0, np.nan, 2.0, 3.0]
+        df['C'] = [0.0, 1.0, 2.0, 3.0]
+        set_properties(df, sorted_columns=('timestamp', 'A', 'C'))
+
+        DataFrameEval().run(df, {'A': '3 - A'})
+        DataFrameFillNA().run(df, include=['B'])
+        DataFrameUnits().run(df, units={'C': 'm'})
+
+        assert get_properties(df).sorted_columns == ('timestamp',)
+        # the replaced column is checked again
+        assert not is_sorted(df, 'A')
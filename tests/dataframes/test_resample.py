@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pint_pandas
+import pytest
+
+from rdmlibpy.dataframes import DataFrameResample
+from rdmlibpy.dataframes.resample import BinAggregator, resample
+from rdmlibpy.loaders import ChannelTCLoggerLoader
+
+
+def create_frame(n: int = 100, seed: int = 0):
+    # 10 Hz data with some missing values
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2024-01-01', periods=n, freq='100ms', name='timestamp')
+    values = rng.random(n)
+    values[rng.random(n) < 0.2] = np.nan
+    return pd.DataFrame(
+        dict(
+            T=pint_pandas.PintArray(values, 'degC'),
+            I=rng.integers(0, 10, n),
+            S=[f's{i}' for i in range(n)],
+        ),
+        index=index,
+    )
+
+
+def assert_frame_close(left: pd.DataFrame, right: pd.DataFrame):
+    # sums depend on the order of the values (floating point rounding)
+    assert left.index.equals(right.index)
+    assert list(left.columns) == list(right.columns)
+    for col in left.columns:
+        assert left[col].dtype == right[col].dtype
+        if left[col].dtype == object:
+            assert list(left[col]) == list(right[col])
+        else:
+            np.testing.assert_allclose(
+                np.asarray(left[col], dtype=float), np.asarray(right[col], dtype=float)
+            )
+
+
+class TestResample:
+    @pytest.mark.parametrize('how', ['mean', 'min', 'max', 'last', 'count'])
+    def test_matches_pandas(self, how):
+        df = create_frame()
+        expected = getattr(
+            df[['I']].astype(float).assign(T=df['T'].pint.m).resample('1s'), how
+        )()
+
+        result = resample(df, '1s', how, aggregations=dict(S='last'))
+
+        assert result.index.equals(expected.index)
+        np.testing.assert_allclose(result['I'], expected['I'])
+        if how == 'count':
+            np.testing.assert_array_equal(result['T'], expected['T'])
+        else:
+            assert result['T'].dtype == 'pint[degC]'
+            np.testing.assert_allclose(result['T'].pint.m, expected['T'])
+        assert list(result['S']) == list(df['S'].resample('1s').last())
+
+    def test_chunks(self):
+        df = create_frame(1000)
+
+        aggregator = BinAggregator('1s', aggregations=dict(S='last', I='max'))
+        # chunks are not aligned with the bins
+        for start in range(0, len(df), 33):
+            aggregator.update(df.iloc[start : start + 33])
+
+        assert_frame_close(
+            aggregator.result(),
+            resample(df, '1s', aggregations=dict(S='last', I='max')),
+        )
+
+    def test_unsorted(self):
+        df = create_frame()[['T', 'I']]
+
+        result = resample(df.iloc[::-1], '1s')
+
+        assert_frame_close(result, resample(df, '1s'))
+
+    def test_time_column(self):
+        df = create_frame()[['I']].reset_index()
+
+        result = resample(df, '2s', 'count', column='timestamp')
+
+        assert list(result.columns) == ['timestamp', 'I']
+        assert list(result['I']) == [20] * 5
+        assert result['timestamp'][1] == pd.Timestamp('2024-01-01 00:00:02')
+
+    def test_invalid_aggregation(self):
+        with pytest.raises(ValueError):
+            resample(create_frame(), '1s')
+
+
+class TestDataFrameResample:
+    def test_create(self):
+        transform = DataFrameResample()
+
+        assert transform.name == 'dataframe.resample'
+        assert transform.version == '1'
+
+    def test_streaming(self, data_path):
+        source = data_path / 'ChannelV2TCLog/2024-01-16T10-05-21.csv'
+        df = ChannelTCLoggerLoader().run(source)
+        chunks = ChannelTCLoggerLoader(chunksize=4).run(source)
+
+        result = DataFrameResample().run(chunks, '10s', column='timestamp')
+
+        expected = df.resample('10s', on='timestamp').mean().dropna(how='all')
+        np.testing.assert_allclose(result['inlet'], expected['inlet'])
+        assert list(result['timestamp']) == list(expected.index)
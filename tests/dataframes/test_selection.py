@@ -1,9 +1,12 @@
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from rdmlibpy.loaders import ChannelTCLoggerLoader
-from rdmlibpy.dataframes import SelectColumns, SelectTimespan
+from rdmlibpy.dataframes import SelectColumns, SelectTimespan, SelectTimespans
+from rdmlibpy.dataframes.selection import select_timespan, select_timespans
 
 
 class TestSelectColumns:
@@ -88,3 +91,92 @@ class TestSelectTimespan:
         )
 
         assert len(df) == 4  # type: ignore
+
+    @pytest.mark.parametrize('assume_sorted', [None, True, False])
+    def test_sorted_index(self, assume_sorted):
+        index = pd.date_range('2024-01-01', periods=10, freq='s', name='timestamp')
+        df = pd.DataFrame(dict(A=np.arange(10.0)), index=index)
+
+        result = select_timespan(
+            df, None, '2024-01-01T00:00:02', '2024-01-01T00:00:05', assume_sorted
+        )
+
+        assert list(result['A']) == [2.0, 3.0, 4.0, 5.0]
+        if assume_sorted is not False:
+            # positional slices share the data of the source
+            assert np.shares_memory(result['A'].to_numpy(), df['A'].to_numpy())
+
+    def test_unsorted_column(self):
+        timestamps = pd.to_datetime('2024-01-01') + pd.to_timedelta(
+            [3, 0, 2, 5, 1], unit='s'
+        )
+        df = pd.DataFrame(dict(timestamp=timestamps, A=np.arange(5)))
+
+        result = select_timespan(df, 'timestamp', stop='2024-01-01T00:00:02')
+
+        assert list(result['A']) == [1, 2, 4]
+
+    def test_open_bounds(self):
+        index = pd.date_range('2024-01-01', periods=10, freq='s')
+        df = pd.DataFrame(dict(A=np.arange(10)), index=index)
+
+        assert list(select_timespan(df, None, start=index[8])['A']) == [8, 9]
+        assert list(select_timespan(df, None, stop=index[1])['A']) == [0, 1]
+
+
+class TestSelectTimespans:
+    def _get_frame(self):
+        index = pd.date_range('2024-01-01', periods=10, freq='s', name='timestamp')
+        return pd.DataFrame(dict(A=np.arange(10)), index=index)
+
+    def test_create(self):
+        transform = SelectTimespans()
+
+        assert transform.name == 'dataframe.select.timespans'
+        assert transform.version == '1'
+
+    @pytest.mark.parametrize('assume_sorted', [None, False])
+    def test_named_intervals(self, assume_sorted):
+        df = self._get_frame()
+        if assume_sorted is False:
+            df = df.iloc[::-1]
+        intervals = [
+            dict(
+                name='heating', start='2024-01-01T00:00:01', stop='2024-01-01T00:00:03'
+            ),
+            dict(
+                name='cooling', start='2024-01-01T00:00:03', stop='2024-01-01T00:00:04'
+            ),
+        ]
+
+        frames = select_timespans(df, None, intervals, assume_sorted)
+
+        assert list(frames.keys()) == ['heating', 'cooling']
+        assert sorted(frames['heating']['A']) == [1, 2, 3]
+        assert sorted(frames['cooling']['A']) == [3, 4]
+
+    def test_combine(self):
+        df = self._get_frame().reset_index()
+        intervals = {
+            'a': ('2024-01-01T00:00:08', None),
+            'b': dict(stop='2024-01-01T00:00:00'),
+        }
+
+        result = SelectTimespans().run(df, 'timestamp', intervals, combine=True)
+
+        assert list(result.columns) == ['step', 'timestamp', 'A']
+        assert list(result['step']) == ['a', 'a', 'b']
+        assert list(result['A']) == [8, 9, 0]
+
+    def test_pushdown(self):
+        hints = SelectTimespans().pushdown(
+            'timestamp',
+            [
+                ('2024-01-01T00:00:03', '2024-01-01T00:00:04'),
+                ('2024-01-01', '2024-01-01T00:00:02'),
+            ],
+        )
+
+        assert hints == dict(
+            column='timestamp', start='2024-01-01', stop='2024-01-01T00:00:04'
+        )
@@ -0,0 +1,87 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pandas._testing as tm
+import pint_pandas
+
+from rdmlibpy.dataframes.shared_memory import attach_frame, share_frame
+from rdmlibpy.shared_memory import SharedMemoryArena
+
+
+def create_frame(n: int = 10):
+    df = pd.DataFrame(
+        dict(
+            A=pint_pandas.PintArray(np.arange(n, dtype='float64'), 'm'),
+            B=np.arange(n),
+            C=[f'value {i}' for i in range(n)],
+            D=pd.date_range('2023-01-01', periods=n, freq='D'),
+        ),
+        index=pd.date_range('2023-01-01', periods=n, freq='s', name='timestamp'),
+    )
+    df.attrs['source'] = 'test'
+    return df
+
+
+def share_in_worker(directory: str):
+    # runs in a worker process
+    return share_frame(create_frame(1000), SharedMemoryArena(directory))
+
+
+class TestSharedFrame:
+    def test_roundtrip(self, tmp_path: Path):
+        df = create_frame()
+
+        with SharedMemoryArena(tmp_path) as arena:
+            descriptor = share_frame(df, arena)
+            result = attach_frame(pickle.loads(pickle.dumps(descriptor)))
+
+        tm.assert_frame_equal(result, df)
+        assert result.index.freq == df.index.freq
+        assert result.attrs == df.attrs
+
+    def test_numeric_columns_are_not_pickled(self, tmp_path: Path):
+        df = pd.DataFrame(dict(A=np.arange(100_000.0)))
+
+        with SharedMemoryArena(tmp_path) as arena:
+            descriptor = share_frame(df, arena)
+
+        assert len(pickle.dumps(descriptor)) < 10_000
+
+    def test_release_on_attach(self, tmp_path: Path):
+        with SharedMemoryArena(tmp_path) as arena:
+            descriptor = share_frame(create_frame(), arena)
+            first = attach_frame(descriptor, release=False)
+            second = attach_frame(descriptor)
+
+            assert not Path(descriptor.filename).exists()
+            tm.assert_frame_equal(first, second)
+
+    def test_attached_frames_are_private(self, tmp_path: Path):
+        with SharedMemoryArena(tmp_path) as arena:
+            descriptor = share_frame(create_frame(), arena)
+            first = attach_frame(descriptor, release=False)
+            second = attach_frame(descriptor, release=False)
+
+            first.loc[first.index[0], 'B'] = 100
+
+            assert second['B'].iloc[0] == 0
+
+    def test_range_index(self, tmp_path: Path):
+        df = pd.DataFrame(dict(A=np.arange(5.0)), index=pd.RangeIndex(5, name='i'))
+
+        with SharedMemoryArena(tmp_path) as arena:
+            result = attach_frame(share_frame(df, arena))
+
+        tm.assert_frame_equal(result, df)
+
+    def test_worker_process(self, tmp_path: Path):
+        with ProcessPoolExecutor(1) as executor:
+            descriptor = executor.submit(share_in_worker, str(tmp_path)).result()
+
+        result = attach_frame(descriptor)
+
+        tm.assert_frame_equal(result, create_frame(1000))
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,183 @@
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pandas._testing as tm
+import pint_pandas
+import pytest
+
+from rdmlibpy.dataframes import DataFrameReadSQL, DataFrameWriteSQL
+
+
+def _get_test_data(periods=10, start='2024-01-16T10:00', id='2024-01-16A01'):
+    df = pd.DataFrame(
+        data=dict(
+            timestamp=pd.date_range(start, periods=periods, freq='s'),
+            A=np.arange(periods, dtype=float),
+            B=[f'b{i}' for i in range(periods)],
+        )
+    )
+    df['T'] = pint_pandas.PintArray(np.linspace(300, 400, periods), dtype='pint[K]')
+    df.attrs.update(id=id, inlet=dict(flow_rate='1.0L/min'))
+    return df
+
+
+class TestDataFrameWriteSQL:
+    def test_create(self):
+        writer = DataFrameWriteSQL()
+
+        assert writer.name == 'dataframe.write.sql'
+        assert writer.version == '1'
+        assert writer.table == 'data'
+
+    def test_write(self, tmp_path: Path):
+        df = _get_test_data()
+        path = tmp_path / 'data.sqlite'
+
+        actual = DataFrameWriteSQL().run(df, path)
+
+        # make sure input data is returned unaltered
+        assert actual is df
+
+        con = sqlite3.connect(path)
+        try:
+            assert con.execute('SELECT COUNT(*) FROM data').fetchone() == (10,)
+            indices = con.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='data'"
+            ).fetchall()
+            assert indices == [('ix_data_time',)]
+        finally:
+            con.close()
+
+    def test_if_exists(self, tmp_path: Path):
+        df = _get_test_data()
+        path = tmp_path / 'data.sqlite'
+        DataFrameWriteSQL().run(df, path)
+
+        with pytest.raises(ValueError):
+            DataFrameWriteSQL(if_exists='fail').run(df, path)
+
+        DataFrameWriteSQL(if_exists='replace').run(df.iloc[:3], path)
+        assert len(DataFrameReadSQL().run(path)) == 3
+
+    def test_append_with_different_units(self, tmp_path: Path):
+        df = _get_test_data()
+        path = tmp_path / 'data.sqlite'
+        DataFrameWriteSQL().run(df, path)
+
+        df['T'] = df['T'].pint.to('degC')
+        with pytest.raises(ValueError):
+            DataFrameWriteSQL().run(df, path)
+
+    def test_time_index_across_keys(self, tmp_path: Path):
+        path = tmp_path / 'data.sqlite'
+        DataFrameWriteSQL(key='id').run(_get_test_data(), path)
+
+        with sqlite3.connect(path) as con:
+            plan = con.execute(
+                'EXPLAIN QUERY PLAN SELECT * FROM data WHERE timestamp >= 0'
+            ).fetchall()
+        con.close()
+
+        assert 'ix_data_time' in str(plan)
+
+    def test_append_with_different_timezone(self, tmp_path: Path):
+        df = _get_test_data()
+        path = tmp_path / 'data.sqlite'
+        DataFrameWriteSQL().run(df, path)
+
+        df['timestamp'] = df['timestamp'].dt.tz_localize('UTC')
+        with pytest.raises(ValueError):
+            DataFrameWriteSQL().run(df, path)
+
+
+class TestDataFrameReadSQL:
+    def test_create(self):
+        loader = DataFrameReadSQL()
+
+        assert loader.name == 'dataframe.read.sql'
+        assert loader.version == '1'
+
+    def test_roundtrip(self, tmp_path: Path):
+        df = _get_test_data()
+        path = tmp_path / 'data.sqlite'
+        DataFrameWriteSQL().run(df, path)
+
+        actual = DataFrameReadSQL().run(path)
+
+        tm.assert_frame_equal(actual, df)
+        assert actual.attrs == df.attrs
+
+    def test_roundtrip_attrs(self, tmp_path: Path):
+        df = _get_test_data()
+        df.attrs.update(
+            start=pd.Timestamp('2024-01-16T10:05:28', tz='UTC'),
+            range=(1, 2.5),
+            values=np.arange(3.0),
+        )
+        path = tmp_path / 'data.sqlite'
+        DataFrameWriteSQL().run(df, path)
+
+        actual = DataFrameReadSQL().run(path)
+
+        assert actual.attrs.keys() == df.attrs.keys()
+        assert actual.attrs['start'] == df.attrs['start']
+        assert actual.attrs['range'] == (1, 2.5)
+        np.testing.assert_array_equal(actual.attrs['values'], df.attrs['values'])
+
+    def test_roundtrip_datetime_index(self, tmp_path: Path):
+        df = _get_test_data().set_index('timestamp')
+        path = tmp_path / 'data.sqlite'
+        DataFrameWriteSQL(column=None).run(df, path)
+
+        actual = DataFrameReadSQL().run(path)
+
+        tm.assert_frame_equal(actual, df, check_freq=False)
+
+    def test_read_timespan_and_columns(self, tmp_path: Path):
+        df = _get_test_data()
+        path = tmp_path / 'data.sqlite'
+        DataFrameWriteSQL().run(df, path)
+
+        actual = DataFrameReadSQL().run(
+            path,
+            start='2024-01-16T10:00:02',
+            stop='2024-01-16T10:00:04.5',
+            columns=['timestamp', 'T'],
+        )
+
+        tm.assert_frame_equal(
+            actual, df.iloc[2:5][['timestamp', 'T']].reset_index(drop=True)
+        )
+
+    def test_read_by_key(self, tmp_path: Path):
+        df1 = _get_test_data(id='A01')
+        df2 = _get_test_data(start='2024-01-17T10:00', id='A02')
+        path = tmp_path / 'data.sqlite'
+        writer = DataFrameWriteSQL(key='id')
+        writer.run(df1, path)
+        writer.run(df2, path)
+
+        actual = DataFrameReadSQL().run(path, key='A02')
+        tm.assert_frame_equal(actual, df2)
+        assert actual.attrs == df2.attrs
+
+        actual = DataFrameReadSQL().run(path, stop='2024-01-17T10:00:01')
+        assert len(actual) == 12
+        assert list(actual.id.unique()) == ['A01', 'A02']
+
+    def test_roundtrip_timezone(self, tmp_path: Path):
+        df = _get_test_data()
+        df['timestamp'] = df['timestamp'].dt.tz_localize('Europe/Berlin')
+        path = tmp_path / 'data.sqlite'
+        DataFrameWriteSQL().run(df, path)
+
+        actual = DataFrameReadSQL().run(path)
+        tm.assert_frame_equal(actual, df)
+
+        # naive bounds are in the timezone of the column
+        actual = DataFrameReadSQL().run(
+            path, start='2024-01-16T10:00:02', stop='2024-01-16T09:00:04Z'
+        )
+        tm.assert_frame_equal(actual, df.iloc[2:5].reset_index(drop=True))
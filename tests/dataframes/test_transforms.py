@@ -4,11 +4,14 @@ import numpy as np
 import pandas as pd
 import pandas._testing as tm
 import pint_pandas
+import pytest
 
 from rdmlibpy.dataframes import (
+    DataFrameAlign,
     DataFrameAttributes,
     DataFrameFillNA,
     DataFrameJoin,
+    DataFrameJoinMany,
     DataFrameSetIndex,
     DataFrameUnits,
 )
@@ -148,6 +151,205 @@ class TestDataFrameJoin:
             equal_nan=True,
         )
 
+    def test_join_left_with_interpolation_keeps_left_frame(self):
+        transform = DataFrameJoin()
+        left, right = self._get_test_data()
+        right['S'] = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i']
+        left.attrs['source'] = 'left'
+
+        df = transform.run(left, right, how='left', interpolate=True, mode='direct')
+
+        assert df.index is left.index
+        assert df.B.dtype == left.B.dtype
+        assert list(df.S) == ['a', np.nan, np.nan, 'e', np.nan, np.nan, 'i']
+        assert df.attrs == dict(source='left')
+
+    def test_join_left_with_interpolation_fills_left_frame(self):
+        transform = DataFrameJoin()
+        left, right = self._get_test_data()
+        left['B'] = [0, np.nan, 2, 3, 4, 5, 6]
+
+        df = transform.run(left, right, how='left', interpolate=True)
+
+        # the missing values of the left frame are interpolated on the union
+        assert list(df.B) == [0, 1, 2, 3, 4, 5, 6]
+
+    def test_direct_interpolation_requires_left_or_right_join(self):
+        left, right = self._get_test_data()
+
+        with pytest.raises(ValueError):
+            DataFrameJoin().run(left, right, interpolate=True, mode='direct')
+
+    def test_join_interpolation_matches_union(self):
+        rng = np.random.default_rng(0)
+        left = pd.DataFrame(
+            dict(B=rng.random(50)),
+            index=pd.date_range('2024-01-01', periods=50, freq='100ms'),
+        )
+        right = pd.DataFrame(
+            dict(C=rng.random(5), D=[1.0, np.nan, 3.0, np.nan, 5.0]),
+            index=pd.date_range('2024-01-01 00:00:00.250', periods=5, freq='1s'),
+        )
+        expected = DataFrameJoin().interpolate(left.join(right, how='outer'))
+
+        df = DataFrameJoin().run(
+            left, right, how='left', interpolate=True, mode='direct'
+        )
+
+        tm.assert_frame_equal(
+            df, expected.loc[left.index, df.columns], check_freq=False
+        )
+
+    def _get_asof_data(self):
+        left = pd.DataFrame(
+            dict(B=[0, 1, 2, 3, 4]),
+            index=pd.date_range('2024-01-01', periods=5, freq='s'),
+        )
+        right = pd.DataFrame(
+            dict(C=pint_pandas.PintArray([10.0, 20.0, 30.0], 'm')),
+            index=pd.to_datetime('2024-01-01')
+            + pd.to_timedelta([200, 1900, 3500], unit='ms'),
+        )
+        return left, right
+
+    def test_join_asof_backward(self):
+        left, right = self._get_asof_data()
+
+        df = DataFrameJoin().run(left, right, how='left', asof='backward')
+
+        assert df.index.equals(left.index)
+        assert df.C.dtype == 'pint[m]'
+        assert np.allclose(
+            df.C.pint.m, [np.nan, 10.0, 20.0, 20.0, 30.0], equal_nan=True
+        )
+
+    def test_join_asof_forward(self):
+        left, right = self._get_asof_data()
+
+        df = DataFrameJoin().run(left, right, how='left', asof='forward')
+
+        assert np.allclose(
+            df.C.pint.m, [10.0, 20.0, 30.0, 30.0, np.nan], equal_nan=True
+        )
+
+    def test_join_asof_nearest_with_tolerance(self):
+        left, right = self._get_asof_data()
+
+        df = DataFrameJoin().run(
+            left, right, how='left', asof='nearest', tolerance='300ms'
+        )
+
+        assert np.allclose(
+            df.C.pint.m, [10.0, np.nan, 20.0, np.nan, np.nan], equal_nan=True
+        )
+
+    def test_join_asof_right(self):
+        left, right = self._get_asof_data()
+
+        df = DataFrameJoin().run(left, right, how='right', asof='nearest')
+
+        assert df.index.equals(right.index)
+        assert list(df.columns) == ['B', 'C']
+        assert list(df.B) == [0, 2, 3]
+
+    def test_join_asof_different_resolution(self):
+        left, right = self._get_asof_data()
+        right.index = right.index.as_unit('ms')
+
+        df = DataFrameJoin().run(left, right, how='left', asof='backward')
+
+        assert np.allclose(
+            df.C.pint.m, [np.nan, 10.0, 20.0, 20.0, 30.0], equal_nan=True
+        )
+
+    def test_join_asof_invalid(self):
+        left, right = self._get_asof_data()
+
+        with pytest.raises(ValueError):
+            DataFrameJoin().run(left, right, how='outer', asof='backward')
+        with pytest.raises(ValueError):
+            DataFrameJoin().run(left, left, how='left', asof='backward')
+
+
+class TestDataFrameJoinMany:
+    def test_create(self):
+        transform = DataFrameJoinMany()
+
+        assert transform.name == 'dataframe.join.many'
+        assert transform.version == '1'
+
+    def _get_frames(self):
+        index = pd.to_datetime('2024-01-01')
+        return dict(
+            tc=pd.DataFrame(
+                dict(T=[0.0, 1.0, 2.0, 3.0, 4.0]),
+                index=index + pd.to_timedelta([0, 1, 2, 3, 4], unit='s'),
+            ),
+            ftir=pd.DataFrame(
+                dict(NO=pint_pandas.PintArray([10.0, 30.0], 'ppm')),
+                index=index + pd.to_timedelta([1, 3], unit='s'),
+            ),
+            rga=pd.DataFrame(
+                dict(H2=[5.0, 6.0]),
+                index=index + pd.to_timedelta([500, 2500], unit='ms'),
+            ),
+        )
+
+    def test_join_onto_index_of_frame(self):
+        frames = self._get_frames()
+
+        df = DataFrameJoinMany().run(
+            frames=frames, index='tc', policies=dict(rga='backward')
+        )
+
+        assert df.index.equals(frames['tc'].index)
+        assert list(df.columns) == ['T', 'NO', 'H2']
+        assert df.NO.dtype == 'pint[ppm]'
+        assert np.allclose(df.NO.pint.m, [10.0, 10.0, 20.0, 30.0, 30.0])
+        assert np.allclose(df.H2, [np.nan, 5.0, 5.0, 6.0, 6.0], equal_nan=True)
+
+    def test_join_onto_union(self):
+        frames = self._get_frames()
+
+        df = DataFrameJoinMany().run(frames=list(frames.values()), policy='exact')
+
+        assert len(df) == 7
+        assert df.notna().sum().tolist() == [5, 2, 2]
+
+    def test_join_with_source(self):
+        frames = self._get_frames()
+        tc = frames.pop('tc')
+
+        df = DataFrameJoinMany().run(tc, frames=frames, index='source')
+
+        assert df.index.equals(tc.index)
+        assert list(df.columns) == ['T', 'NO', 'H2']
+
+    def test_join_matches_pairwise_joins(self):
+        frames = self._get_frames()
+        join = DataFrameJoin()
+        expected = join.run(
+            join.run(
+                frames['tc'],
+                frames['ftir'],
+                how='left',
+                interpolate=True,
+                mode='direct',
+            ),
+            frames['rga'],
+            how='left',
+            interpolate=True,
+            mode='direct',
+        )
+
+        df = DataFrameJoinMany().run(frames=frames, index='tc')
+
+        tm.assert_frame_equal(df, expected)
+
+    def test_no_frames(self):
+        with pytest.raises(ValueError):
+            DataFrameJoinMany().run(frames={})
+
 
 class TestDataFrameSetIndex:
     def test_create_loader(self):
@@ -317,3 +519,52 @@ class TestDataFrameAttributes:
         # dictionaries should not be equal
         attrs['A4']['B4']['C4'] = 'test'  # type: ignore
         assert not (dict(actual.attrs) == dict(attrs))
+
+
+class TestDataFrameAlign:
+    def test_create(self):
+        transform = DataFrameAlign()
+
+        assert transform.name == 'dataframe.align'
+        assert transform.version == '1'
+
+    def _get_frames(self):
+        index = pd.to_datetime('2024-01-01')
+        return dict(
+            tc=pd.DataFrame(
+                dict(T=[0.0, 1.0, 2.0, 3.0]),
+                index=index + pd.to_timedelta([0, 1, 2, 3], unit='s'),
+            ),
+            ftir=pd.DataFrame(
+                dict(NO=pint_pandas.PintArray([10.0, 30.0], 'ppm')),
+                index=index + pd.to_timedelta([250, 2250], unit='ms'),
+            ),
+        )
+
+    def test_align_frequency(self):
+        frames = self._get_frames()
+
+        df = DataFrameAlign().run(frames=frames, freq='500ms')
+
+        assert list(df.columns) == ['T', 'NO']
+        assert len(df) == 7
+        assert df.index[1] - df.index[0] == pd.Timedelta('500ms')
+        assert np.allclose(df['T'], [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0])
+        assert df['NO'].dtype == 'pint[ppm]'
+        assert np.allclose(df['NO'].pint.m[:3], [10.0, 12.5, 17.5])
+
+    def test_align_reference(self):
+        frames = self._get_frames()
+
+        df = DataFrameAlign().run(
+            frames=frames, reference='tc', methods=dict(NO='mean')
+        )
+
+        assert df.index.equals(frames['tc'].index)
+        assert np.allclose(
+            df['NO'].pint.m, [10.0, np.nan, 30.0, np.nan], equal_nan=True
+        )
+
+    def test_missing_frequency(self):
+        with pytest.raises(ValueError):
+            DataFrameAlign().run(frames=self._get_frames())
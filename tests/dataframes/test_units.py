@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pandas._testing as tm
+import pint_pandas
+
+from rdmlibpy.dataframes.units import (
+    apply_units,
+    column_arrays,
+    dequantify,
+    quantify,
+    split_units,
+)
+
+
+def create_frame():
+    df = pd.DataFrame(
+        dict(
+            A=pint_pandas.PintArray(np.arange(5.0), 'm'),
+            B=pint_pandas.PintArray(np.arange(5.0) * 2, 's'),
+            C=pint_pandas.PintArray(np.arange(5.0) * 3, 'm'),
+            D=np.arange(5),
+        ),
+        index=pd.date_range('2023-01-01', periods=5, freq='s'),
+    )
+    df.attrs['source'] = 'test'
+    return df
+
+
+class TestQuantify:
+    def test_dequantify(self):
+        df = create_frame()
+
+        result = dequantify(df)
+
+        expected = df.pint.dequantify()
+        tm.assert_frame_equal(result, expected)
+        assert result.columns.names == [None, 'unit']
+        assert result.attrs == df.attrs
+
+    def test_roundtrip(self):
+        df = create_frame()
+
+        result = quantify(dequantify(df))
+
+        tm.assert_frame_equal(result, df)
+        assert result.attrs == df.attrs
+
+    def test_dequantify_does_not_copy(self):
+        df = create_frame()
+
+        result = dequantify(df)
+
+        assert np.shares_memory(
+            result.iloc[:, 0].to_numpy(), df['A'].pint.magnitude.to_numpy()
+        )
+
+    def test_quantify_does_not_copy(self):
+        df = dequantify(create_frame())
+        magnitudes = df.to_numpy(dtype='float64')
+
+        plain = pd.DataFrame(magnitudes, index=df.index, columns=df.columns)
+        result = quantify(plain)
+
+        assert np.shares_memory(result['B'].pint.magnitude.to_numpy(), magnitudes)
+        assert result['A'].dtype == result['C'].dtype
+        assert result['D'].dtype == np.float64
+
+
+class TestSplitUnits:
+    def test_roundtrip(self):
+        df = create_frame()
+
+        plain, units = split_units(df)
+        result = apply_units(plain, units)
+
+        assert units == dict(A='m', B='s', C='m')
+        assert plain['A'].dtype == np.float64
+        tm.assert_frame_equal(result, df)
+        assert result.attrs == df.attrs
+
+    def test_apply_without_units(self):
+        df = pd.DataFrame(dict(A=np.arange(3.0)))
+
+        assert apply_units(df, dict(B='m')) is df
+
+
+def test_column_arrays_are_views():
+    df = create_frame()
+    df.columns = ['A', 'B', 'A', 'D']
+
+    arrays = column_arrays(df)
+
+    assert [type(values) for values in arrays] == (
+        [pint_pandas.PintArray] * 3 + [np.ndarray]
+    )
+    assert np.shares_memory(arrays[2].data, df.iloc[:, 2].array.data)
+    assert np.shares_memory(arrays[3], df.iloc[:, 3].to_numpy())
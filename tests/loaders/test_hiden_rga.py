@@ -2,6 +2,7 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pandas._testing as tm
 
 from rdmlibpy.loaders import HidenRGALoader
 
@@ -28,6 +29,16 @@ class TestHidenRGALoader:
         assert df.columns[0] == 'timestamp'  # type: ignore
         assert df['timestamp'].dtype == np.dtype('<M8[us]')  # type: ignore
 
+    def test_load_chunks(self, data_path: Path):
+        source = data_path / 'hiden/ae03_20240123_nh3lo_n2_2nlpm_f06_test1.csv'
+        expected = HidenRGALoader().run(source)
+
+        chunks = list(HidenRGALoader(chunksize=4).run(source))
+
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert all(chunk.columns[0] == 'timestamp' for chunk in chunks)
+        tm.assert_frame_equal(pd.concat(chunks), expected)
+
     def test_different_separator(self, data_path: Path):
         loader = HidenRGALoader(separator=',')
         df = loader.run(
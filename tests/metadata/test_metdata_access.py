@@ -1,4 +1,5 @@
 import pytest
+from omegaconf import OmegaConf
 from rdmlibpy.metadata import Metadata, MetadataDict, MetadataList
 
 
@@ -296,3 +297,14 @@ class TestIteration:
         # iterate sequence
         types = [type(value) for value in sample_data.data]
         assert types == [MetadataDict, MetadataDict]
+
+
+class TestConversion:
+    def test_to_config_keeps_interpolations(self):
+        sample_data = Metadata.create(
+            'inlet:\n  flow_rate: 1.0L/min\noutlet:\n  flow_rate: ${inlet.flow_rate}\n'
+        )
+        # the raw config node is returned, interpolations are not resolved
+        conf = Metadata.to_config(sample_data)
+        assert OmegaConf.is_interpolation(conf.outlet, 'flow_rate')
+        assert Metadata.to_config(sample_data.outlet) is conf.outlet
@@ -1,4 +1,15 @@
-from rdmlibpy.serializers import FileCache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from rdmlibpy.serializers import (
+    FileCache,
+    JsonSerializer,
+    NumpyArraySerializer,
+    PandasDataFrameSerializer,
+)
 
 
 class TestFileCache:
@@ -7,3 +18,47 @@ class TestFileCache:
 
         assert cache.name == 'file.cache'
         assert cache.version == '1'
+
+    @pytest.mark.parametrize(
+        'source, filename, serializer',
+        [
+            (pd.DataFrame(dict(A=[1])), 'data.csv', PandasDataFrameSerializer),
+            (np.arange(3), 'data.npy', NumpyArraySerializer),
+            (dict(a=1), 'data.json', JsonSerializer),
+            ([1, 2], 'data.json', JsonSerializer),
+        ],
+    )
+    def test_auto_serializer(self, source, filename, serializer):
+        ser = FileCache().get_serializer(source, Path(filename))
+
+        assert isinstance(ser, serializer)
+
+    def test_auto_dataframe_format(self):
+        df = pd.DataFrame(dict(A=[1]))
+
+        ser = FileCache().get_serializer(df, Path('data.pkl'))
+
+        assert ser.format == 'pickle'
+
+    def test_unsupported_type(self):
+        with pytest.raises(ValueError):
+            FileCache().get_serializer(object())
+
+    def test_returns_source_on_miss(self, tmp_path: Path):
+        path = tmp_path / 'data.npy'
+        source = np.arange(10.0)
+
+        first = FileCache().run(source, path)
+        second = FileCache().run(source, path)
+
+        assert first is source
+        assert isinstance(second, np.memmap)
+        np.testing.assert_array_equal(second, source)
+
+    def test_loads_lossy_formats_on_miss(self, tmp_path: Path):
+        path = tmp_path / 'data.json'
+        source = dict(a=(1, 2))
+
+        result = FileCache().run(source, path)
+
+        assert result == dict(a=[1, 2])
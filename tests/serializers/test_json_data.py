@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from rdmlibpy.serializers import JsonSerializer
+
+
+class TestJsonSerializer:
+    def test_create(self):
+        serializer = JsonSerializer()
+
+        assert serializer.name == 'json'
+        assert serializer.version == '1'
+
+    def test_roundtrip(self, tmp_path: Path):
+        source = dict(a=1, b=[1.5, 'x'], c=dict(d=None))
+        path = tmp_path / 'data.json'
+
+        serializer = JsonSerializer(indent=2)
+        serializer.write(source, path)
+
+        assert serializer.load(path) == source
@@ -0,0 +1,36 @@
+from pathlib import Path
+
+import numpy as np
+
+from rdmlibpy.serializers import NumpyArraySerializer
+
+
+class TestNumpyArraySerializer:
+    def test_create(self):
+        serializer = NumpyArraySerializer()
+
+        assert serializer.name == 'numpy.array'
+        assert serializer.version == '1'
+        assert serializer.mmap
+
+    def test_roundtrip(self, tmp_path: Path):
+        source = np.linspace(0, 1, 100).reshape(10, 10)
+        path = tmp_path / 'data.bin'
+
+        serializer = NumpyArraySerializer()
+        serializer.write(source, path)
+        array = serializer.load(path)
+
+        assert path.exists()
+        assert not (tmp_path / 'data.bin.npy').exists()
+        assert isinstance(array, np.memmap)
+        np.testing.assert_array_equal(array, source)
+
+    def test_load_without_mmap(self, tmp_path: Path):
+        path = tmp_path / 'data.npy'
+        NumpyArraySerializer().write(np.arange(10), path)
+
+        array = NumpyArraySerializer(mmap=False).load(path)
+
+        assert not isinstance(array, np.memmap)
+        np.testing.assert_array_equal(array, np.arange(10))
@@ -1,6 +1,8 @@
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from rdmlibpy.serializers import PandasDataFrameSerializer
 
@@ -80,3 +82,36 @@ class TestPandasDataFrameSerializer:
         assert path.exists()
         assert list(df.A) == [1.1, 2.2, 3.3]
         assert list(df.B) == ['aa', 'bb', 'cc']
+
+    def test_write_hdf5_with_compression(self, tmp_path: Path):
+        tables = pytest.importorskip('tables')
+        df = pd.DataFrame(data=dict(A=np.linspace(0, 1, 1000), B=np.arange(1000)))
+        path = tmp_path / 'data.hd5'
+
+        serializer = PandasDataFrameSerializer(
+            format='HDF5', complib='zlib', complevel=3
+        )
+        serializer.write(df, path)
+
+        pd.testing.assert_frame_equal(df, serializer.load(path))
+        with tables.open_file(path) as file:
+            array = file.get_node('/data/block0_values')
+            assert array.filters.complib == 'zlib'
+            assert array.filters.complevel == 3
+            assert array.filters.shuffle
+
+    @pytest.mark.parametrize('format', ['parquet', 'feather', 'pickle'])
+    def test_roundtrip_binary(self, tmp_path: Path, format: str):
+        if format != 'pickle':
+            pytest.importorskip('pyarrow')
+        source = pd.DataFrame(data=dict(A=[1.1, 2.2, 3.3], B=['aa', 'bb', 'cc']))
+        path = tmp_path / f'data.{format}'
+
+        serializer = PandasDataFrameSerializer(format=format)
+        serializer.write(source, path)
+
+        pd.testing.assert_frame_equal(source, serializer.load(path))
+        assert serializer.preserves_source()
+
+    def test_csv_does_not_preserve_source(self):
+        assert not PandasDataFrameSerializer(format='csv').preserves_source()
@@ -0,0 +1,196 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from rdmlibpy._filelock import FileLock, lock_path
+from rdmlibpy.base import PlainProcessParam, ProcessNode
+from rdmlibpy.cache_directory import (
+    CacheDirectory,
+    configure_cache_directory,
+    get_cache_directory,
+    remove_cache_directory,
+)
+from rdmlibpy.dataframes import DataFrameFileCache
+from rdmlibpy.process import DelegatedSource
+from rdmlibpy.serializers import FileCache
+
+
+def create_file(path: Path, size: int):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'x' * size)
+    return path
+
+
+def record_builds(root: Path, start: int):
+    # builds entries in a separate process
+    directory = CacheDirectory(root, max_bytes=10**9)
+    for i in range(start, start + 10):
+        directory.record_build(create_file(root / f'{i}.h5', 10), 1.0)
+
+
+@pytest.fixture
+def managed_root(tmp_path: Path):
+    root = tmp_path / 'cache'
+    directory = configure_cache_directory(root, max_bytes=10**9)
+    yield directory
+    remove_cache_directory(root)
+
+
+class TestCacheDirectory:
+    def test_record_build(self, tmp_path: Path):
+        directory = CacheDirectory(tmp_path, max_bytes=1000)
+        path = create_file(tmp_path / 'sub/a.h5', 100)
+
+        directory.record_build(path, 2.5)
+
+        entries = directory.entries()
+        assert list(entries.keys()) == ['sub/a.h5']
+        assert entries['sub/a.h5']['size'] == 100
+        assert entries['sub/a.h5']['build_time'] == 2.5
+        assert directory.usage() == 100
+
+    def test_evict_least_recently_used(self, tmp_path: Path, monkeypatch):
+        clock = iter(range(0, 10_000, 100))
+        monkeypatch.setattr(
+            'rdmlibpy.cache_directory.time', SimpleNamespace(time=lambda: next(clock))
+        )
+        directory = CacheDirectory(tmp_path, max_bytes=250)
+        paths = [create_file(tmp_path / f'{name}.h5', 100) for name in 'abc']
+
+        directory.record_build(paths[0], 1.0)
+        directory.record_build(paths[1], 1.0)
+        directory.record_access(paths[0])
+        directory.record_build(paths[2], 1.0)
+
+        assert paths[0].exists()
+        assert not paths[1].exists()
+        assert paths[2].exists()
+        assert set(directory.entries().keys()) == {'a.h5', 'c.h5'}
+
+    def test_evict_lowest_value(self, tmp_path: Path):
+        directory = CacheDirectory(tmp_path, max_bytes=250, policy='value')
+        paths = [create_file(tmp_path / f'{name}.h5', 100) for name in 'abc']
+
+        # `a` is expensive to rebuild, `b` is cheap (but accessed more recently)
+        directory.record_build(paths[0], 100.0)
+        directory.record_build(paths[1], 0.1)
+        directory.record_build(paths[2], 10.0)
+
+        assert paths[0].exists()
+        assert not paths[1].exists()
+        assert paths[2].exists()
+
+    def test_never_evicts_new_entry(self, tmp_path: Path):
+        directory = CacheDirectory(tmp_path, max_bytes=50)
+        path = create_file(tmp_path / 'a.h5', 100)
+
+        directory.record_build(path, 1.0)
+
+        assert path.exists()
+
+    def test_removed_files_are_dropped_from_index(self, tmp_path: Path):
+        directory = CacheDirectory(tmp_path, max_bytes=1000)
+        path = create_file(tmp_path / 'a.h5', 100)
+        directory.record_build(path, 1.0)
+
+        path.unlink()
+        directory.evict()
+
+        assert directory.entries() == {}
+
+    def test_record_access_throttled(self, tmp_path: Path):
+        directory = CacheDirectory(tmp_path, max_bytes=1000)
+        path = create_file(tmp_path / 'a.h5', 100)
+
+        directory.record_access(path)
+        atime = directory.entries()['a.h5']['atime']
+        directory.record_access(path)
+
+        assert directory.entries()['a.h5']['atime'] == atime
+        assert directory.entries()['a.h5']['build_time'] is None
+
+    def test_record_access_without_reading_index(self, tmp_path: Path, monkeypatch):
+        directory = CacheDirectory(tmp_path, max_bytes=1000)
+        path = create_file(tmp_path / 'a.h5', 100)
+        directory.record_build(path, 1.0)
+
+        def load_index():
+            raise AssertionError('index loaded')
+
+        monkeypatch.setattr(directory, '_load_index', load_index)
+        directory.record_access(path)
+
+    def test_evict_skips_locked_entries(self, tmp_path: Path):
+        directory = CacheDirectory(tmp_path, max_bytes=250)
+        paths = [create_file(tmp_path / f'{name}.h5', 100) for name in 'abc']
+        directory.record_build(paths[0], 1.0)
+        directory.record_build(paths[1], 1.0)
+
+        # `a` is being rebuilt (e.g. by another process)
+        with FileLock(lock_path(paths[0])):
+            directory.record_build(paths[2], 1.0)
+
+        assert paths[0].exists()
+        assert not paths[1].exists()
+        assert set(directory.entries().keys()) == {'a.h5', 'c.h5'}
+
+    def test_concurrent_processes(self, tmp_path: Path):
+        with ProcessPoolExecutor(4) as executor:
+            list(executor.map(record_builds, [tmp_path] * 4, range(0, 40, 10)))
+
+        entries = CacheDirectory(tmp_path, max_bytes=1000).entries()
+        assert sorted(entries) == sorted(f'{i}.h5' for i in range(40))
+
+    def test_get_cache_directory(self, tmp_path: Path, managed_root):
+        assert get_cache_directory(managed_root.root / 'a/b.h5') is managed_root
+        assert get_cache_directory(tmp_path / 'other/b.h5') is None
+
+
+class TestManagedCaches:
+    def test_dataframe_file_cache(self, managed_root):
+        path = managed_root.root / 'data/cache.h5'
+        df = pd.DataFrame(dict(A=np.arange(10.0)))
+
+        def build():
+            time.sleep(0.01)
+            return df
+
+        workflow = ProcessNode(
+            ProcessNode(None, DelegatedSource(delegate=build), {}),
+            DataFrameFileCache(),
+            {'filename': PlainProcessParam(str(path))},
+        )
+
+        # build cache
+        workflow.run()
+        entry = managed_root.entries()['data/cache.h5']
+        assert entry['size'] == path.stat().st_size
+        assert entry['build_time'] >= 0.01
+
+        # cache hit
+        workflow.run()
+        assert managed_root.entries()['data/cache.h5']['build_time'] == (
+            entry['build_time']
+        )
+
+    def test_file_cache_build_time(self, managed_root):
+        path = managed_root.root / 'data.csv'
+        df = pd.DataFrame(dict(A=np.arange(10.0)))
+
+        def build():
+            time.sleep(0.05)
+            return df
+
+        ProcessNode(
+            ProcessNode(None, DelegatedSource(delegate=build), {}),
+            FileCache(),
+            {'target': PlainProcessParam(path)},
+        ).run()
+
+        # the build time includes the preceding processes
+        assert managed_root.entries()['data.csv']['build_time'] >= 0.05
@@ -0,0 +1,190 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from rdmlibpy import Workflow
+from rdmlibpy.base import PlainProcessParam, ProcessNode
+from rdmlibpy.cache_stats import (
+    CacheEvent,
+    CacheStats,
+    collect_stats,
+    get_cache_stats,
+    record_event,
+)
+from rdmlibpy.dataframes import DataFrameFileCache
+from rdmlibpy.memory_cache import configure_memory_cache
+from rdmlibpy.process import DelegatedSource
+from rdmlibpy.serializers import FileCache
+
+
+class TestCacheStats:
+    def test_summary(self):
+        stats = CacheStats()
+        stats.record(
+            CacheEvent(
+                process='cache@v1',
+                key='a',
+                kind='miss',
+                reason='missing',
+                bytes_written=100,
+                write_time=1.0,
+                build_time=10.0,
+            )
+        )
+        stats.record(
+            CacheEvent(
+                process='cache@v1', key='a', kind='hit', bytes_read=100, read_time=1.0
+            )
+        )
+        stats.record(
+            CacheEvent(
+                process='cache@v1', key='a', kind='hit', bytes_read=100, read_time=1.0
+            )
+        )
+        stats.record(CacheEvent(process='cache@v1', key='b', kind='miss'))
+
+        summary = stats.summary()
+        assert summary['a']['hits'] == 2
+        assert summary['a']['misses'] == 1
+        assert summary['a']['hit_rate'] == 2 / 3
+        assert summary['a']['reasons'] == {'missing': 1}
+        assert summary['a']['bytes_read'] == 200
+        assert summary['a']['bytes_written'] == 100
+        assert summary['a']['saved_time'] == 18.0
+        assert summary['b']['hits'] == 0
+
+        totals = stats.totals()
+        assert totals['hits'] == 2
+        assert totals['misses'] == 2
+
+    def test_events_are_bounded(self):
+        stats = CacheStats(max_events=2)
+        for _ in range(5):
+            stats.record(CacheEvent(process='cache@v1', key='a', kind='hit'))
+
+        assert len(stats.events) == 2
+        assert stats.summary()['a']['hits'] == 5
+
+    def test_to_json(self, tmp_path: Path):
+        stats = CacheStats()
+        stats.record(CacheEvent(process='cache@v1', key='a', kind='hit'))
+
+        text = stats.to_json(tmp_path / 'stats.json', events=True)
+
+        data = json.loads((tmp_path / 'stats.json').read_text())
+        assert data == json.loads(text)
+        assert data['totals']['hits'] == 1
+        assert data['caches']['a']['hits'] == 1
+        assert data['events'][0]['kind'] == 'hit'
+
+    def test_collect_stats_is_nested(self):
+        with collect_stats() as outer:
+            with collect_stats() as inner:
+                pass
+            record_event(CacheEvent(process='cache@v1', key='a', kind='hit'))
+
+        assert len(outer.events) == 1
+        assert len(inner.events) == 0
+
+
+class TestCacheEvents:
+    def test_dataframe_file_cache(self, tmp_path: Path):
+        path = tmp_path / 'cache.h5'
+        df = pd.DataFrame(dict(A=np.arange(10.0)))
+        key = str(path.resolve())
+
+        def workflow(rebuild: bool = False):
+            return ProcessNode(
+                ProcessNode(None, DelegatedSource(delegate=lambda: df), {}),
+                DataFrameFileCache(),
+                {
+                    'filename': PlainProcessParam(str(path)),
+                    'rebuild': PlainProcessParam(rebuild),
+                },
+            )
+
+        with collect_stats() as stats:
+            workflow().run()
+            workflow().run()
+            workflow(rebuild=True).run()
+
+        summary = stats.summary()[key]
+        assert summary['process'] == 'dataframe.cache@v1'
+        assert summary['hits'] == 1
+        assert summary['misses'] == 2
+        assert summary['reasons'] == {'missing': 1, 'rebuild': 1}
+        assert summary['bytes_written'] == 2 * path.stat().st_size
+        # the data loaded (column & index), the file also holds the metadata
+        assert summary['bytes_read'] == 2 * 8 * 10
+        assert summary['build_time'] >= summary['write_time'] > 0
+
+        # process-wide statistics
+        assert get_cache_stats().summary()[key]['hits'] >= 1
+
+    def test_selective_and_memory_reads(self, tmp_path: Path):
+        path = tmp_path / 'cache.h5'
+        df = pd.DataFrame(dict(A=np.arange(1000.0), B=np.arange(1000.0)))
+        DataFrameFileCache().write(df, path)
+
+        def workflow():
+            node = ProcessNode(
+                None,
+                DataFrameFileCache(),
+                {'filename': PlainProcessParam(str(path))},
+            )
+            node.hints = dict(columns=['A'])
+            return node
+
+        configure_memory_cache(2**24)
+        try:
+            with collect_stats() as stats:
+                workflow().run()
+                workflow().run()
+        finally:
+            configure_memory_cache(0)
+
+        events = stats.events
+        # the selected column & index
+        assert events[0].bytes_read == 2 * 8 * 1000
+        assert not events[0].memory_hit
+        assert events[1].bytes_read == 0
+        assert events[1].memory_hit
+        assert stats.totals()['memory_hits'] == 1
+
+    def test_workflow_stats(self, tmp_path: Path, data_path: Path):
+        descriptor = [
+            {
+                'run': 'channel.tclogger@v1',
+                'params': {
+                    'source': data_path / 'ChannelV2TCLog/2024-01-16T11-26-54.csv'
+                },
+            },
+            {
+                'run': 'dataframe.cache@v1',
+                'params': {'filename': str(tmp_path / 'cache.h5')},
+            },
+        ]
+        workflow = Workflow.create(descriptor)
+
+        workflow.run()
+        assert workflow.stats.totals()['misses'] == 1
+
+        workflow.run()
+        assert workflow.stats.totals()['misses'] == 0
+        assert workflow.stats.totals()['hits'] == 1
+
+    def test_file_cache(self, tmp_path: Path):
+        path = tmp_path / 'cache.csv'
+        df = pd.DataFrame(dict(A=np.arange(10.0)))
+
+        with collect_stats() as stats:
+            FileCache().run(df, path)
+            FileCache().run(df, path)
+
+        events = stats.events
+        assert [event.kind for event in events] == ['miss', 'hit']
+        assert events[0].reason == 'missing'
+        assert events[0].bytes_written == path.stat().st_size
+        assert events[1].bytes_read == path.stat().st_size
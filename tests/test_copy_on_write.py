@@ -0,0 +1,101 @@
+from typing import Any, ClassVar
+
+import numpy as np
+import pandas as pd
+
+from rdmlibpy.base import (
+    PlainProcessParam,
+    ProcessBase,
+    ProcessNode,
+    RunnableProcessParam,
+)
+from rdmlibpy.copy_on_write import copy_on_write_enabled, copy_on_write_mode
+from rdmlibpy.dataframes import DataFrameAttributes, DataFrameFillNA, SelectColumns
+from rdmlibpy.process import Transform
+from rdmlibpy.workflow import Workflow
+
+
+class SharedSource(ProcessBase):
+    # returns the same (e.g. cached) data frame on each run
+    name: str = 'shared_source'
+    version: str = '1'
+
+    def run(self, **kwargs) -> Any:
+        return SHARED
+
+
+SHARED = pd.DataFrame(dict(A=[1.0, np.nan, 3.0], B=[4.0, 5.0, 6.0]))
+
+
+class FillFrom(Transform):
+    # fills missing values of the source and marks the rows used of the other
+    # data frame (passed as parameter) in place
+    name: str = 'fill_from'
+    version: str = '1'
+    mutates_source: ClassVar[bool] = True
+
+    def run(self, source: pd.DataFrame, other: pd.DataFrame):
+        mask = source['A'].isna()
+        source.loc[mask, 'A'] = other.loc[mask, 'B']
+        other['used'] = mask
+        return source
+
+
+def create_workflow(copy_on_write: bool):
+    node = ProcessNode(None, SharedSource(), {})
+    node = ProcessNode(node, DataFrameFillNA(), {'include': PlainProcessParam(['A'])})
+    node = ProcessNode(node, DataFrameAttributes(), {'step': PlainProcessParam(1)})
+    return Workflow(node, copy_on_write=copy_on_write)
+
+
+class TestCopyOnWrite:
+    def test_mode(self):
+        assert not copy_on_write_enabled()
+
+        with copy_on_write_mode():
+            assert copy_on_write_enabled()
+            assert pd.options.mode.copy_on_write
+
+        assert not copy_on_write_enabled()
+        assert not pd.options.mode.copy_on_write
+
+    def test_source_is_not_modified(self):
+        df = create_workflow(copy_on_write=True).run()
+
+        assert list(df['A']) == [1.0, 1.0, 3.0]
+        assert df.attrs == dict(step=1)
+        assert SHARED['A'].isna().any()
+        assert SHARED.attrs == {}
+        # unmodified columns are shared
+        assert np.shares_memory(df['B'].to_numpy(), SHARED['B'].to_numpy())
+
+    def test_default_mode_modifies_source(self):
+        source = SHARED.copy()
+        node = ProcessNode(None, SharedSource(), {})
+        node = ProcessNode(node, DataFrameAttributes(), {'step': PlainProcessParam(1)})
+
+        df = Workflow(node).run()
+
+        assert df is SHARED
+        assert SHARED.attrs == dict(step=1)
+        SHARED.attrs.clear()
+        pd.testing.assert_frame_equal(SHARED, source)
+
+    def test_selected_columns_are_views(self):
+        with copy_on_write_mode():
+            df = SelectColumns().run(SHARED, dict(B='b'))
+            assert np.shares_memory(df['b'].to_numpy(), SHARED['B'].to_numpy())
+
+            df.loc[0, 'b'] = 0.0
+            assert SHARED.loc[0, 'B'] == 4.0
+
+    def test_frame_params_are_not_modified(self):
+        other = ProcessNode(None, SharedSource(), {})
+        node = ProcessNode(None, SharedSource(), {})
+        node = ProcessNode(node, FillFrom(), {'other': RunnableProcessParam(other)})
+
+        df = Workflow(node, copy_on_write=True).run()
+
+        assert list(df['A']) == [1.0, 5.0, 3.0]
+        assert list(SHARED.columns) == ['A', 'B']
+        assert SHARED['A'].isna().any()
@@ -0,0 +1,156 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pandas._testing as tm
+import pytest
+
+from rdmlibpy.dataframes import DataFrameFileCache
+from rdmlibpy.memory_cache import (
+    MemoryCache,
+    configure_memory_cache,
+    get_memory_cache,
+    sizeof,
+)
+from rdmlibpy.serializers import FileCache
+
+
+@pytest.fixture
+def memory_cache():
+    configure_memory_cache(2**24)
+    yield get_memory_cache()
+    configure_memory_cache(0)
+
+
+def create_file(path: Path, content: str = 'data'):
+    path.write_text(content)
+    return path
+
+
+class TestMemoryCache:
+    def test_disabled_by_default(self, tmp_path: Path):
+        cache = MemoryCache()
+        path = create_file(tmp_path / 'a.txt')
+
+        assert not cache.enabled
+        assert cache.load(path, lambda: np.arange(3)) is not None
+        assert len(cache) == 0
+
+    def test_load_from_memory(self, tmp_path: Path):
+        cache = MemoryCache(max_bytes=1000)
+        path = create_file(tmp_path / 'a.txt')
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return np.arange(10)
+
+        first = cache.load(path, loader)
+        second = cache.load(path, loader)
+
+        assert len(calls) == 1
+        np.testing.assert_array_equal(first, second)
+        assert cache.info()['hits'] == 1
+        assert cache.info()['misses'] == 1
+
+    def test_config_is_part_of_key(self, tmp_path: Path):
+        cache = MemoryCache(max_bytes=1000)
+        path = create_file(tmp_path / 'a.txt')
+
+        cache.load(path, lambda: np.arange(10), config='a')
+        value = cache.load(path, lambda: np.arange(5), config='b')
+
+        assert len(value) == 5
+        assert len(cache) == 2
+
+    def test_modified_file_is_reloaded(self, tmp_path: Path):
+        cache = MemoryCache(max_bytes=1000)
+        path = create_file(tmp_path / 'a.txt')
+
+        cache.load(path, lambda: np.arange(10))
+        create_file(path, 'modified data')
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        value = cache.load(path, lambda: np.arange(5))
+
+        assert len(value) == 5
+
+    def test_lru_eviction(self, tmp_path: Path):
+        value = np.arange(100, dtype='float64')
+        cache = MemoryCache(max_bytes=2 * sizeof(value))
+        paths = [create_file(tmp_path / f'{name}.txt') for name in 'abc']
+
+        cache.load(paths[0], lambda: value)
+        cache.load(paths[1], lambda: value)
+        cache.load(paths[0], lambda: value)  # a is most recently used
+        cache.load(paths[2], lambda: value)  # evicts b
+
+        assert len(cache) == 2
+        assert cache.nbytes <= cache.max_bytes
+        keys = [key[0] for key in cache._entries]
+        assert keys == [str(paths[0].resolve()), str(paths[2].resolve())]
+
+    def test_values_exceeding_budget_are_not_stored(self, tmp_path: Path):
+        cache = MemoryCache(max_bytes=100)
+        path = create_file(tmp_path / 'a.txt')
+
+        cache.load(path, lambda: np.arange(1000))
+
+        assert len(cache) == 0
+
+    def test_cached_values_are_protected(self, tmp_path: Path):
+        cache = MemoryCache(max_bytes=10_000)
+        path = create_file(tmp_path / 'a.txt')
+        df = pd.DataFrame(dict(A=np.arange(10.0)))
+
+        first = cache.load(path, lambda: df)
+        first.loc[0, 'A'] = 100.0
+        first['B'] = 1
+        second = cache.load(path, lambda: df)
+
+        assert second.loc[0, 'A'] == 0.0
+        assert list(second.columns) == ['A']
+
+    def test_invalidate(self, tmp_path: Path):
+        cache = MemoryCache(max_bytes=1000)
+        path = create_file(tmp_path / 'a.txt')
+
+        cache.load(path, lambda: np.arange(10), config='a')
+        cache.load(path, lambda: np.arange(10), config='b')
+        cache.invalidate(path)
+
+        assert len(cache) == 0
+        assert cache.nbytes == 0
+
+
+class TestFileCacheIntegration:
+    def test_dataframe_file_cache(self, tmp_path: Path, memory_cache):
+        path = tmp_path / 'cache.h5'
+        df = pd.DataFrame(dict(A=np.arange(10.0), B=np.arange(10)))
+        cache = DataFrameFileCache()
+        cache.write(df, path)
+
+        first = cache.read(path)
+        second = cache.read(path)
+        selected = cache.read(path, columns=['A'])
+
+        tm.assert_frame_equal(df, first)
+        tm.assert_frame_equal(df, second)
+        tm.assert_frame_equal(df[['A']], selected)
+        assert memory_cache.info()['hits'] == 1
+
+        # writing the cache file invalidates entries
+        cache.write(df.iloc[:5], path)
+        tm.assert_frame_equal(df.iloc[:5], cache.read(path))
+
+    def test_file_cache(self, tmp_path: Path, memory_cache):
+        path = tmp_path / 'cache.csv'
+        df = pd.DataFrame(dict(A=np.arange(10.0), B=np.arange(10)))
+        cache = FileCache()
+
+        cache.run(df, path)
+        cache.run(df, path)
+
+        assert memory_cache.info()['misses'] == 1
+        assert memory_cache.info()['hits'] == 1
@@ -1,7 +1,13 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, ClassVar
 
-from rdmlibpy.base import ProcessBase, ProcessNode
+import pytest
+
+from rdmlibpy._filelock import FileLock
+from rdmlibpy.base import PlainProcessParam, ProcessBase, ProcessNode
 from rdmlibpy.process import Cache, Loader, Writer, DelegatedSource
 
 
@@ -91,6 +97,30 @@ class TestWriter:
         assert result == filepath
         assert filepath.parent.exists()
 
+    def test_atomic_write(self, tmp_path: Path):
+        filepath = tmp_path / 'dummy/ascii.csv'
+
+        with Writer.atomic(filepath) as tmp:
+            assert tmp.parent == filepath.parent
+            assert tmp.suffix == '.csv'
+            tmp.write_text('data')
+            assert not filepath.exists()
+
+        assert filepath.read_text() == 'data'
+        assert list(filepath.parent.iterdir()) == [filepath]
+
+    def test_atomic_write_with_error(self, tmp_path: Path):
+        filepath = tmp_path / 'ascii.csv'
+        filepath.write_text('original')
+
+        with pytest.raises(RuntimeError):
+            with Writer.atomic(filepath) as tmp:
+                tmp.write_text('partial')
+                raise RuntimeError()
+
+        assert filepath.read_text() == 'original'
+        assert list(tmp_path.iterdir()) == [filepath]
+
 
 class TestCache:
     def test_logic_cache_is_valid(self):
@@ -181,3 +211,68 @@ class TestCache:
         assert workflow.run() == 3
         assert MySource.counter == 3
         assert MyCache.cached == 3
+
+    def test_concurrent_builds(self, tmp_path: Path):
+        filename = tmp_path / 'cache.txt'
+        builds = []
+
+        class SlowSource(ProcessBase):
+            name: str = 'slow_source'
+            version: str = '1'
+
+            def run(self, **kwargs) -> Any:
+                builds.append(threading.get_ident())
+                time.sleep(0.2)
+                return 'result'
+
+        class MyCache(Cache):
+            name: str = 'my_cache'
+            version: str = '1'
+
+            def cache_files(self, filename: Path, rebuild: bool = False):
+                return [filename]
+
+            def cache_is_valid(self, filename: Path, rebuild: bool = False):
+                return (not rebuild) and filename.exists()
+
+            def write(self, source: str, filename: Path, rebuild: bool = False):
+                with self.atomic(filename) as tmp:
+                    tmp.write_text(source)
+
+            def read(self, filename: Path, rebuild: bool = False):
+                return filename.read_text()
+
+        def run(rebuild: bool):
+            workflow = ProcessNode(
+                ProcessNode(None, SlowSource(), {}),
+                MyCache(),
+                {
+                    'filename': PlainProcessParam(filename),
+                    'rebuild': PlainProcessParam(rebuild),
+                },
+            )
+            return workflow.run()
+
+        for rebuild in [False, True]:
+            builds.clear()
+            with ThreadPoolExecutor(4) as executor:
+                results = list(executor.map(run, [rebuild] * 4))
+
+            # the cache is built once, all workers return the result
+            assert len(builds) == 1
+            assert results == ['result'] * 4
+
+
+class TestFileLock:
+    def test_lock_is_exclusive(self, tmp_path: Path):
+        path = tmp_path / '.file.lock'
+
+        with FileLock(path) as lock:
+            assert lock.locked
+            with pytest.raises(TimeoutError):
+                FileLock(path, timeout=0.05).acquire()
+
+        # released
+        with FileLock(path, timeout=0.05) as lock:
+            assert lock.locked
+        assert not lock.locked
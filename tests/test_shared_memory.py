@@ -0,0 +1,128 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pandas._testing as tm
+
+from rdmlibpy import Workflow
+from rdmlibpy.base import ProcessNode
+from rdmlibpy.dataframes.shared_memory import (
+    _shareable,
+    attach_frame,
+    attach_result,
+    run_workflow,
+    share_frame,
+)
+from rdmlibpy.process import DelegatedSource
+from rdmlibpy.shared_memory import (
+    SharedMemoryArena,
+    attach_segment,
+    get_arena,
+    shared_memory_arena,
+    shared_memory_workers,
+)
+
+
+def allocate_segment(nbytes: int) -> str:
+    # allocates a segment in a worker process (without releasing it)
+    return str(get_arena().allocate(nbytes).filename)
+
+
+class TestSharedMemoryArena:
+    def test_allocate_and_attach(self, tmp_path: Path):
+        with SharedMemoryArena(tmp_path) as arena:
+            segment = arena.allocate(16)
+            segment.view(np.float64)[:] = [1.0, 2.0]
+            segment.flush()
+
+            mapped = attach_segment(segment.filename)
+            mapped.view(np.float64)[0] = 100.0  # private copy
+
+            assert list(segment.view(np.float64)) == [1.0, 2.0]
+            assert arena.segments == {Path(segment.filename)}
+
+        assert not Path(segment.filename).exists()
+        # mappings stay valid after the segment is released
+        assert list(mapped.view(np.float64)) == [100.0, 2.0]
+
+    def test_release(self, tmp_path: Path):
+        arena = SharedMemoryArena(tmp_path)
+        segment = arena.allocate(8)
+
+        arena.release(segment.filename)
+
+        assert not Path(segment.filename).exists()
+        assert arena.segments == set()
+
+    def test_context_arena(self, tmp_path: Path):
+        process_arena = get_arena()
+        with shared_memory_arena(tmp_path) as arena:
+            assert get_arena() is arena
+            segment = arena.allocate(8)
+
+        assert get_arena() is process_arena
+        assert not Path(segment.filename).exists()
+
+    def test_workflow_run_returns_segments(self, tmp_path: Path):
+        df = pd.DataFrame(dict(A=np.arange(10.0)))
+        source = DelegatedSource(delegate=lambda: share_frame(df))
+
+        # segments returned by a workflow (e.g. run by a worker process) can
+        # be attached by the receiving process
+        descriptor = Workflow(ProcessNode(None, source, {})).run()
+
+        tm.assert_frame_equal(attach_frame(descriptor), df)
+        assert not Path(descriptor.filename).exists()
+
+    def test_workflow_run_releases_other_segments(self, tmp_path: Path):
+        segments = []
+
+        def create():
+            segments.append(get_arena().allocate(8).filename)
+            return 1
+
+        source = DelegatedSource(delegate=create)
+        assert Workflow(ProcessNode(None, source, {})).run() == 1
+
+        assert not Path(segments[0]).exists()
+
+    def test_workers_release_segments(self):
+        with shared_memory_workers() as arena:
+            with ProcessPoolExecutor(1) as executor:
+                filename = executor.submit(allocate_segment, 8).result()
+            assert Path(filename).parent == arena.directory
+            assert Path(filename).exists()
+
+        # workers don't run exit handlers, the segments are removed by the
+        # process which started the workers
+        assert not Path(filename).exists()
+        assert not arena.directory.exists()
+
+    def test_run_workflow_in_worker(self, tmp_path: Path):
+        df = pd.DataFrame(dict(A=np.arange(10.0), B=list('abcdefghij')))
+        df.to_csv(tmp_path / 'data.csv', index=False)
+        process = {
+            'run': 'dataframe.read.csv@v1',
+            'params': {'source': str(tmp_path / 'data.csv')},
+        }
+
+        with shared_memory_workers() as arena:
+            with ProcessPoolExecutor(1) as executor:
+                result = executor.submit(run_workflow, process).result()
+            actual = attach_result(result)
+            assert list(arena.directory.iterdir()) == []
+
+        tm.assert_frame_equal(actual, df)
+
+
+def test_shareable_without_copy():
+    data = np.arange(3.0)
+    array, unit = _shareable(pd.arrays.NumpyExtensionArray(data))
+
+    assert unit is None
+    assert np.shares_memory(array, data)
+
+    dates = pd.Series(pd.date_range('2024-01-01', periods=3)).array
+    array, _ = _shareable(dates)
+    assert array.dtype.kind == 'M'
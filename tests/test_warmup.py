@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from rdmlibpy.warmup import collect_caches, main, warmup
+
+
+@pytest.fixture
+def metadata_file(tmp_path: Path, data_path: Path):
+    source = (data_path / 'ChannelV2TCLog/2024-01-16T11-26-54.csv').as_posix()
+    cache = (tmp_path / 'cache').as_posix()
+    filename = tmp_path / 'metadata.yaml'
+    filename.write_text(
+        f"""
+        source: {source}
+        experiments:
+          - name: first
+            workflow:
+              - run: channel.tclogger@v1
+                params:
+                  source: ${{source}}
+              - run: dataframe.cache@v1
+                params:
+                  filename: {cache}/first.h5
+          - name: second
+            run: 3
+            workflow:
+              - run: channel.tclogger@v1
+                params:
+                  source: ${{source}}
+              - run: dataframe.cache@v1
+                params:
+                  filename: {cache}/first.h5
+              - run: dataframe.select.columns@v1
+                params:
+                  select: [timestamp]
+              - run: dataframe.cache@v1
+                params:
+                  filename: {cache}/second.h5
+        """
+    )
+    return filename
+
+
+def test_collect_caches(tmp_path: Path, metadata_file: Path):
+    tasks = collect_caches(metadata_file)
+
+    # caches are deduplicated by filename
+    assert [task.filename for task in tasks] == [
+        (tmp_path / 'cache/first.h5').resolve(),
+        (tmp_path / 'cache/second.h5').resolve(),
+    ]
+    assert [task.path for task in tasks] == [
+        ('experiments', 0, 'workflow'),
+        ('experiments', 1, 'workflow'),
+    ]
+    assert [task.index for task in tasks] == [0, 1]
+    assert not any(task.valid for task in tasks)
+
+
+def test_warmup(tmp_path: Path, metadata_file: Path):
+    reported = []
+    results = warmup(
+        metadata_file,
+        workers=2,
+        threads=True,
+        progress=lambda result, done, total: reported.append((done, total)),
+    )
+
+    assert sorted(result.status for result in results) == ['built', 'built']
+    assert reported == [(1, 2), (2, 2)]
+    assert list(
+        pd.read_hdf(tmp_path / 'cache/second.h5').columns.get_level_values(0)
+    ) == ['timestamp']
+
+    # 2nd run: all caches are valid
+    results = warmup(metadata_file, threads=True)
+    assert [result.status for result in results] == ['valid', 'valid']
+
+
+def test_warmup_reports_failures(tmp_path: Path, data_path: Path):
+    filename = tmp_path / 'metadata.yaml'
+    filename.write_text(
+        f"""
+        workflow:
+          - run: channel.tclogger@v1
+            params:
+              source: {(tmp_path / 'missing.csv').as_posix()}
+          - run: dataframe.cache@v1
+            params:
+              filename: {(tmp_path / 'cache.h5').as_posix()}
+        """
+    )
+
+    assert main([str(filename), '--threads']) == 1
+
+
+def test_main_dry_run(metadata_file: Path, capsys):
+    assert main([str(metadata_file), '--dry-run']) == 0
+
+    output = capsys.readouterr().out.splitlines()
+    assert len(output) == 2
+    assert all(line.startswith('build') for line in output)
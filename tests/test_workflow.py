@@ -214,3 +214,58 @@ class TestWorkflow:
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 16
         assert len(df.columns) == 7
+
+    def test_workflow_with_named_process_params(self, data_path):
+        tclogger = {
+            'run': 'channel.tclogger@v1',
+            'params': {
+                'source': str(data_path / 'ChannelV2TCLog/2024-01-16T10-05-21.csv'),
+            },
+        }
+        descriptor = {
+            'run': 'dataframe.join.many@v1',
+            'params': {
+                'index': 'upstream',
+                '$frames': {
+                    'upstream': [
+                        tclogger,
+                        {
+                            'run': 'dataframe.select.columns@v1',
+                            'params': {
+                                'select': {
+                                    'timestamp': 'timestamp',
+                                    'sample-downstream': 'T1',
+                                }
+                            },
+                        },
+                        {
+                            'run': 'dataframe.setindex@v1',
+                            'params': {'index_var': 'timestamp'},
+                        },
+                    ],
+                    'downstream': [
+                        tclogger,
+                        {
+                            'run': 'dataframe.select.columns@v1',
+                            'params': {
+                                'select': {
+                                    'timestamp': 'timestamp',
+                                    'sample-downstream': 'T2',
+                                }
+                            },
+                        },
+                        {
+                            'run': 'dataframe.setindex@v1',
+                            'params': {'index_var': 'timestamp'},
+                        },
+                    ],
+                },
+            },
+        }
+
+        workflow = Workflow.create(descriptor)
+        df = workflow.run()
+
+        assert isinstance(df, pd.DataFrame)
+        assert list(df.columns) == ['T1', 'T2']
+        assert df.index.name == 'timestamp'